@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Render benchmark suite.
+Renders every scene in SCENES at each quality tier, records timing and
+resource usage, appends the results to a history file and compares them
+against a stored baseline.
+
+    python benchmark.py --qualities l,h            # run and compare
+    python benchmark.py --qualities l,h --save-baseline
+    python benchmark.py --qualities l --renderers cairo,opengl   # Cairo vs OpenGL
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from film_assembly import ffmpeg_exe, ffprobe_exe, probe_video
+from main import SCENES, scene_video_path
+from renderers import DEFAULT_RENDERER, RENDERERS, renderer_command, renderer_env, renderer_flags
+
+BENCHMARK_DIR = Path("benchmarks")
+HISTORY_FILE = BENCHMARK_DIR / "history.jsonl"
+BASELINE_FILE = BENCHMARK_DIR / "baseline.json"
+MEDIA_ROOT = Path("media/benchmark")
+
+# Manim quality flag -> output directory name
+QUALITY_DIRS = {
+    "l": "480p15",
+    "m": "720p30",
+    "h": "1080p60",
+    "k": "2160p60",
+}
+
+# Settings the film compile step encodes with; used to time the encode
+ENCODE_ARGS = ["-c:v", "libx264", "-preset", "medium", "-b:v", "8000k"]
+
+
+def run_timed(cmd, env=None):
+    """Run cmd, returning (returncode, wall seconds, peak RSS in MB, stderr)."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=env)
+    stderr = proc.stderr.read()
+    _, status, usage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is in kilobytes on Linux
+    return proc.returncode, elapsed, usage.ru_maxrss / 1024, stderr
+
+
+def count_frames(video_path):
+    info = probe_video(video_path)
+    if info.get("nb_frames", "N/A") != "N/A":
+        return int(info["nb_frames"])
+    num, den = (int(x) for x in info["r_frame_rate"].split("/"))
+    return round(float(info["duration"]) * num / den)
+
+
+def time_encode(video_path):
+    """Seconds to re-encode video_path with the film's encoder settings."""
+    cmd = [ffmpeg_exe(), "-v", "error", "-i", str(video_path), *ENCODE_ARGS, "-f", "null", "-"]
+    start = time.perf_counter()
+    subprocess.run(cmd, check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+def result_key(result):
+    """Baseline key; Cairo keeps the plain scene:quality form."""
+    key = f"{result['scene']}:{result['quality']}"
+    renderer = result.get("renderer", DEFAULT_RENDERER)
+    return key if renderer == DEFAULT_RENDERER else f"{key}:{renderer}"
+
+
+def benchmark_scene(scene_file, scene_class, quality, renderer=DEFAULT_RENDERER):
+    """Render one scene at one quality from a cold media dir and measure it."""
+    media_dir = MEDIA_ROOT / renderer / quality / scene_class
+    shutil.rmtree(media_dir, ignore_errors=True)
+    cmd = [
+        "manim", f"-q{quality}", "--disable_caching", *renderer_flags(renderer),
+        "--media_dir", str(media_dir),
+        scene_file, scene_class,
+    ]
+    returncode, wall, peak_rss, stderr = run_timed(renderer_command(cmd, renderer), renderer_env(renderer))
+    if returncode != 0:
+        return {"scene": scene_class, "quality": quality, "renderer": renderer, "error": stderr[-2000:]}
+
+    video_path = scene_video_path(scene_file, scene_class, media_dir, QUALITY_DIRS[quality])
+    result = {
+        "scene": scene_class,
+        "quality": quality,
+        "renderer": renderer,
+        "wall_s": round(wall, 3),
+        "peak_rss_mb": round(peak_rss, 1),
+        "output_bytes": video_path.stat().st_size,
+    }
+    if ffprobe_exe():
+        frames = count_frames(video_path)
+        result["frames"] = frames
+        result["render_fps"] = round(frames / wall, 2)
+    if ffmpeg_exe():
+        result["encode_s"] = round(time_encode(video_path), 3)
+    return result
+
+
+def compare(results, baseline, threshold):
+    """Print a comparison table; return the results that regressed."""
+    regressions = []
+    print(f"\n{'Scene':<22}{'Q':<3}{'Renderer':<9}{'Wall (s)':>10}{'Base (s)':>10}{'Change':>9}")
+    for result in results:
+        row = f"{result['scene']:<22}{result['quality']:<3}{result.get('renderer', DEFAULT_RENDERER):<9}"
+        if "error" in result:
+            print(f"{row}{'FAILED':>10}")
+            regressions.append(result)
+            continue
+        base = baseline.get(result_key(result))
+        if base is None:
+            print(f"{row}{result['wall_s']:>10.2f}{'-':>10}{'new':>9}")
+            continue
+        change = result["wall_s"] / base["wall_s"] - 1
+        flag = " ❌" if change > threshold else ""
+        print(f"{row}{result['wall_s']:>10.2f}{base['wall_s']:>10.2f}{change:>+8.1%}{flag}")
+        if change > threshold:
+            regressions.append(result)
+    return regressions
+
+
+def compare_renderers(results):
+    """Print Cairo vs OpenGL wall times for every scene/quality run under both."""
+    walls = {}
+    for result in results:
+        if "error" not in result:
+            walls.setdefault((result["scene"], result["quality"]), {})[result["renderer"]] = result["wall_s"]
+    rows = [(key, times) for key, times in walls.items() if len(times) == len(RENDERERS)]
+    if not rows:
+        return
+    print(f"\n{'Scene':<22}{'Q':<3}{'Cairo (s)':>11}{'OpenGL (s)':>12}{'Speedup':>9}")
+    for (scene, quality), times in rows:
+        print(f"{scene:<22}{quality:<3}{times['cairo']:>11.2f}{times['opengl']:>12.2f}"
+              f"{times['cairo'] / times['opengl']:>8.2f}x")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scene renders.")
+    parser.add_argument("--qualities", default="l,m,h,k",
+                        help="Comma-separated quality tiers to run (default: l,m,h,k).")
+    parser.add_argument("--scenes", default=None,
+                        help="Comma-separated scene classes to run (default: all in SCENES).")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Fail when wall time exceeds the baseline by this fraction (default: 0.10).")
+    parser.add_argument("--renderers", default=DEFAULT_RENDERER,
+                        help="Comma-separated renderers to run, e.g. cairo,opengl (default: cairo).")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store this run as the new baseline instead of comparing.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    qualities = [q for q in args.qualities.split(",") if q]
+    unknown = [q for q in qualities if q not in QUALITY_DIRS]
+    if unknown:
+        print(f"❌ Unknown quality tier(s): {', '.join(unknown)}")
+        sys.exit(2)
+    renderers = [r for r in args.renderers.split(",") if r]
+    unknown = [r for r in renderers if r not in RENDERERS]
+    if unknown:
+        print(f"❌ Unknown renderer(s): {', '.join(unknown)}")
+        sys.exit(2)
+    selected = set(args.scenes.split(",")) if args.scenes else None
+
+    results = []
+    for quality in qualities:
+        for scene_file, scene_class in SCENES:
+            if selected and scene_class not in selected:
+                continue
+            for renderer in renderers:
+                print(f"⏱️  {scene_class} @ -q{quality} ({renderer})")
+                result = benchmark_scene(scene_file, scene_class, quality, renderer)
+                if "error" in result:
+                    print("❌ Render failed")
+                else:
+                    print(f"   {result['wall_s']:.2f}s, {result.get('render_fps', '?')} fps, "
+                          f"{result['peak_rss_mb']:.0f} MB peak RSS")
+                results.append(result)
+    compare_renderers(results)
+
+    BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    with HISTORY_FILE.open("a") as history:
+        history.write(json.dumps(record) + "\n")
+
+    if args.save_baseline:
+        baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+        for result in results:
+            if "error" not in result:
+                baseline[result_key(result)] = result
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2))
+        print(f"\n📌 Baseline saved: {BASELINE_FILE}")
+        return
+
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        sys.exit(1)
+    print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Chunked parallel re-encode of the film with FFmpeg.
+
+The timeline is split at scene boundaries, and long scenes are split
+further at their own keyframes, into chunks of similar length. Every chunk
+is encoded by its own FFmpeg process with identical settings: same
+resolution, frame rate, GOP and constrained (VBV) bitrate. Rate control
+therefore behaves the same on both sides of each chunk boundary. The
+encoded chunks are joined with a stream copy, so nothing is encoded twice.
+"""
+import math
+import os
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from film_assembly import concat_copy, ffmpeg_exe, ffprobe_exe, probe_video
+
+ENCODE_PRESET = "medium"
+
+
+@dataclass(frozen=True)
+class Chunk:
+    source: Path
+    start: float  # seconds; always a keyframe of source
+    duration: float
+
+
+def keyframe_times(video_path):
+    """Presentation times (seconds) of the keyframes in video_path, read from packets."""
+    cmd = [
+        ffprobe_exe(), "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "csv=p=0",
+        str(video_path),
+    ]
+    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    times = []
+    for line in result.stdout.splitlines():
+        pts, _, flags = line.partition(",")
+        if "K" in flags and pts not in ("", "N/A"):
+            times.append(float(pts))
+    return sorted(times)
+
+
+def video_duration(info):
+    if info.get("duration", "N/A") != "N/A":
+        return float(info["duration"])
+    num, den = (int(x) for x in info["r_frame_rate"].split("/"))
+    return int(info["nb_frames"]) * den / num
+
+
+def plan_chunks(video_paths, jobs):
+    """Split the film into about `jobs` chunks of similar duration.
+
+    Chunks never span two scenes. A scene longer than the target length is
+    cut at the keyframes closest to each multiple of the target.
+    """
+    durations = [video_duration(probe_video(path)) for path in video_paths]
+    target = sum(durations) / max(jobs, 1)
+    chunks = []
+    for path, duration in zip(video_paths, durations):
+        cuts = [0.0]
+        keyframes = keyframe_times(path) if duration > target * 1.5 else []
+        if keyframes:
+            for k in range(1, math.ceil(duration / target)):
+                nearest = min(keyframes, key=lambda t: abs(t - k * target))
+                if cuts[-1] < nearest < duration:
+                    cuts.append(nearest)
+        ends = cuts[1:] + [duration]
+        chunks += [Chunk(Path(path), start, end - start) for start, end in zip(cuts, ends)]
+    return chunks
+
+
+def encode_args(width, height, fps, bitrate, threads=None):
+    """libx264 settings shared by every chunk (and the single-process reference)."""
+    rate = int(bitrate.rstrip("kK"))
+    args = [
+        "-an",
+        "-vf", f"scale={width}:{height},fps={fps}",
+        "-c:v", "libx264", "-preset", ENCODE_PRESET,
+        # Constrained bitrate: every chunk's rate control follows the same VBV model
+        "-b:v", f"{rate}k", "-maxrate", f"{rate}k", "-bufsize", f"{2 * rate}k",
+        "-g", str(2 * fps), "-pix_fmt", "yuv420p",
+        "-video_track_timescale", str(fps * 1000),
+    ]
+    if threads:
+        args += ["-threads", str(threads)]
+    return args
+
+
+def encode_chunk(chunk, output_path, fps, settings):
+    """Encode one chunk; returns its wall time in seconds."""
+    # Half a frame early so rounding in pts_time never drops the keyframe
+    start = max(chunk.start - 0.5 / fps, 0.0)
+    cmd = [
+        ffmpeg_exe(), "-y", "-v", "error",
+        "-ss", f"{start:.6f}", "-i", str(chunk.source),
+        "-frames:v", str(round(chunk.duration * fps)),
+        *settings,
+        str(output_path),
+    ]
+    began = time.perf_counter()
+    subprocess.run(cmd, check=True, capture_output=True, text=True)
+    return time.perf_counter() - began
+
+
+def encode_single(video_paths, width, height, fps, bitrate, output_path=None):
+    """Reference: the whole film through one FFmpeg encoder; returns wall seconds.
+
+    Without output_path the result is discarded (null muxer); only the time counts.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for path in video_paths:
+            escaped = str(Path(path).resolve()).replace("'", r"'\''")
+            listing.write(f"file '{escaped}'\n")
+        list_file = listing.name
+    cmd = [
+        ffmpeg_exe(), "-y", "-v", "error",
+        "-f", "concat", "-safe", "0", "-i", list_file,
+        *encode_args(width, height, fps, bitrate),
+        *(["-f", "null", "-"] if output_path is None else [str(output_path)]),
+    ]
+    began = time.perf_counter()
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, text=True)
+    finally:
+        Path(list_file).unlink(missing_ok=True)
+    return time.perf_counter() - began
+
+
+def encode_chunked(video_paths, output_path, width, height, fps, bitrate, jobs=None,
+                   work_dir=None, measure_single=False):
+    """Re-encode video_paths into output_path as parallel chunks.
+
+    Returns a stats dict: chunks, jobs, wall_s and chunk_sum_s. chunk_sum_s
+    adds up the chunk encodes, each limited to its share of the cores, so it
+    is only an estimate of serial cost. With measure_single, single_s is a
+    real one-process encode to a null sink and speedup is single_s / wall_s;
+    without it there is no speedup.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    chunks = plan_chunks(video_paths, jobs)
+    # Split the cores between the concurrent encoders
+    threads = max(1, (os.cpu_count() or 1) // min(jobs, len(chunks)))
+    settings = encode_args(width, height, fps, bitrate, threads)
+
+    work_dir = Path(work_dir or Path(output_path).parent / "chunks")
+    work_dir.mkdir(parents=True, exist_ok=True)
+    parts = [work_dir / f"chunk_{i:04d}.mp4" for i in range(len(chunks))]
+
+    began = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        times = list(pool.map(lambda job: encode_chunk(job[0], job[1], fps, settings), zip(chunks, parts)))
+    concat_copy(parts, output_path)
+    wall = time.perf_counter() - began
+    for part in parts:
+        part.unlink(missing_ok=True)
+
+    stats = {"chunks": len(chunks), "jobs": jobs, "wall_s": wall, "chunk_sum_s": sum(times)}
+    if measure_single:
+        stats["single_s"] = encode_single(video_paths, width, height, fps, bitrate)
+        stats["speedup"] = stats["single_s"] / wall if wall else 0.0
+    return stats
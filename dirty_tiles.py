@@ -0,0 +1,277 @@
+"""
+Dirty-region tiled compositing for the Cairo camera.
+
+Between two frames, usually only a few mobjects change: HUD readouts, the
+rocket, the trace. With the compositor installed, each frame is compared
+with the one already in the camera's pixel array, mobject by mobject
+(points and style). The pixel bounding boxes of everything that changed,
+appeared or disappeared are marked on a tile grid. Only those tiles are
+restored from the background and re-rasterized, clipped to the tile, with
+every mobject that overlaps them, in the original draw order. All other
+pixels are kept from the previous frame.
+
+Compositing is per pixel, so a clipped redraw produces the same pixels as a
+full one. Frames the compositor can't reason about fall back to Manim's full
+redraw: the camera moved, the background or static image changed, the draw
+order changed, a non-vector mobject is on screen, or too many tiles are dirty.
+
+Scenes opt in with use_dirty_tiles(self). The pipeline enables it with
+`main.py --dirty-tiles`, which sets FILM_DIRTY_TILES=1 for the Manim
+processes. FILM_DIRTY_TILES=verify also renders every partial frame in full,
+compares the two, and keeps the full frame if they differ.
+"""
+import math
+import os
+
+import numpy as np
+
+DIRTY_TILES_ENV = "FILM_DIRTY_TILES"
+TILE_SIZE = 64  # pixels
+MAX_DIRTY_FRACTION = 0.6  # above this a full redraw is cheaper
+# Cairo's default miter limit (10) lets a join reach 5 line widths past its point
+MITER_REACH = 5.0
+
+STYLE_ATTRS = (
+    "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "stroke_width",
+    "background_stroke_width", "sheen_factor", "sheen_direction",
+)
+
+
+def _signature(vmobject):
+    """Everything that affects how vmobject is rasterized."""
+    values = [vmobject.points]
+    values += [getattr(vmobject, attr, None) for attr in STYLE_ATTRS]
+    return tuple(
+        value.tobytes() if isinstance(value, np.ndarray) else repr(value).encode()
+        for value in values
+    )
+
+
+def _default_line_style(vmobject):
+    # A non-default join/cap stays set on the Cairo context for the mobjects
+    # drawn after it, so skipping mobjects would change how later ones look
+    return all(
+        getattr(getattr(vmobject, attr, None), "name", "AUTO") == "AUTO"
+        for attr in ("joint_type", "cap_style")
+    )
+
+
+def _overlaps(box, rect):
+    return box[0] < rect[2] and rect[0] < box[2] and box[1] < rect[3] and rect[1] < box[3]
+
+
+class DirtyTileCompositor:
+    """Re-rasterize only the tiles that changed since the previous frame."""
+
+    def __init__(self, camera, tile_size=TILE_SIZE, max_dirty_fraction=MAX_DIRTY_FRACTION, verify=False):
+        from manim import VMobject
+
+        self._vmobject_type = VMobject
+        self.camera = camera
+        self.tile_size = tile_size
+        self.max_dirty_fraction = max_dirty_fraction
+        self.verify = verify
+        self.base = None  # background requested for the next capture
+        self.painted_base = None  # background under the frame in the pixel array
+        self.view = None
+        self.last = None  # [(mobject, signature, pixel box)] of that frame
+        self.frames = 0
+        self.partial_frames = 0
+        self.tiles_redrawn = 0
+        self.tiles_total = 0
+        self.mismatches = 0
+
+    def install(self):
+        """Route the camera's reset and capture through the compositor."""
+        camera = self.camera
+        self._set_frame_to_background = camera.set_frame_to_background
+        self._capture_mobjects = camera.capture_mobjects
+
+        def reset():
+            self.base = camera.background
+            return camera
+
+        def set_frame_to_background(background):
+            self.base = background
+
+        camera.reset = reset
+        camera.set_frame_to_background = set_frame_to_background
+        camera.capture_mobjects = self.capture_mobjects
+        return self
+
+    def _view_state(self):
+        camera = self.camera
+        return (
+            id(camera.pixel_array), camera.pixel_width, camera.pixel_height,
+            tuple(np.asarray(camera.frame_center, dtype=float)), camera.frame_width, camera.frame_height,
+        )
+
+    def _describe(self, mobjects):
+        """[(mobject, signature, pixel box)] for mobjects, or None if any can't be tracked."""
+        camera = self.camera
+        scale_x = camera.pixel_width / camera.frame_width
+        scale_y = camera.pixel_height / camera.frame_height
+        center_x, center_y = camera.frame_center[:2]
+        described = []
+        for mobject in mobjects:
+            if not isinstance(mobject, self._vmobject_type) or mobject.get_background_image():
+                return None
+            if not _default_line_style(mobject):
+                return None
+            points = mobject.points
+            if not len(points):
+                described.append((mobject, _signature(mobject), None))
+                continue
+            width = max(mobject.get_stroke_width(), mobject.get_stroke_width(background=True))
+            pad = MITER_REACH * width * camera.cairo_line_width_multiple * scale_x + 2
+            (x0, y0), (x1, y1) = points[:, :2].min(axis=0), points[:, :2].max(axis=0)
+            box = (
+                (x0 - center_x) * scale_x + camera.pixel_width / 2 - pad,
+                camera.pixel_height / 2 - (y1 - center_y) * scale_y - pad,
+                (x1 - center_x) * scale_x + camera.pixel_width / 2 + pad,
+                camera.pixel_height / 2 - (y0 - center_y) * scale_y + pad,
+            )
+            described.append((mobject, _signature(mobject), box))
+        return described
+
+    def _dirty_boxes(self, current):
+        """Pixel boxes that differ between self.last and current, or None to redraw everything."""
+        before = {id(mobject): (signature, box) for mobject, signature, box in self.last}
+        after = {id(mobject) for mobject, _, _ in current}
+        kept_before = [id(mobject) for mobject, _, _ in self.last if id(mobject) in after]
+        kept_after = [id(mobject) for mobject, _, _ in current if id(mobject) in before]
+        if kept_before != kept_after:
+            return None
+        boxes = [box for mobject, _, box in self.last if id(mobject) not in after]
+        for mobject, signature, box in current:
+            previous = before.get(id(mobject))
+            if previous is None:
+                boxes.append(box)
+            elif previous[0] != signature:
+                boxes += [previous[1], box]
+        return [box for box in boxes if box is not None]
+
+    def _dirty_rects(self, boxes):
+        """Merge the tiles under boxes into pixel rectangles, or None if too many are dirty."""
+        size = self.tile_size
+        width, height = self.camera.pixel_width, self.camera.pixel_height
+        rows, cols = math.ceil(height / size), math.ceil(width / size)
+        dirty = np.zeros((rows, cols), dtype=bool)
+        for x0, y0, x1, y1 in boxes:
+            c0, r0 = max(int(x0 // size), 0), max(int(y0 // size), 0)
+            c1, r1 = min(int(x1 // size), cols - 1), min(int(y1 // size), rows - 1)
+            if c0 <= c1 and r0 <= r1:
+                dirty[r0:r1 + 1, c0:c1 + 1] = True
+        self.tiles_total += dirty.size
+        if dirty.sum() > self.max_dirty_fraction * dirty.size:
+            self.tiles_redrawn += dirty.size
+            return None
+        self.tiles_redrawn += int(dirty.sum())
+
+        # Runs of dirty tiles per row, stacked while the next row has the same run
+        rects = []
+        open_runs = {}
+        for row in range(rows + 1):
+            runs = set()
+            col = 0
+            while row < rows and col < cols:
+                if dirty[row, col]:
+                    start = col
+                    while col < cols and dirty[row, col]:
+                        col += 1
+                    runs.add((start, col))
+                col += 1
+            for run in list(open_runs):
+                if run not in runs:
+                    rects.append((run[0], open_runs.pop(run), run[1], row))
+            for run in runs:
+                open_runs.setdefault(run, row)
+        return [
+            (c0 * size, r0 * size, min(c1 * size, width), min(r1 * size, height))
+            for c0, r0, c1, r1 in rects
+        ]
+
+    def _redraw(self, rect, base, current):
+        x0, y0, x1, y1 = rect
+        pixels = self.camera.pixel_array
+        pixels[y0:y1, x0:x1] = base[y0:y1, x0:x1]
+        ctx = self.camera.get_cairo_context(pixels)
+        ctx.save()
+        matrix = ctx.get_matrix()
+        ctx.identity_matrix()
+        ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+        ctx.clip()
+        ctx.set_matrix(matrix)
+        for mobject, _, box in current:
+            if box is not None and _overlaps(box, rect):
+                self.camera.display_vectorized(mobject, ctx)
+        ctx.restore()
+
+    def _full_redraw(self, base, mobjects, **kwargs):
+        self._set_frame_to_background(base)
+        self._capture_mobjects(mobjects, **kwargs)
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        base, self.base = self.base, None
+        if base is None:
+            # Drawing on top of the current frame without a reset: nothing to compare with
+            self._capture_mobjects(mobjects, **kwargs)
+            self.last = None
+            return
+
+        self.frames += 1
+        view = self._view_state()
+        current = self._describe(self.camera.get_mobjects_to_display(mobjects, **kwargs))
+        rects = None
+        if current is not None and self.last is not None and base is self.painted_base and view == self.view:
+            boxes = self._dirty_boxes(current)
+            if boxes is not None:
+                rects = self._dirty_rects(boxes)
+
+        if rects is None:
+            self._full_redraw(base, mobjects, **kwargs)
+        else:
+            self.partial_frames += 1
+            for rect in rects:
+                self._redraw(rect, base, current)
+            if self.verify:
+                partial = self.camera.pixel_array.copy()
+                self._full_redraw(base, mobjects, **kwargs)
+                if not np.array_equal(partial, self.camera.pixel_array):
+                    self.mismatches += 1
+                    if self.mismatches == 1:
+                        print(f"⚠️  Dirty-tile frame {self.frames} differs from a full redraw")
+        self.painted_base = base
+        self.view = view
+        self.last = current
+
+    def summary(self):
+        share = self.tiles_redrawn / self.tiles_total if self.tiles_total else 1.0
+        text = (
+            f"🧩 Dirty tiles: {self.partial_frames}/{self.frames} frames partial, "
+            f"{share:.0%} of tiles redrawn"
+        )
+        if self.verify:
+            text += f", {self.mismatches} mismatches"
+        return text
+
+
+def use_dirty_tiles(scene, tile_size=TILE_SIZE):
+    """Install a DirtyTileCompositor on scene's camera if FILM_DIRTY_TILES is set.
+
+    Call at the start of construct(). Renderers without a Cairo camera
+    (OpenGL) are left untouched. Returns the compositor or None.
+    """
+    mode = os.environ.get(DIRTY_TILES_ENV, "")
+    camera = getattr(scene.renderer, "camera", None)
+    if mode in ("", "0") or not hasattr(camera, "get_cairo_context"):
+        return None
+    compositor = DirtyTileCompositor(camera, tile_size, verify=mode == "verify").install()
+    tear_down = scene.tear_down
+
+    def report_and_tear_down():
+        print(compositor.summary())
+        return tear_down()
+
+    scene.tear_down = report_and_tear_down
+    return compositor
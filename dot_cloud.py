@@ -0,0 +1,199 @@
+from manim import *
+import numpy as np
+
+# Unit circle as four cubic Bezier curves (anchor, handle, handle, anchor).
+# Plenty for dots that are a few pixels across, and half the points of a Dot.
+_KAPPA = 4 * (np.sqrt(2) - 1) / 3
+_UNIT_CIRCLE = np.array([
+    [1, 0, 0], [1, _KAPPA, 0], [_KAPPA, 1, 0], [0, 1, 0],
+    [0, 1, 0], [-_KAPPA, 1, 0], [-1, _KAPPA, 0], [-1, 0, 0],
+    [-1, 0, 0], [-1, -_KAPPA, 0], [-_KAPPA, -1, 0], [0, -1, 0],
+    [0, -1, 0], [_KAPPA, -1, 0], [1, -_KAPPA, 0], [1, 0, 0],
+], dtype=float)
+
+
+_unit_circles = {}
+
+
+def unit_circle_points() -> np.ndarray:
+    """Unit circle in the active renderer's Bezier layout.
+
+    Cairo VMobjects take cubic curves (4 points each); OpenGL VMobjects take
+    quadratic curves (3 points each), so there the points come from a
+    Circle built by the OpenGL renderer itself.
+    """
+    renderer = getattr(config.renderer, "value", config.renderer)
+    if renderer not in _unit_circles:
+        if renderer == "opengl":
+            _unit_circles[renderer] = np.array(Circle(radius=1).points, dtype=float)
+        else:
+            _unit_circles[renderer] = _UNIT_CIRCLE
+    return _unit_circles[renderer]
+
+
+def dot_points(centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    """Bezier points for a batch of circles, one closed sub-path per dot."""
+    circle = unit_circle_points()
+    centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+    radii = np.asarray(radii, dtype=float).reshape(-1, 1, 1)
+    return (centers[:, None, :] + radii * circle[None, :, :]).reshape(-1, 3)
+
+
+def opacity_bins(opacities, levels: int = 8):
+    """Group opacities into at most `levels` bins for batched drawing.
+
+    Returns (bin index per opacity, draw opacity per bin). The bins split
+    [min, max] of the given opacities evenly, and each bin is drawn at the
+    midpoint of the opacities actually in it. Every value is therefore drawn
+    within (max - min) / (2 * levels) of itself, and a bin holding a single
+    distinct opacity (e.g. a cloud with one opacity) is drawn exactly.
+    """
+    opacities = np.asarray(opacities, dtype=float)
+    if not len(opacities):
+        return np.zeros(0, dtype=int), np.zeros(0)
+    low, high = opacities.min(), opacities.max()
+    width = (high - low) / levels
+    if width <= 0:
+        return np.zeros(len(opacities), dtype=int), np.array([low])
+    index = np.clip(((opacities - low) / width).astype(int), 0, levels - 1)
+    lows = np.full(levels, np.inf)
+    highs = np.full(levels, -np.inf)
+    np.minimum.at(lows, index, opacities)
+    np.maximum.at(highs, index, opacities)
+    values = np.zeros(levels)
+    used = np.isfinite(lows)
+    values[used] = (lows[used] + highs[used]) / 2
+    return index, values
+
+
+class DotCloud(VGroup):
+    """Many round dots, stored as NumPy arrays and drawn as a handful of paths.
+
+    positions (n x 3), radii, colors (n x 3 RGB; one `color` for all dots
+    unless `colors` gives one per dot) and opacities are per-dot arrays and
+    the source of truth. set_positions(), set_radii(), set_colors() and
+    set_opacities() update them in one vectorized step and rebuild the paths.
+    Cairo fills a path with one style, so dots are drawn as one VMobject per
+    color and opacity bin (see opacity_bins), each holding all of its dots
+    as closed sub-paths.
+
+    Manim animations (.animate.shift, FadeIn with shift) move the paths
+    directly; the setters read positions and radii back from the paths
+    first, so both can be mixed. Rebuilding drops any fade applied to the
+    paths.
+    """
+
+    def __init__(
+        self,
+        centers: np.ndarray,
+        radii: np.ndarray,
+        color: str = WHITE,
+        opacities=None,
+        opacity_levels: int = 8,
+        colors=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.positions = np.array(centers, dtype=float).reshape(-1, 3)
+        count = len(self.positions)
+        self.radii = np.array(np.broadcast_to(np.asarray(radii, dtype=float), (count,)))
+        if colors is None:
+            self.colors = np.tile(self._rgb_array([color]), (count, 1))
+        else:
+            self.colors = self._rgb_array(colors)
+        if opacities is None:
+            opacities = 1.0
+        self.opacities = np.array(np.broadcast_to(np.asarray(opacities, dtype=float), (count,)))
+        self.opacity_levels = opacity_levels
+        self.layer_dots = []  # dot indices held by each layer, in path order
+        self.rebuild()
+
+    @staticmethod
+    def _rgb_array(colors) -> np.ndarray:
+        """(n x 3) RGB floats from n colors (names, hex strings or RGB triples)."""
+        if isinstance(colors, np.ndarray) and colors.ndim == 2:
+            return np.array(colors, dtype=float)
+        return np.array([color_to_rgb(c) for c in colors], dtype=float).reshape(-1, 3)
+
+    def rebuild(self) -> "DotCloud":
+        """Redraw the layer paths from the per-dot arrays."""
+        bins, values = opacity_bins(self.opacities, self.opacity_levels)
+        palette, color_index = np.unique(self.colors, axis=0, return_inverse=True)
+        keys = color_index.reshape(-1) * len(values) + bins
+        layers = []
+        self.layer_dots = []
+        for key in np.unique(keys):
+            dots = np.flatnonzero(keys == key)
+            color, level = divmod(key, len(values))
+            rgb, opacity = palette[color], values[level]
+            layer = VMobject(fill_color=rgb_to_hex(rgb), fill_opacity=opacity, stroke_width=0)
+            layer.set_points(dot_points(self.positions[dots], self.radii[dots]))
+            layers.append(layer)
+            self.layer_dots.append(dots)
+        self.remove(*self.submobjects)
+        self.add(*layers)
+        return self
+
+    def sync_from_paths(self) -> "DotCloud":
+        """Read positions and radii back from the paths, e.g. after .animate.shift."""
+        circle = unit_circle_points()
+        per_dot = len(circle)
+        # Curve handles can sit outside the circle (OpenGL's quadratic arcs)
+        extent = circle[:, 0].max() - circle[:, 0].min()
+        for layer, dots in zip(self.submobjects, self.layer_dots):
+            points = layer.points
+            if len(points) != len(dots) * per_dot:
+                continue
+            points = points.reshape(len(dots), per_dot, 3)
+            low, high = points.min(axis=1), points.max(axis=1)
+            self.positions[dots] = (low + high) / 2
+            self.radii[dots] = (high[:, 0] - low[:, 0]) / extent
+        return self
+
+    def set_positions(self, positions) -> "DotCloud":
+        self.sync_from_paths()
+        self.positions[:] = np.asarray(positions, dtype=float).reshape(-1, 3)
+        return self.rebuild()
+
+    def set_radii(self, radii) -> "DotCloud":
+        self.sync_from_paths()
+        self.radii[:] = radii
+        return self.rebuild()
+
+    def set_colors(self, colors) -> "DotCloud":
+        self.sync_from_paths()
+        self.colors[:] = self._rgb_array(colors)
+        return self.rebuild()
+
+    def set_opacities(self, opacities) -> "DotCloud":
+        self.sync_from_paths()
+        self.opacities[:] = opacities
+        return self.rebuild()
+
+    @classmethod
+    def random(
+        cls,
+        count: int,
+        color: str,
+        x_range=(-7.8, 7.8),
+        y_range=(-4.4, 4.4),
+        radius_range=(0.01, 0.03),
+        opacity_range=None,
+        rng=None,
+    ) -> "DotCloud":
+        """Uniformly scattered dots.
+
+        Samples are drawn per dot in the order (x, y, radius[, opacity]) from
+        rng (a numpy Generator, or np.random by default).
+        """
+        rng = np.random if rng is None else rng
+        low = [x_range[0], y_range[0], radius_range[0]]
+        high = [x_range[1], y_range[1], radius_range[1]]
+        if opacity_range is not None:
+            low.append(opacity_range[0])
+            high.append(opacity_range[1])
+        samples = rng.uniform(low, high, size=(count, len(low)))
+        centers = np.zeros((count, 3))
+        centers[:, :2] = samples[:, :2]
+        opacities = samples[:, 3] if opacity_range is not None else None
+        return cls(centers, samples[:, 2], color=color, opacities=opacities)
@@ -0,0 +1,195 @@
+"""
+Lossless film assembly with FFmpeg.
+
+Scenes rendered with the same settings share codec, resolution, frame rate
+and timebase, so they can be joined with the concat demuxer without decoding
+a single frame. Only scenes whose stream parameters differ from the rest are
+re-encoded (to match the majority) before the stream-copy join.
+"""
+import json
+import shutil
+import subprocess
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+# Stream parameters that must match for a stream-copy concat
+SIGNATURE_FIELDS = (
+    "codec_name", "profile", "level", "width", "height", "pix_fmt", "r_frame_rate", "time_base",
+)
+# ffprobe profile names (lowercased) -> libx264 -profile:v
+X264_PROFILES = {
+    "constrained baseline": "baseline", "baseline": "baseline", "main": "main", "high": "high",
+    "high 10": "high10", "high 4:2:2": "high422", "high 4:4:4 predictive": "high444",
+}
+
+
+def ffmpeg_exe():
+    """FFmpeg binary from PATH, falling back to the one bundled with imageio-ffmpeg."""
+    exe = shutil.which("ffmpeg")
+    if exe:
+        return exe
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except ImportError:
+        return None
+
+
+def ffprobe_exe():
+    return shutil.which("ffprobe")
+
+
+def can_stream_copy():
+    """True if both ffmpeg and ffprobe are available."""
+    return ffmpeg_exe() is not None and ffprobe_exe() is not None
+
+
+def probe_video(video_path):
+    """Return the first video stream's parameters as a dict."""
+    cmd = [
+        ffprobe_exe(), "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=" + ",".join(SIGNATURE_FIELDS) + ",nb_frames,duration",
+        "-of", "json",
+        str(video_path),
+    ]
+    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    streams = json.loads(result.stdout).get("streams", [])
+    if not streams:
+        raise ValueError(f"No video stream in {video_path}")
+    return streams[0]
+
+
+def stream_signature(info):
+    return tuple(info.get(field) for field in SIGNATURE_FIELDS)
+
+
+def matching_encode_args(reference):
+    """Encoder arguments that reproduce reference's codec, profile, level, pixel format and timebase."""
+    args = [
+        "-c:v", reference["codec_name"] if reference["codec_name"] != "h264" else "libx264",
+        "-pix_fmt", reference["pix_fmt"],
+        "-video_track_timescale", reference["time_base"].split("/")[1],
+    ]
+    if reference["codec_name"] == "h264":
+        profile = X264_PROFILES.get((reference.get("profile") or "").lower())
+        if profile:
+            args += ["-profile:v", profile]
+        level = reference.get("level")
+        if isinstance(level, int) and level > 0:
+            # ffprobe reports level_idc, e.g. 42 for level 4.2
+            args += ["-level:v", f"{level / 10:g}"]
+    return args
+
+
+def _reencode(video_path, reference, output_path):
+    cmd = [
+        ffmpeg_exe(), "-y", "-v", "error",
+        "-i", str(video_path),
+        "-map", "0:v:0",
+        "-vf", f"scale={reference['width']}:{reference['height']},fps={reference['r_frame_rate']}",
+        *matching_encode_args(reference),
+        str(output_path),
+    ]
+    subprocess.run(cmd, check=True, capture_output=True, text=True)
+    return Path(output_path)
+
+
+def reencode_to_match(video_path, reference, output_path):
+    """Re-encode video_path so its stream parameters match reference.
+
+    Raises ValueError if the result still doesn't match, e.g. when the
+    encoder can't reproduce reference's profile.
+    """
+    _reencode(video_path, reference, output_path)
+    if stream_signature(probe_video(output_path)) != stream_signature(reference):
+        raise ValueError(f"Re-encoded {video_path} still differs from the reference stream")
+    return Path(output_path)
+
+
+def concat_copy(video_paths, output_path):
+    """Join videos with the concat demuxer, copying the bitstream.
+
+    The MP4 keeps a single codec configuration (the first part's SPS/PPS for
+    H.264), but parts from different encoders or settings carry their own.
+    auto_convert puts each part's parameter sets in-band before its
+    keyframes, so the decoder switches configuration at every join.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for path in video_paths:
+            escaped = str(Path(path).resolve()).replace("'", r"'\''")
+            listing.write(f"file '{escaped}'\n")
+        list_file = listing.name
+    try:
+        cmd = [
+            ffmpeg_exe(), "-y", "-v", "error",
+            "-f", "concat", "-safe", "0", "-auto_convert", "1",
+            "-i", list_file,
+            "-map", "0:v",
+            "-c", "copy",
+            "-movflags", "+faststart",
+            str(output_path),
+        ]
+        subprocess.run(cmd, check=True, capture_output=True, text=True)
+    finally:
+        Path(list_file).unlink(missing_ok=True)
+    return output_path
+
+
+def match_streams(video_paths, work_dir):
+    """Make every scene's stream parameters match the majority.
+
+    Scenes that differ are re-encoded with the majority's parameters. If a
+    re-encode still doesn't match, every scene is re-encoded the same way so
+    that all parts come from one encoder configuration.
+
+    Returns (parts, reencoded, reference): the paths to join, the scenes that
+    had to be re-encoded, and the reference stream info.
+    """
+    infos = [probe_video(path) for path in video_paths]
+    signatures = [stream_signature(info) for info in infos]
+    reference_signature, _ = Counter(signatures).most_common(1)[0]
+    reference = infos[signatures.index(reference_signature)]
+
+    work_dir = Path(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    parts = []
+    reencoded = []
+    for path, signature in zip(video_paths, signatures):
+        if signature == reference_signature:
+            parts.append(path)
+            continue
+        print(f"🔁 Re-encoding mismatched scene: {path}")
+        try:
+            parts.append(reencode_to_match(path, reference, work_dir / Path(path).name))
+        except ValueError as e:
+            print(f"⚠️  {e}; re-encoding every scene")
+            return reencode_all(video_paths, reference, work_dir)
+        reencoded.append(path)
+    return parts, reencoded, reference
+
+
+def reencode_all(video_paths, reference, work_dir):
+    """Re-encode every scene with reference's settings; same return as match_streams."""
+    parts = [Path(work_dir) / f"full_{index:03d}_{Path(path).name}" for index, path in enumerate(video_paths)]
+    # The first re-encode shows what the encoder makes of reference; the rest must match it
+    _reencode(video_paths[0], reference, parts[0])
+    reference = probe_video(parts[0])
+    for path, part in zip(video_paths[1:], parts[1:]):
+        reencode_to_match(path, reference, part)
+    return parts, list(video_paths), reference
+
+
+def assemble_film(video_paths, output_path, work_dir=None):
+    """Join scene videos into output_path without re-encoding matching scenes.
+
+    Returns the list of scenes that had to be re-encoded.
+    """
+    work_dir = work_dir or Path(output_path).parent / "assembly"
+    parts, reencoded, _ = match_streams(video_paths, work_dir)
+    concat_copy(parts, output_path)
+    return reencoded
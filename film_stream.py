@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Single-pass streaming render of the whole film.
+
+Every scene in SCENES runs in this process, one after another, and its raw
+frames go straight into one persistent H.264 encoder. The film is encoded
+exactly once. No per-scene MP4s, partial movie files or MoviePy decode are
+involved.
+
+Static holds are detected as frames arrive. Manim draws a static wait once
+and hands it over with a repeat count, and any frame identical to the one
+before it is recognised too. A held span is encoded as two frames (its first
+and its last) with timestamps covering the frames in between, so it is
+neither redrawn nor re-encoded frame by frame. The time saved is reported
+per scene.
+
+    python film_stream.py --profile final
+    python main.py --stream          # same, from the main pipeline
+"""
+import argparse
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from render_profiles import DEFAULT_PROFILE, DETAIL_ENV, PROFILES
+from sharding import load_scene_class
+
+
+class FrameEncoder:
+    """libx264 encoder (through PyAV, which Manim already uses) fed RGBA frames.
+
+    The film is written to a temporary name and moved into place by close(),
+    so an interrupted stream never leaves a truncated Complete_Film.mp4.
+    A frame equal to the previous one only extends the current hold; see
+    frames (timeline length) versus encoded.
+    """
+
+    def __init__(self, output_path, width, height, fps, bitrate):
+        import av
+
+        self._av = av
+        self.output_path = Path(output_path)
+        self.tmp_path = self.output_path.with_name(self.output_path.stem + ".partial.mp4")
+        self.frame_shape = (height, width, 4)
+        self.frames = 0
+        self.encoded = 0
+        self.encode_seconds = 0.0
+        self.last = None  # copy of the last distinct frame
+        self.held = 0  # frames since then that repeat it
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.container = av.open(str(self.tmp_path), mode="w", options={"movflags": "+faststart"})
+        self.stream = self.container.add_stream("libx264", rate=fps, options={"preset": "medium"})
+        self.stream.width = width
+        self.stream.height = height
+        self.stream.pix_fmt = "yuv420p"
+        self.stream.bit_rate = int(bitrate.rstrip("kK")) * 1000
+
+    def _encode(self, frame, pts):
+        start = time.perf_counter()
+        video_frame = self._av.VideoFrame.from_ndarray(frame, format="rgba")
+        video_frame.pts = pts
+        for packet in self.stream.encode(video_frame):
+            self.container.mux(packet)
+        self.encoded += 1
+        self.encode_seconds += time.perf_counter() - start
+
+    def _end_hold(self):
+        # Repeating the frame at the end of the span pins its display time,
+        # including for a hold that ends the film
+        if self.held:
+            self._encode(self.last, self.frames - 1)
+            self.held = 0
+
+    def write(self, frame, num_frames=1):
+        if frame.shape != self.frame_shape:
+            raise ValueError(f"Frame shape {frame.shape} does not match the film's {self.frame_shape}")
+        if self.last is not None and np.array_equal(frame, self.last):
+            self.held += num_frames
+        else:
+            self._end_hold()
+            self._encode(frame, self.frames)
+            # Manim reuses its pixel buffer for the next frame
+            self.last = frame.copy()
+            self.held = num_frames - 1
+        self.frames += num_frames
+
+    def close(self):
+        try:
+            self._end_hold()
+            for packet in self.stream.encode():
+                self.container.mux(packet)
+            self.container.close()
+        except self._av.error.FFmpegError as e:
+            self.tmp_path.unlink(missing_ok=True)
+            raise RuntimeError(f"Encoder failed: {e}") from e
+        self.tmp_path.replace(self.output_path)
+        return self.output_path
+
+    def abort(self):
+        try:
+            self.container.close()
+        except self._av.error.FFmpegError:
+            pass
+        self.tmp_path.unlink(missing_ok=True)
+
+
+@dataclass
+class HoldReport:
+    """Frame reuse in one streamed scene."""
+
+    scene_class: str
+    frames: int = 0  # frames on the timeline
+    drawn: int = 0  # frames Manim rasterized
+    encoded: int = 0
+    render_seconds: float = 0.0  # wall time, encoding included
+    encode_seconds: float = 0.0
+
+    @property
+    def reused(self):
+        return self.frames - self.encoded
+
+    @property
+    def saved_seconds(self):
+        """Estimated cost of drawing and encoding every held frame, at this scene's average rates."""
+        draw = (self.render_seconds - self.encode_seconds) / max(self.drawn, 1)
+        encode = self.encode_seconds / max(self.encoded, 1)
+        return (self.frames - self.drawn) * draw + self.reused * encode
+
+
+def stream_scene(scene_file, scene_class, encoder):
+    """Render scene_class, sending its frames to encoder; returns its HoldReport."""
+    scene = load_scene_class(scene_file, scene_class)()
+    report = HoldReport(scene_class)
+    start_frames, start_encoded, start_encode_s = encoder.frames, encoder.encoded, encoder.encode_seconds
+
+    # Frames go to the shared encoder instead of Manim's per-scene writer
+    def write_frame(frame, num_frames=1):
+        report.drawn += 1
+        encoder.write(frame, num_frames)
+
+    scene.renderer.file_writer.write_frame = write_frame
+    start = time.perf_counter()
+    scene.render()
+    report.render_seconds = time.perf_counter() - start
+    report.frames = encoder.frames - start_frames
+    report.encoded = encoder.encoded - start_encoded
+    report.encode_seconds = encoder.encode_seconds - start_encode_s
+    return report
+
+
+def stream_film(scenes, profile, output_path=None):
+    """Render scenes (file, class) in order into one film; returns its path.
+
+    Uses the Cairo renderer. Raises RuntimeError if the encoder fails;
+    a scene error aborts the stream and is re-raised.
+    """
+    from manim import tempconfig
+
+    os.environ[DETAIL_ENV] = str(profile.detail)
+    output_path = Path(output_path or profile.film_path())
+    encoder = FrameEncoder(output_path, profile.width, profile.height, profile.fps, profile.bitrate)
+    settings = {
+        "pixel_width": profile.width,
+        "pixel_height": profile.height,
+        "frame_rate": profile.fps,
+        "renderer": "cairo",
+        # Nothing on disk but the film itself
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "disable_caching": True,
+        "verbosity": "WARNING",
+    }
+    start = time.perf_counter()
+    reports = []
+    try:
+        for scene_file, scene_class in scenes:
+            with tempconfig(settings):
+                report = stream_scene(scene_file, scene_class, encoder)
+            reports.append(report)
+            print(f"✅ {scene_class}: {report.frames} frames in {report.render_seconds:.1f}s")
+            if report.reused:
+                print(f"   ⏸️  {report.reused} held frames reused ({report.frames - report.drawn} not redrawn), "
+                      f"~{report.saved_seconds:.1f}s saved")
+    except BaseException:
+        encoder.abort()
+        raise
+    encoder.close()
+    saved = sum(report.saved_seconds for report in reports)
+    print(f"🎞️  Streamed {encoder.frames} frames in one encode ({time.perf_counter() - start:.1f}s)")
+    print(f"⏸️  Holds: {encoder.frames - encoder.encoded} frames reused, ~{saved:.1f}s saved")
+    return output_path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render the whole film in one streaming encode.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default=DEFAULT_PROFILE,
+                        help="Render profile (default: final).")
+    parser.add_argument("-o", "--output", default=None,
+                        help="Film path (default: the profile's Complete_Film.mp4).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    from main import SCENES
+
+    args = parse_args(argv)
+    profile = PROFILES[args.profile]
+    try:
+        film = stream_film(SCENES, profile, args.output)
+    except (RuntimeError, OSError) as e:
+        print(f"❌ Streaming render failed: {e}")
+        sys.exit(1)
+    print(f"\n🎉 Complete film rendered: {film}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+from manim import *
+import numpy as np
+
+
+class FlightTrace(VGroup):
+    """Flight-path trace with a fixed memory and per-frame cost.
+
+    Points go into a ring buffer of `capacity` entries; once it is full the
+    oldest points are dropped. A new point that is collinear (within
+    `tolerance` scene units) with the last two kept points replaces the last
+    one instead of being appended, so straight and gently curving stretches
+    cost a handful of points. With fade_tail the trace is drawn as
+    `fade_segments` pieces whose opacity ramps up from `tail_opacity` at the
+    oldest point to full at the newest.
+
+    The trace only changes through push()/extend(), so feeding it the same
+    points in the same order gives the same path no matter how frames are
+    stepped or skipped.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 512,
+        tolerance: float = 0.002,
+        fade_tail: bool = False,
+        fade_segments: int = 8,
+        tail_opacity: float = 0.0,
+        stroke_color: str = WHITE,
+        stroke_width: float = 2,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.capacity = capacity
+        self.tolerance = tolerance
+        self.tail_opacity = tail_opacity
+        self.buffer = np.zeros((capacity, 3))
+        self.start = 0
+        self.size = 0
+
+        pieces = fade_segments if fade_tail else 1
+        self.pieces = [VMobject().set_stroke(stroke_color, stroke_width) for _ in range(pieces)]
+        for k, piece in enumerate(self.pieces):
+            if fade_tail:
+                fraction = (k + 1) / pieces
+                piece.set_stroke(opacity=tail_opacity + (1 - tail_opacity) * fraction)
+        self.add(*self.pieces)
+
+    def _slot(self, i: int) -> int:
+        return (self.start + i) % self.capacity
+
+    def _is_collinear(self, point: np.ndarray) -> bool:
+        if self.size < 2:
+            return False
+        a = self.buffer[self._slot(self.size - 2)]
+        b = self.buffer[self._slot(self.size - 1)]
+        chord = point - a
+        length = np.linalg.norm(chord)
+        if length == 0:
+            return True
+        # Distance of the last kept point from the chord a -> point
+        return np.linalg.norm(np.cross(chord, b - a)) / length < self.tolerance
+
+    def _push(self, point) -> None:
+        point = np.asarray(point, dtype=float)
+        if self._is_collinear(point):
+            self.buffer[self._slot(self.size - 1)] = point
+        elif self.size < self.capacity:
+            self.buffer[self._slot(self.size)] = point
+            self.size += 1
+        else:
+            self.buffer[self.start] = point
+            self.start = (self.start + 1) % self.capacity
+
+    def push(self, point) -> "FlightTrace":
+        self._push(point)
+        return self.redraw()
+
+    def extend(self, points) -> "FlightTrace":
+        """Push several points, redrawing once."""
+        for point in points:
+            self._push(point)
+        return self.redraw()
+
+    def points_in_order(self) -> np.ndarray:
+        """Kept points, oldest first."""
+        return np.roll(self.buffer, -self.start, axis=0)[: self.size]
+
+    def redraw(self) -> "FlightTrace":
+        points = self.points_in_order()
+        bounds = np.linspace(0, max(self.size - 1, 0), len(self.pieces) + 1).round().astype(int)
+        for piece, lo, hi in zip(self.pieces, bounds[:-1], bounds[1:]):
+            if hi > lo:
+                # Pieces share their end points so the path stays connected
+                piece.set_points_as_corners(points[lo : hi + 1])
+            else:
+                piece.set_points(np.zeros((0, 3)))
+        return self
@@ -0,0 +1,104 @@
+from manim import *
+import numpy as np
+
+
+class GlyphSet:
+    """Glyph outlines and advances for one font/size, laid out once.
+
+    Each character is measured between two zeros ("0c0") so its advance and
+    its offset from the pen position/baseline come from real Pango layout.
+    Characters are measured on first use and cached for the process.
+    """
+
+    _cache = {}
+
+    @classmethod
+    def get(cls, font_size: float, font: str = "") -> "GlyphSet":
+        key = (font, font_size)
+        if key not in cls._cache:
+            cls._cache[key] = cls(font_size, font)
+        return cls._cache[key]
+
+    def __init__(self, font_size: float, font: str = ""):
+        self.font_size = font_size
+        self.font = font
+        self.glyphs = {}
+        reference = Text("00", font=font, font_size=font_size)
+        self.zero_advance = reference[1].get_left()[0] - reference[0].get_left()[0]
+
+    def glyph(self, char: str):
+        """(template or None, offset from pen/baseline, advance) for char."""
+        if char not in self.glyphs:
+            probe = Text(f"0{char}0", font=self.font, font_size=self.font_size)
+            first, last = probe[0], probe[-1]
+            pen_x = first.get_left()[0] + self.zero_advance
+            baseline = first.get_bottom()[1]
+            advance = last.get_left()[0] - pen_x
+            if len(probe) == 3:
+                template = probe[1].copy()
+                offset = template.get_center() - np.array([pen_x, baseline, 0.0])
+            else:
+                # Whitespace: advance only, nothing to draw
+                template, offset = None, None
+            self.glyphs[char] = (template, offset, advance)
+        return self.glyphs[char]
+
+
+class NumericReadout(VGroup):
+    """HUD number that re-assembles cached glyph copies instead of re-running
+    text layout every frame.
+
+    formatter turns the value into a string, e.g.
+    ``lambda v: f"{v:.2f} km/s"``. The readout keeps its align_edge
+    (ORIGIN for center, LEFT for left edge) in place as its width changes.
+    """
+
+    def __init__(
+        self,
+        value: float = 0.0,
+        formatter=str,
+        font_size: float = 28,
+        font: str = "",
+        color: str = WHITE,
+        align_edge=ORIGIN,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.formatter = formatter
+        self.glyph_set = GlyphSet.get(font_size, font)
+        self.readout_color = color
+        self.align_edge = align_edge
+        self.text = None
+        self.set_value(value)
+
+    def set_value(self, value: float) -> "NumericReadout":
+        return self.set_readout_text(self.formatter(value))
+
+    def set_readout_text(self, text: str) -> "NumericReadout":
+        if text == self.text:
+            return self
+        anchor = None
+        opacity = 1.0
+        if self.submobjects:
+            anchor = self.get_critical_point(self.align_edge)
+            opacity = self.submobjects[0].get_fill_opacity()
+        glyphs = []
+        pen = 0.0
+        for char in text:
+            template, offset, advance = self.glyph_set.glyph(char)
+            if template is not None:
+                glyphs.append(template.copy().move_to(offset + RIGHT * pen))
+            pen += advance
+        # remove/add rather than assigning submobjects: OpenGL mobjects cache
+        # their family and only refresh it here
+        self.remove(*self.submobjects)
+        self.add(*glyphs)
+        self.set_fill(self.readout_color, opacity=opacity)
+        self.text = text
+        if anchor is not None and glyphs:
+            self.move_to(anchor, aligned_edge=self.align_edge)
+        return self
+
+    def set_color(self, color=YELLOW_C, family: bool = True) -> "NumericReadout":
+        self.readout_color = color
+        return super().set_color(color, family)
@@ -1,23 +1,27 @@
 from manim import *
 
+from logo_cache import load_logo
+from scene_camera import set_scene_background
+from scene_seed import seed_scene
+
 # Render tips:
 # Preview (fast): manim -pqh --renderer=opengl "/home/nasemul1/Documents/Python/Day 3 assignment/intro.py" LogoIntro
 # High quality:   manim -pqh --renderer=opengl "/home/nasemul1/Documents/Python/Day 3 assignment/intro.py" LogoIntro
 
 class LogoIntro(Scene):
     def construct(self):
+        seed_scene(self)
+
         # Background
-        try:
-            self.set_background_color(BLACK)
-        except Exception:
-            self.camera.background_color = BLACK
+        set_scene_background(self, BLACK)
 
         # Load SVG from assets folder
         svg_path = "assets/logo.svg"
         
         try:
             # Load SVG; start with transparent fill and visible white stroke
-            logo = SVGMobject(svg_path)
+            # Parsed once, then rebuilt from the on-disk geometry cache
+            logo = load_logo(svg_path)
             logo.set_fill(WHITE, opacity=0.0)
             logo.set_stroke(WHITE, width=3)
             logo.center().scale(1.25)
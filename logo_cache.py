@@ -0,0 +1,96 @@
+from manim import *
+from pathlib import Path
+import hashlib
+import os
+import tempfile
+import numpy as np
+
+try:
+    from importlib.metadata import version as _package_version
+    MANIM_VERSION = _package_version("manim")
+except Exception:
+    MANIM_VERSION = "unknown"
+
+CACHE_DIR = Path("media/logo_cache")
+
+
+def _rgb_to_hex(rgb) -> str:
+    r, g, b = (int(round(255 * c)) for c in np.clip(rgb, 0, 1))
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _cache_path(svg_path: Path) -> Path:
+    # Cairo and OpenGL store different Bezier layouts (cubic vs quadratic)
+    renderer = getattr(config.renderer, "value", config.renderer)
+    digest = hashlib.sha256(svg_path.read_bytes())
+    digest.update(MANIM_VERSION.encode())
+    digest.update(str(renderer).encode())
+    return CACHE_DIR / f"{svg_path.stem}_{renderer}_{digest.hexdigest()[:16]}.npz"
+
+
+def _save(logo: VMobject, cache_path: Path) -> None:
+    parts = logo.family_members_with_points()
+    points = np.concatenate([p.points for p in parts])
+    offsets = np.cumsum([0] + [len(p.points) for p in parts])
+    styles = np.array([
+        [
+            *color_to_rgb(p.get_fill_color()), p.get_fill_opacity(),
+            *color_to_rgb(p.get_stroke_color()), p.get_stroke_opacity(),
+            p.get_stroke_width(),
+        ]
+        for p in parts
+    ])
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a unique temp file first so a half-written file is never picked
+    # up, and parallel scene workers never write into the same one
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=f".{cache_path.stem}.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(f, points=points, offsets=offsets, styles=styles)
+        tmp_path.replace(cache_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    # Drop entries for older versions of the same SVG on the same renderer
+    for stale in cache_path.parent.glob(f"{cache_path.stem.rsplit('_', 1)[0]}_*.npz"):
+        if stale != cache_path:
+            stale.unlink(missing_ok=True)
+
+
+def _load(cache_path: Path) -> VGroup:
+    with np.load(cache_path) as data:
+        points, offsets, styles = data["points"], data["offsets"], data["styles"]
+    logo = VGroup()
+    for start, end, style in zip(offsets[:-1], offsets[1:], styles):
+        part = VMobject()
+        part.set_points(points[start:end])
+        part.set_fill(_rgb_to_hex(style[0:3]), opacity=style[3])
+        part.set_stroke(_rgb_to_hex(style[4:7]), width=style[8], opacity=style[7])
+        logo.add(part)
+    return logo
+
+
+def load_logo(svg_path: str = "assets/logo.svg") -> VGroup:
+    """Logo geometry for svg_path, parsed once and cached on disk.
+
+    The SVG's sub-path points and styles are stored in a compressed .npz
+    keyed by the SVG's hash (and the Manim version and renderer), so later renders skip
+    SVG parsing entirely. A missing, stale or unreadable cache is rebuilt
+    from the SVG; errors from the SVG itself propagate so callers can use
+    their geometric fallback.
+    """
+    svg_path = Path(svg_path)
+    cache_path = _cache_path(svg_path)
+    if cache_path.exists():
+        try:
+            return _load(cache_path)
+        except Exception:
+            cache_path.unlink(missing_ok=True)
+
+    logo = SVGMobject(str(svg_path))
+    try:
+        _save(logo, cache_path)
+    except OSError:
+        pass  # Cache is an optimization; the parsed logo is still good
+    return logo
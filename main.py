@@ -3,11 +3,31 @@
 One-command render of the whole film.
 Renders all Manim scenes and compiles them into a single video.
 """
+import argparse
+import os
+import re
 import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from moviepy import VideoFileClip, concatenate_videoclips
 
+from chunked_encode import encode_chunked
+from dirty_tiles import DIRTY_TILES_ENV
+from film_assembly import assemble_film, can_stream_copy
+from film_stream import stream_film
+from render_cache import DEFAULT_MAX_BYTES, RenderCache, cache_key
+from render_farm import DONE, FARM_ROOT, Coordinator, parse_address, start_local_workers
+from render_journal import RenderJournal, validate_video
+from render_profiles import DEFAULT_PROFILE, DETAIL_ENV, PROFILES
+from renderers import (
+    DEFAULT_RENDERER, RENDERERS, parse_scene_renderers, renderer_command, renderer_env, renderer_flags,
+)
+from renditions import encode_renditions, master_profile, parse_renditions
+from sharding import animation_durations, animation_range_flags, plan_shards, stitch_shards
+from transitions import assemble_with_transitions, parse_transition
+
 # Scene files to render (in order)
 SCENES = [
     ("intro.py", "LogoIntro"),
@@ -17,17 +37,30 @@ SCENES = [
     ("outro.py", "LogoOutro"),
 ]
 
-# Output paths
-OUTPUT_DIR = Path("media/videos/Compiled/1080p60")
-FINAL_VIDEO = OUTPUT_DIR / "Complete_Film.mp4"
+# Parallel render: every worker gets its own media dir so partial movie files,
+# text caches and temp files never collide between scenes.
+WORKER_MEDIA_ROOT = Path("media/workers")
+
+# Transition into a scene from the one before it (hard cut if not listed),
+# e.g. {"StarshipBuild": Transition("crossfade", 0.5)}. Only the overlap
+# around each cut is re-encoded.
+TRANSITIONS = {}
+
+# Long scenes that dominate the critical path; split into animation-range
+# shards when --shards is greater than 1
+SHARDED_SCENES = ["StarshipBuild", "StarshipMarsLanding"]
 
-def run_command(cmd, description):
+def scene_video_path(scene_file, scene_class, media_dir=Path("media"), quality_dir="1080p60"):
+    """Where Manim writes a render of scene_class (1080p60 by default)."""
+    return Path(media_dir) / "videos" / Path(scene_file).stem / quality_dir / f"{scene_class}.mp4"
+
+def run_command(cmd, description, env=None):
     """Run a command and handle errors."""
     print(f"\n🎬 {description}")
     print(f"Running: {' '.join(cmd)}")
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        result = subprocess.run(cmd, check=True, capture_output=True, text=True, env=env)
         print("✅ Success")
         return True
     except subprocess.CalledProcessError as e:
@@ -36,42 +69,275 @@ def run_command(cmd, description):
         print(f"stderr: {e.stderr}")
         return False
 
-def main():
-    print("🚀 Starting complete film render...")
-    
-    # Check if Manim is available
-    try:
-        subprocess.run(["manim", "--version"], check=True, capture_output=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("❌ Manim not found. Install with: pip install manim")
-        sys.exit(1)
-    
-    # Render each scene
-    rendered_videos = []
-    for scene_file, scene_class in SCENES:
-        if not Path(scene_file).exists():
-            print(f"⚠️  Scene file not found: {scene_file}")
-            continue
-            
+def render_flags(profile, renderer=DEFAULT_RENDERER):
+    """Manim flags for a profile and renderer; these are also part of the render cache key."""
+    return [*profile.manim_flags, *renderer_flags(renderer)]
+
+def render_scenes_serial(pending, profile, renderers=None, on_result=None, preview=True):
+    """Render (index, scene_file, scene_class) entries one after another.
+
+    renderers maps an index to its renderer (default: Cairo). on_result is
+    called as on_result(index, video_path, error) as each scene finishes.
+    preview opens each scene in Manim's player once rendered.
+    Returns {index: video_path} for every scene that rendered.
+    """
+    renderers = renderers or {}
+    on_result = on_result or (lambda index, video_path, error: None)
+    rendered = {}
+    for index, scene_file, scene_class in pending:
+        renderer = renderers.get(index, DEFAULT_RENDERER)
         # Expected output path
-        video_path = Path(f"media/videos/{scene_file.replace('.py', '')}/1080p60/{scene_class}.mp4")
+        video_path = scene_video_path(scene_file, scene_class, quality_dir=profile.quality_dir)
         
         # Render scene
-        cmd = ["manim", "-pqh", scene_file, scene_class]
-        if run_command(cmd, f"Rendering {scene_file} -> {scene_class}"):
+        cmd = ["manim", *(["-p"] if preview else []), *render_flags(profile, renderer), scene_file, scene_class]
+        if run_command(renderer_command(cmd, renderer), f"Rendering {scene_file} -> {scene_class} ({renderer})",
+                       env=renderer_env(renderer)):
             if video_path.exists():
-                rendered_videos.append(video_path)
+                rendered[index] = video_path
                 print(f"✅ Rendered: {video_path}")
+                on_result(index, video_path, None)
             else:
                 print(f"⚠️  Video not found at expected path: {video_path}")
-    
-    if not rendered_videos:
-        print("❌ No videos were rendered successfully.")
-        sys.exit(1)
-    
-    # Compile all videos
+                on_result(index, None, f"Video not found at expected path: {video_path}")
+        else:
+            on_result(index, None, "Manim exited with an error")
+    return rendered
+
+# Manim's per-animation log lines for cache hits and freshly rendered segments
+CACHED_SEGMENT = re.compile(r"Animation \d+ : Using cached data")
+RENDERED_SEGMENT = re.compile(r"Animation \d+ : Partial movie file written")
+
+def segment_summary(output):
+    """e.g. "2/17 animations re-rendered" from Manim's log output."""
+    cached = len(CACHED_SEGMENT.findall(output))
+    rendered = len(RENDERED_SEGMENT.findall(output))
+    if not cached + rendered:
+        return ""
+    return f"{rendered}/{cached + rendered} animations re-rendered"
+
+def render_scene_worker(scene_file, scene_class, media_dir, flags, quality_dir, animation_range=None,
+                        renderer=DEFAULT_RENDERER, env=None):
+    """Render one scene (or one animation range of it) in a pool worker.
+
+    flags must already select renderer (see render_flags). env is the Manim
+    process environment (default: renderer_env(renderer)).
+    Returns (video_path, seconds, error, segment summary).
+    """
+    cmd = ["manim", *flags, "--media_dir", str(media_dir)]
+    if animation_range is not None:
+        cmd += animation_range_flags(animation_range)
+    cmd += [scene_file, scene_class]
+    start = time.perf_counter()
+    result = subprocess.run(
+        renderer_command(cmd, renderer), capture_output=True, text=True,
+        env=renderer_env(renderer) if env is None else env,
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        return None, elapsed, result.stderr, ""
+    video_path = scene_video_path(scene_file, scene_class, media_dir, quality_dir)
+    if not video_path.exists():
+        return None, elapsed, f"Video not found at expected path: {video_path}", ""
+    return video_path, elapsed, None, segment_summary(result.stdout + result.stderr)
+
+def stitch_sharded_scenes(shard_videos, failed, media_root, profile, results, on_result):
+    """Join each sharded scene's shard videos into its scene video under media_root.
+
+    Scenes in failed are skipped. A stitch that fails is reported through
+    on_result like a failed render, so the journal records it and --resume
+    renders the scene again.
+    """
+    for index, videos in shard_videos.items():
+        if index in failed:
+            continue
+        scene_file, scene_class = SCENES[index]
+        video_path = scene_video_path(scene_file, scene_class, media_root / scene_class, profile.quality_dir)
+        try:
+            stitch_shards(videos, video_path)
+        except (subprocess.CalledProcessError, OSError) as e:
+            error = getattr(e, "stderr", None) or str(e)
+            print(f"❌ {scene_class} failed to stitch {len(videos)} shards")
+            print(f"stderr: {error}")
+            failed.add(index)
+            on_result(index, None, error)
+            continue
+        print(f"🧵 Stitched {len(videos)} shards: {video_path}")
+        results[index] = video_path
+        on_result(index, video_path, None)
+
+
+def render_scenes_parallel(pending, jobs, profile, shard_plans=None, renderers=None, on_result=None):
+    """Render (index, scene_file, scene_class) entries on a pool of workers.
+
+    shard_plans maps an index to a list of animation ranges; those scenes are
+    rendered as one job per range and stitched back into a single video.
+    renderers maps an index to its renderer (default: Cairo). on_result is
+    called as on_result(index, video_path, error) as each scene finishes.
+    Returns {index: video_path}, so callers can restore SCENES order
+    regardless of completion order.
+    """
+    shard_plans = shard_plans or {}
+    renderers = renderers or {}
+    on_result = on_result or (lambda index, video_path, error: None)
+    print(f"\n🎬 Rendering {len(pending)} scenes on {jobs} workers")
+    results = {}
+    shard_videos = {}
+    failed = set()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {}
+        for index, scene_file, scene_class in pending:
+            renderer = renderers.get(index, DEFAULT_RENDERER)
+            flags = render_flags(profile, renderer)
+            ranges = shard_plans.get(index)
+            if not ranges:
+                media_dir = WORKER_MEDIA_ROOT / scene_class
+                future = pool.submit(
+                    render_scene_worker, scene_file, scene_class, media_dir, flags, profile.quality_dir,
+                    renderer=renderer,
+                )
+                futures[future] = (index, scene_class, None)
+                continue
+            shard_videos[index] = [None] * len(ranges)
+            for shard, animation_range in enumerate(ranges):
+                media_dir = WORKER_MEDIA_ROOT / f"{scene_class}_shard{shard}"
+                future = pool.submit(
+                    render_scene_worker, scene_file, scene_class, media_dir, flags, profile.quality_dir,
+                    animation_range, renderer,
+                )
+                futures[future] = (index, scene_class, shard)
+
+        for future in as_completed(futures):
+            index, scene_class, shard = futures[future]
+            label = scene_class if shard is None else f"{scene_class} shard {shard}"
+            video_path, elapsed, error, segments = future.result()
+            if error:
+                print(f"❌ {label} failed after {elapsed:.1f}s")
+                print(f"stderr: {error}")
+                if index not in failed:
+                    on_result(index, None, error)
+                failed.add(index)
+                continue
+            print(f"✅ {label} rendered in {elapsed:.1f}s: {video_path}")
+            if segments:
+                print(f"   ♻️  {segments}")
+            if shard is None:
+                results[index] = video_path
+                on_result(index, video_path, None)
+            else:
+                shard_videos[index][shard] = video_path
+
+    stitch_sharded_scenes(shard_videos, failed, WORKER_MEDIA_ROOT, profile, results, on_result)
+    return results
+
+def render_scenes_farm(pending, profile, address, shard_plans=None, renderers=None, on_result=None,
+                       local_workers=0):
+    """Render (index, scene_file, scene_class) entries on a render farm.
+
+    Starts a coordinator on address (host, port), queues one job per scene or
+    shard, and waits for workers (`render_farm.py worker`) to return them.
+    local_workers starts that many workers on this machine as well. Arguments
+    and return value are as for render_scenes_parallel.
+    """
+    shard_plans = shard_plans or {}
+    renderers = renderers or {}
+    on_result = on_result or (lambda index, video_path, error: None)
+    coordinator = Coordinator(*address)
+    for index, scene_file, scene_class in pending:
+        renderer = renderers.get(index, DEFAULT_RENDERER)
+        spec = dict(
+            index=index, scene_file=scene_file, scene_class=scene_class,
+            flags=render_flags(profile, renderer), quality_dir=profile.quality_dir, renderer=renderer,
+            env={key: os.environ[key] for key in (DETAIL_ENV, DIRTY_TILES_ENV) if key in os.environ},
+        )
+        ranges = shard_plans.get(index)
+        if not ranges:
+            coordinator.add_job(**spec)
+            continue
+        for shard, animation_range in enumerate(ranges):
+            coordinator.add_job(**spec, animation_range=list(animation_range), shard=shard)
+
+    results = {}
+    shard_videos = {index: [None] * len(ranges) for index, ranges in shard_plans.items()}
+    failed = set()
+
+    def finished(job):
+        if job.status != DONE:
+            print(f"stderr: {job.errors[-1] if job.errors else 'unknown error'}")
+            if job.index not in failed:
+                on_result(job.index, None, "\n".join(job.errors))
+            failed.add(job.index)
+        elif job.shard is None:
+            results[job.index] = Path(job.artifact)
+            on_result(job.index, results[job.index], None)
+        else:
+            shard_videos[job.index][job.shard] = Path(job.artifact)
+
+    coordinator.start()
+    workers = start_local_workers(coordinator.address, local_workers) if local_workers else []
+    try:
+        coordinator.wait(finished)
+    finally:
+        coordinator.stop()
+        for worker in workers:
+            worker.terminate()
+
+    stitch_sharded_scenes(shard_videos, failed, FARM_ROOT, profile, results, on_result)
+    return results
+
+def compile_videos(rendered_videos, profile, reencode=False, encode_jobs=None, measure_single=False,
+                   transitions=None):
+    """Concatenate the rendered scene videos into the profile's film path.
+
+    Uses a lossless stream-copy join when FFmpeg is available, re-encoding
+    only scenes whose stream parameters don't match. transitions[i] (a
+    Transition or None) blends the cut between video i and i + 1; only the
+    overlap windows are re-encoded. With reencode=True the film is
+    re-encoded as parallel chunks on encode_jobs FFmpeg processes.
+    Falls back to a full MoviePy re-encode when FFmpeg is missing.
+    """
     print(f"\n🎞️  Compiling {len(rendered_videos)} videos...")
+    final_video = profile.film_path()
+    transitions = transitions or []
+    
+    if can_stream_copy():
+        try:
+            sources = rendered_videos
+            if any(transitions):
+                start = time.perf_counter()
+                # Joined film is only an intermediate when it gets re-encoded anyway
+                joined = final_video.with_name("Joined_Film.mp4") if reencode else final_video
+                windows, encoded = assemble_with_transitions(rendered_videos, transitions, joined)
+                print(f"🎚️  {windows} transition(s): re-encoded {encoded:.1f}s around the cuts, "
+                      f"stream-copied the rest in {time.perf_counter() - start:.1f}s")
+                sources = [joined]
+            
+            if reencode:
+                stats = encode_chunked(
+                    sources, final_video, profile.width, profile.height, profile.fps, profile.bitrate,
+                    jobs=encode_jobs, measure_single=measure_single,
+                )
+                if sources != rendered_videos:
+                    sources[0].unlink()
+                print(f"⚡ Encoded {stats['chunks']} chunks on {stats['jobs']} workers in {stats['wall_s']:.1f}s")
+                if "speedup" in stats:
+                    print(f"   {stats['speedup']:.2f}x vs a single-process encode ({stats['single_s']:.1f}s)")
+                else:
+                    print(f"   Chunk encodes sum to {stats['chunk_sum_s']:.1f}s (serial estimate; "
+                          f"--measure-encode times a real single-process encode)")
+            elif not any(transitions):
+                start = time.perf_counter()
+                reencoded = assemble_film(rendered_videos, final_video)
+                print(f"⚡ Stream-copied {len(rendered_videos) - len(reencoded)} scene(s), "
+                      f"re-encoded {len(reencoded)} in {time.perf_counter() - start:.1f}s")
+            print(f"\n🎉 Complete film rendered: {final_video}")
+            print(f"📁 File size: {final_video.stat().st_size / (1024*1024):.1f} MB")
+            return final_video
+        except (subprocess.CalledProcessError, ValueError) as e:
+            print(f"⚠️  FFmpeg assembly failed ({e}), falling back to MoviePy re-encode")
     
+    if any(transitions):
+        print("⚠️  Transitions need FFmpeg; the MoviePy fallback uses hard cuts")
     try:
         clips = []
         for video_path in rendered_videos:
@@ -79,20 +345,20 @@ def main():
             clips.append(VideoFileClip(str(video_path)))
         
         # Create output directory
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        final_video.parent.mkdir(parents=True, exist_ok=True)
         
         # Concatenate videos
-        print(f"Creating final video: {FINAL_VIDEO}")
+        print(f"Creating final video: {final_video}")
         final = concatenate_videoclips(clips, method="compose")
         
         # Write final video
         final.write_videofile(
-            str(FINAL_VIDEO),
+            str(final_video),
             codec="libx264",
             audio_codec="aac", 
-            fps=60,
+            fps=profile.fps,
             preset="medium",
-            bitrate="8000k",
+            bitrate=profile.bitrate,
         )
         
         # Cleanup
@@ -100,12 +366,399 @@ def main():
         for clip in clips:
             clip.close()
             
-        print(f"\n🎉 Complete film rendered: {FINAL_VIDEO}")
-        print(f"📁 File size: {FINAL_VIDEO.stat().st_size / (1024*1024):.1f} MB")
+        print(f"\n🎉 Complete film rendered: {final_video}")
+        print(f"📁 File size: {final_video.stat().st_size / (1024*1024):.1f} MB")
+        return final_video
         
     except Exception as e:
         print(f"❌ Error compiling videos: {e}")
         sys.exit(1)
 
+def deliver_renditions(film, renditions, journal=None):
+    """Encode every delivery rendition of film in one decode pass.
+
+    Skipped when the journal shows the same renditions were already made
+    from this exact film and they still validate. Exits on failure.
+    """
+    if not can_stream_copy():
+        print("❌ Delivery renditions need ffmpeg and ffprobe")
+        sys.exit(1)
+    film = Path(film)
+    inputs = {
+        "film": [str(film), film.stat().st_size, film.stat().st_mtime],
+        "renditions": [[r.name, r.width, r.height, r.bitrate, r.maxrate, r.bufsize] for r in renditions],
+    }
+    if journal is not None and journal.completed("deliver", inputs) and all(
+        validate_video(rendition.path())[0] for rendition in renditions
+    ):
+        print(f"✅ Renditions are up to date: {', '.join(r.name for r in renditions)}")
+        return
+    if journal is not None:
+        journal.start("deliver", inputs)
+    print(f"\n📦 Encoding {len(renditions)} rendition(s) from one decode of {film}")
+    try:
+        paths, elapsed = encode_renditions(film, renditions)
+    except subprocess.CalledProcessError as e:
+        if journal is not None:
+            journal.fail("deliver", e.stderr or e)
+        print(f"❌ Rendition encode failed: {e.stderr or e}")
+        sys.exit(1)
+    expected = validate_video(film)[1].get("duration")
+    for rendition in renditions:
+        ok, details = validate_video(paths[rendition.name], expected)
+        if not ok:
+            if journal is not None:
+                journal.fail("deliver", f"{rendition.name}: {details['error']}")
+            print(f"❌ {rendition.name} rendition failed validation: {details['error']}")
+            sys.exit(1)
+        size = paths[rendition.name].stat().st_size / (1024 * 1024)
+        print(f"   {rendition.name} @ {rendition.bitrate}: {paths[rendition.name]} ({size:.1f} MB)")
+    print(f"📦 {len(renditions)} rendition(s) encoded in {elapsed:.1f}s")
+    if journal is not None:
+        journal.finish("deliver", **{name: str(path) for name, path in paths.items()})
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render all scenes and compile the film.")
+    parser.add_argument(
+        "--profile",
+        choices=sorted(PROFILES),
+        default=DEFAULT_PROFILE,
+        help="Render profile: draft (360p15, reduced detail), review (720p30), "
+             "final (1080p60) or final-4k (2160p60). Default: final.",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for scene rendering (default: 1, serial). "
+             "Use 0 for one worker per CPU core.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the render cache and re-render every scene.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=float,
+        default=DEFAULT_MAX_BYTES / 1024 ** 3,
+        help="Maximum render cache size in GB before old entries are evicted (default: 5).",
+    )
+    parser.add_argument(
+        "--reencode",
+        action="store_true",
+        help="Re-encode the film (chunked, in parallel) instead of a stream copy.",
+    )
+    parser.add_argument(
+        "--encode-jobs",
+        type=int,
+        default=0,
+        help="FFmpeg processes for --reencode (default: 0, one per CPU core).",
+    )
+    parser.add_argument(
+        "--measure-encode",
+        action="store_true",
+        help="With --reencode, also time a single-process encode and report the real speedup.",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Split each of SHARDED_SCENES into up to N animation-range shards "
+             "rendered in parallel (requires --jobs > 1 or --farm).",
+    )
+    parser.add_argument(
+        "--farm",
+        default=None,
+        metavar="HOST:PORT",
+        help="Coordinate a render farm on HOST:PORT instead of rendering locally; "
+             "workers connect with `python render_farm.py worker --connect HOST:PORT`. "
+             "Use 0.0.0.0:PORT to accept workers from other machines.",
+    )
+    parser.add_argument(
+        "--farm-workers",
+        type=int,
+        default=0,
+        help="With --farm, also start N worker processes on this machine (default: 0).",
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=RENDERERS,
+        default=DEFAULT_RENDERER,
+        help="Renderer for every scene (default: cairo). OpenGL runs headless "
+             "under xvfb-run with software GL when there is no display.",
+    )
+    parser.add_argument(
+        "--scene-renderer",
+        action="append",
+        default=[],
+        metavar="SCENE=RENDERER",
+        help="Override the renderer for one scene class, e.g. StarshipBuild=opengl. Repeatable.",
+    )
+    parser.add_argument(
+        "--allow-unverified-renderer",
+        action="store_true",
+        help="Render scenes on a renderer they are not verified for (see VERIFIED_SCENES in renderers.py).",
+    )
+    parser.add_argument(
+        "--transition",
+        default=None,
+        metavar="KIND[:SECONDS]",
+        help="Use this transition at every cut instead of TRANSITIONS: crossfade, "
+             "fadeblack or none (hard cuts), e.g. crossfade:0.75.",
+    )
+    parser.add_argument(
+        "--no-preview",
+        action="store_true",
+        help="Don't open each serially rendered scene in a video player.",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Discard the render journal and run every step again (the render cache still applies).",
+    )
+    parser.add_argument(
+        "--allow-missing",
+        action="store_true",
+        help="Compile the film even if some scenes failed to render or validate.",
+    )
+    parser.add_argument(
+        "--dirty-tiles",
+        choices=["on", "verify"],
+        nargs="?",
+        const="on",
+        default=None,
+        help="Re-rasterize only the screen tiles that changed since the previous frame in "
+             "scenes that support it (same pixels as a full redraw). 'verify' also renders "
+             "every frame in full and reports any difference.",
+    )
+    parser.add_argument(
+        "--deliver",
+        default=None,
+        metavar="RENDITIONS",
+        help="Render the film once at the highest of these resolutions and encode every "
+             "delivery rendition from it in one decode pass, e.g. 4k,1080p,720p "
+             "(NAME:BITRATE overrides a rung of the bitrate ladder). Overrides --profile.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Render all scenes in one process and pipe their frames into a single "
+             "FFmpeg encode (no per-scene videos, cache or compile step; Cairo only).",
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    profile = PROFILES[args.profile]
+    renditions = []
+    if args.deliver:
+        try:
+            renditions = parse_renditions(args.deliver)
+            profile = master_profile(renditions, PROFILES)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(2)
+        print(f"📦 Delivering {', '.join(r.name for r in renditions)} from one {profile.name} master")
+    print(f"🚀 Starting complete film render ({profile.name}: {profile.quality_dir})...")
+    # Scene detail reaches the Manim subprocesses through the environment
+    os.environ[DETAIL_ENV] = str(profile.detail)
+    if args.dirty_tiles:
+        os.environ[DIRTY_TILES_ENV] = "verify" if args.dirty_tiles == "verify" else "1"
+    
+    # Check if Manim is available
+    try:
+        subprocess.run(["manim", "--version"], check=True, capture_output=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        print("❌ Manim not found. Install with: pip install manim")
+        sys.exit(1)
+    
+    if args.stream:
+        if args.renderer != DEFAULT_RENDERER or args.scene_renderer:
+            print("⚠️  Streaming mode renders every scene with Cairo")
+        scenes = [(f, c) for f, c in SCENES if Path(f).exists()]
+        try:
+            final_video = stream_film(scenes, profile)
+        except (RuntimeError, OSError, subprocess.CalledProcessError) as e:
+            print(f"❌ Streaming render failed: {e}")
+            sys.exit(1)
+        print(f"\n🎉 Complete film rendered: {final_video}")
+        print(f"📁 File size: {final_video.stat().st_size / (1024*1024):.1f} MB")
+        if renditions:
+            deliver_renditions(final_video, renditions)
+        return
+    
+    # Renderer per scene: --renderer, overridden by --scene-renderer
+    try:
+        by_class = parse_scene_renderers(
+            [scene_class for _, scene_class in SCENES], args.scene_renderer, args.renderer,
+            allow_unverified=args.allow_unverified_renderer,
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    renderers = {index: by_class[scene_class] for index, (_, scene_class) in enumerate(SCENES)}
+    
+    # Steps finished by an earlier (interrupted) run are resumed from the journal
+    journal = RenderJournal.for_profile(profile)
+    if args.fresh:
+        journal.reset()
+    
+    # Serve unchanged scenes from the journal or the render cache
+    cache = None if args.no_cache else RenderCache(max_bytes=int(args.cache_size * 1024 ** 3))
+    videos = {}
+    keys = {}
+    failed = {}
+    pending = []
+    for index, (scene_file, scene_class) in enumerate(SCENES):
+        if not Path(scene_file).exists():
+            print(f"❌ Scene file not found: {scene_file}")
+            failed[index] = f"Scene file not found: {scene_file}"
+            continue
+        keys[index] = cache_key(
+            scene_file, scene_class, [*profile.cache_flags, *renderer_flags(renderers[index])]
+        )
+        done = journal.completed(f"render:{scene_class}", {"key": keys[index]})
+        if done and journal.completed(f"validate:{scene_class}", {"key": keys[index], "video": done["video"]}):
+            if validate_video(done["video"])[0]:
+                print(f"⏭️  Already rendered: {scene_class} -> {done['video']}")
+                videos[index] = Path(done["video"])
+                continue
+        if cache is not None:
+            cached = cache.get(keys[index])
+            if cached is not None:
+                print(f"♻️  Cache hit: {scene_class} -> {cached}")
+                journal.start(f"render:{scene_class}", {"key": keys[index]})
+                journal.finish(f"render:{scene_class}", video=str(cached), source="cache")
+                videos[index] = cached
+                continue
+        journal.start(f"render:{scene_class}", {"key": keys[index]})
+        pending.append((index, scene_file, scene_class))
+    
+    # Each scene is journaled the moment it finishes, so a preempted run keeps it
+    def record_render(index, video_path, error):
+        step = f"render:{SCENES[index][1]}"
+        if error:
+            journal.fail(step, error)
+        else:
+            journal.finish(step, video=str(video_path), source="render")
+    
+    # Render the rest
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    shard_plans = {}
+    if (jobs > 1 or args.farm) and args.shards > 1:
+        for index, scene_file, scene_class in pending:
+            if scene_class in SHARDED_SCENES:
+                shard_plans[index] = plan_shards(scene_file, scene_class, args.shards)
+                print(f"🔪 {scene_class}: {len(shard_plans[index])} shards {shard_plans[index]}")
+    if args.farm and pending:
+        rendered = render_scenes_farm(
+            pending, profile, parse_address(args.farm), shard_plans, renderers,
+            on_result=record_render, local_workers=args.farm_workers,
+        )
+    elif jobs > 1 and (len(pending) > 1 or shard_plans):
+        rendered = render_scenes_parallel(pending, jobs, profile, shard_plans, renderers, on_result=record_render)
+    else:
+        rendered = render_scenes_serial(
+            pending, profile, renderers, on_result=record_render, preview=not args.no_preview
+        )
+    
+    for index, _, scene_class in pending:
+        if index not in rendered:
+            failed[index] = journal.steps[f"render:{scene_class}"].get("error", "render failed")
+    for index, video_path in rendered.items():
+        if cache is not None:
+            scene_class = SCENES[index][1]
+            video_path = cache.put(keys[index], video_path, label=scene_class)
+            journal.finish(f"render:{scene_class}", video=str(video_path), source="render")
+        videos[index] = video_path
+    if cache is not None:
+        cache.report()
+    
+    # Validate new outputs: duration must match the scene's animations, frame
+    # count must match the duration
+    durations = {}
+    for index in sorted(videos):
+        scene_file, scene_class = SCENES[index]
+        step = f"validate:{scene_class}"
+        inputs = {"key": keys[index], "video": str(videos[index])}
+        done = journal.completed(step, inputs)
+        if done:
+            durations[index] = done.get("duration")
+            continue
+        journal.start(step, inputs)
+        try:
+            animations = animation_durations(scene_file, scene_class)
+            expected = sum(animations)
+            # Each animation may round to a frame either way
+            tolerance = (len(animations) + 1) / profile.fps
+        except (subprocess.CalledProcessError, ValueError, IndexError) as e:
+            print(f"⚠️  Couldn't compute the expected duration of {scene_class} ({e}); checking frames only")
+            expected, tolerance = None, 0.0
+        ok, details = validate_video(videos[index], expected, tolerance)
+        if ok:
+            journal.finish(step, **details)
+            durations[index] = details.get("duration")
+        else:
+            print(f"❌ {scene_class} failed validation: {details['error']}")
+            journal.fail(step, details["error"])
+            failed[index] = details["error"]
+            del videos[index]
+    
+    if failed:
+        print(f"\n❌ {len(failed)} scene(s) failed:")
+        for index, error in sorted(failed.items()):
+            print(f"   {SCENES[index][1]}: {error.strip().splitlines()[-1] if error.strip() else error}")
+        if not args.allow_missing:
+            print("Fix them and rerun to resume, or pass --allow-missing to compile without them.")
+            sys.exit(1)
+        print("⚠️  --allow-missing: compiling the film without them")
+    
+    rendered_videos = [videos[index] for index in sorted(videos)]
+    if not rendered_videos:
+        print("❌ No videos were rendered successfully.")
+        sys.exit(1)
+    
+    # Transition at each cut, into the later scene
+    try:
+        override = parse_transition(args.transition) if args.transition else None
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    transitions = [
+        override if args.transition else TRANSITIONS.get(SCENES[index][1])
+        for index in sorted(videos)[1:]
+    ]
+    
+    # Compile, unless the film is already built from exactly these inputs
+    compile_inputs = {
+        "videos": [[str(path), path.stat().st_size, path.stat().st_mtime] for path in map(Path, rendered_videos)],
+        "transitions": [[t.kind, t.duration] if t else None for t in transitions],
+        "reencode": args.reencode,
+    }
+    final_video = profile.film_path()
+    if journal.completed("compile", compile_inputs) and validate_video(final_video)[0]:
+        print(f"\n✅ Film is up to date: {final_video}")
+    else:
+        journal.start("compile", compile_inputs)
+        final_video = compile_videos(
+            rendered_videos, profile, reencode=args.reencode,
+            encode_jobs=args.encode_jobs or None, measure_single=args.measure_encode,
+            transitions=transitions,
+        )
+        expected = None
+        if all(durations.get(index) is not None for index in videos):
+            expected = sum(durations[index] for index in videos) - sum(t.duration for t in transitions if t)
+        ok, details = validate_video(final_video, expected, tolerance=2 * len(rendered_videos) / profile.fps)
+        if not ok:
+            journal.fail("compile", details["error"])
+            print(f"❌ Compiled film failed validation: {details['error']}")
+            sys.exit(1)
+        journal.finish("compile", film=str(final_video), **details)
+    
+    # Delivery renditions: one decode of the master, one encode per rung
+    if renditions:
+        deliver_renditions(final_video, renditions, journal)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
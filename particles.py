@@ -0,0 +1,141 @@
+from manim import *
+import numpy as np
+
+from dot_cloud import dot_points, opacity_bins
+
+
+def _hash01(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Cheap deterministic hash of two integer arrays to [0, 1)."""
+    x = np.sin(a * 12.9898 + b * 78.233) * 43758.5453
+    return x - np.floor(x)
+
+
+class ParticleEmitter(VGroup):
+    """Vectorized particle system drawn as a few batched paths.
+
+    Position, velocity, birth time, lifetime, radius and opacity live in
+    NumPy arrays. Particle state is a closed-form function of emitter time
+    (constant gravity, linear drag), so one updater evaluates the whole
+    system per frame and the result doesn't depend on frame stepping: a
+    skipped animation or a sharded render lands on exactly the same state.
+
+    count particles are emitted at `rate` per second (all at once when rate
+    is None). With loop=True each particle respawns when its life ends and
+    the system starts pre-warmed, giving a steady field from a fixed pool.
+    Opacity ramps in and out over the fade_in/fade_out fractions of each
+    particle's life. Each frame, live particles are drawn in up to
+    opacity_levels paths, binned over that frame's opacity range (see
+    opacity_bins). Moving self.anchor moves the whole system. Animating
+    the emitter itself (e.g. .animate.shift) suspends its updater for the
+    animation unless suspend_mobject_updating=False is passed.
+    """
+
+    def __init__(
+        self,
+        origin=ORIGIN,
+        count: int = 100,
+        rate=None,
+        loop: bool = False,
+        lifetime=(1.0, 2.0),
+        spawn_box=((0.0, 0.0), (0.0, 0.0)),
+        velocity=((-1.0, 1.0), (-1.0, 1.0)),
+        gravity=ORIGIN,
+        drag: float = 0.0,
+        radius_range=(0.01, 0.03),
+        opacity_range=(0.4, 0.8),
+        fade_in: float = 0.0,
+        fade_out: float = 1.0,
+        color: str = WHITE,
+        opacity_levels: int = 8,
+        rng=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        rng = np.random if rng is None else rng
+        (x0, x1), (y0, y1) = spawn_box
+        (vx0, vx1), (vy0, vy1) = velocity
+
+        self.lifetime = rng.uniform(lifetime[0], lifetime[1], count)
+        if loop:
+            # Pre-warmed: particles are already part-way through their lives
+            self.birth = -rng.uniform(0, 1, count) * self.lifetime
+        elif rate is None:
+            self.birth = np.zeros(count)
+        else:
+            self.birth = np.arange(count) / rate
+        self.spawn = np.column_stack([rng.uniform(x0, x1, count), rng.uniform(y0, y1, count), np.zeros(count)])
+        self.spawn_size = np.array([x1 - x0, y1 - y0, 0.0])
+        self.velocity = np.column_stack([rng.uniform(vx0, vx1, count), rng.uniform(vy0, vy1, count), np.zeros(count)])
+        self.radii = rng.uniform(radius_range[0], radius_range[1], count)
+        self.opacities = rng.uniform(opacity_range[0], opacity_range[1], count)
+        self.index = np.arange(count)
+
+        self.loop = loop
+        self.gravity = np.asarray(gravity, dtype=float)
+        self.drag = drag
+        self.fade_in = fade_in
+        self.fade_out = fade_out
+        self.opacity_levels = opacity_levels
+        self.time = 0.0
+
+        # Invisible anchor: transforms applied to the emitter move it, and
+        # particles are placed relative to it
+        self.anchor = VMobject(fill_opacity=0, stroke_width=0)
+        self.anchor.set_points(np.repeat(np.asarray(origin, dtype=float)[None, :], 4, axis=0))
+        self.add(self.anchor)
+        self.layers = [
+            VMobject(fill_color=color, fill_opacity=(level + 1) / opacity_levels, stroke_width=0)
+            for level in range(opacity_levels)
+        ]
+        self.add(*self.layers)
+
+        self.update_particles()
+        self.add_updater(lambda m, dt: m.advance(dt))
+
+    def advance(self, dt: float) -> "ParticleEmitter":
+        self.time += dt
+        return self.update_particles()
+
+    def particle_state(self, t: float):
+        """(alive mask, positions, opacities) of every particle at time t."""
+        age = t - self.birth
+        if self.loop:
+            cycle = np.floor(age / self.lifetime)
+            age = age - cycle * self.lifetime
+            # Respawned particles start from a new spot in the spawn box
+            jitter = np.column_stack([
+                _hash01(self.index, cycle), _hash01(self.index + 7919, cycle), np.zeros(len(age))
+            ])
+            spawn = self.spawn + (jitter - 0.5) * self.spawn_size
+            alive = np.ones(len(age), dtype=bool)
+        else:
+            spawn = self.spawn
+            alive = (age >= 0) & (age < self.lifetime)
+
+        tau = np.clip(age, 0, None)[:, None]
+        if self.drag > 0:
+            terminal = self.gravity / self.drag
+            decay = (1 - np.exp(-self.drag * tau)) / self.drag
+            offset = terminal * tau + (self.velocity - terminal) * decay
+        else:
+            offset = self.velocity * tau + 0.5 * self.gravity * tau ** 2
+        positions = self.anchor.get_center() + spawn + offset
+
+        life = np.clip(age / self.lifetime, 0, 1)
+        envelope = np.ones(len(life))
+        if self.fade_in > 0:
+            envelope = np.minimum(envelope, life / self.fade_in)
+        if self.fade_out > 0:
+            envelope = np.minimum(envelope, (1 - life) / self.fade_out)
+        return alive, positions, self.opacities * np.clip(envelope, 0, 1)
+
+    def update_particles(self) -> "ParticleEmitter":
+        alive, positions, opacities = self.particle_state(self.time)
+        visible = np.flatnonzero(alive & (opacities > 0))
+        bins, values = opacity_bins(opacities[visible], self.opacity_levels)
+        for level, layer in enumerate(self.layers):
+            dots = visible[bins == level]
+            layer.set_points(dot_points(positions[dots], self.radii[dots]))
+            if len(dots):
+                layer.set_fill(opacity=values[level])
+        return self
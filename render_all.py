@@ -8,6 +8,8 @@ import sys
 from pathlib import Path
 from moviepy import VideoFileClip, concatenate_videoclips
 
+from film_assembly import assemble_film, can_stream_copy
+
 # Scene files to render (in order)
 SCENES = [
     ("intro.py", "IntroScene"),
@@ -70,6 +72,16 @@ def main():
     # Compile all videos
     print(f"\n🎞️  Compiling {len(rendered_videos)} videos...")
     
+    # Lossless join when FFmpeg is available; only mismatched scenes are re-encoded
+    if can_stream_copy():
+        try:
+            assemble_film(rendered_videos, FINAL_VIDEO)
+            print(f"\n🎉 Complete film rendered: {FINAL_VIDEO}")
+            print(f"📁 File size: {FINAL_VIDEO.stat().st_size / (1024*1024):.1f} MB")
+            return
+        except (subprocess.CalledProcessError, ValueError) as e:
+            print(f"⚠️  Stream-copy assembly failed ({e}), falling back to re-encode")
+    
     try:
         clips = []
         for video_path in rendered_videos:
@@ -0,0 +1,141 @@
+"""
+Persistent content-hash cache for rendered scene videos.
+
+A scene is keyed on everything that can change its pixels: the scene source,
+local modules it imports, the assets it references, the scene class name, the
+render flags and the Manim version. Unchanged scenes are served straight from
+the cache instead of being re-rendered.
+"""
+import hashlib
+import json
+import re
+import shutil
+import time
+from importlib import metadata
+from pathlib import Path
+
+CACHE_DIR = Path("media/render_cache")
+INDEX_FILE = "index.json"
+DEFAULT_MAX_BYTES = 5 * 1024 ** 3  # 5 GB
+
+# "assets/logo.svg", 'assets/foo.png', ...
+ASSET_PATTERN = re.compile(r"""["'](assets/[^"']+)["']""")
+# "import foo" / "from foo import bar" at the start of a line
+IMPORT_PATTERN = re.compile(r"^\s*(?:from|import)\s+([A-Za-z_][A-Za-z0-9_]*)", re.MULTILINE)
+
+
+def manim_version():
+    """Installed Manim version, or "unknown" if it can't be determined."""
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def scene_dependencies(scene_file):
+    """Scene source plus every local module and asset it (transitively) uses."""
+    root = Path(scene_file).resolve().parent
+    seen = set()
+    pending = [Path(scene_file).resolve()]
+    while pending:
+        path = pending.pop()
+        if path in seen or not path.exists():
+            continue
+        seen.add(path)
+        if path.suffix != ".py":
+            continue
+        source = path.read_text(encoding="utf-8")
+        for asset in ASSET_PATTERN.findall(source):
+            pending.append(root / asset)
+        for module in IMPORT_PATTERN.findall(source):
+            candidate = root / f"{module}.py"
+            if candidate.exists():
+                pending.append(candidate)
+    return sorted(seen, key=lambda p: str(p))
+
+
+def cache_key(scene_file, scene_class, flags):
+    """Hex digest identifying one render of scene_class with the given flags."""
+    digest = hashlib.sha256()
+    digest.update(f"{scene_class}\0{' '.join(flags)}\0{manim_version()}\0".encode())
+    root = Path(scene_file).resolve().parent
+    for path in scene_dependencies(scene_file):
+        digest.update(str(path.resolve().relative_to(root)).encode() + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Size-bounded LRU store of rendered scene videos."""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Entries used by the current run are never evicted under it
+        self._pinned = set()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index = self._load_index()
+
+    def _load_index(self):
+        index_path = self.cache_dir / INDEX_FILE
+        if not index_path.exists():
+            return {}
+        try:
+            return json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        (self.cache_dir / INDEX_FILE).write_text(json.dumps(self._index, indent=2))
+
+    def _entry_path(self, key):
+        return self.cache_dir / f"{key}.mp4"
+
+    def get(self, key):
+        """Return the cached video for key, or None on a miss."""
+        path = self._entry_path(key)
+        if key in self._index and path.exists():
+            self._index[key]["last_used"] = time.time()
+            self._save_index()
+            self.hits += 1
+            self._pinned.add(key)
+            return path
+        self._index.pop(key, None)
+        self.misses += 1
+        return None
+
+    def put(self, key, video_path, label=""):
+        """Store a copy of video_path under key and evict old entries."""
+        path = self._entry_path(key)
+        shutil.copy2(video_path, path)
+        self._index[key] = {
+            "label": label,
+            "size": path.stat().st_size,
+            "last_used": time.time(),
+        }
+        self._pinned.add(key)
+        self.evict()
+        return path
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits max_bytes."""
+        total = sum(entry["size"] for entry in self._index.values())
+        for key in sorted(self._index, key=lambda k: self._index[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if key in self._pinned:
+                continue
+            total -= self._index[key]["size"]
+            self._entry_path(key).unlink(missing_ok=True)
+            print(f"🗑️  Evicted cached render: {self._index[key]['label'] or key}")
+            del self._index[key]
+        self._save_index()
+
+    def report(self):
+        total = sum(entry["size"] for entry in self._index.values())
+        print(
+            f"📦 Render cache: {self.hits} hit(s), {self.misses} miss(es), "
+            f"{len(self._index)} entries, {total / (1024 * 1024):.1f} MB"
+        )
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Local multi-node render farm: one coordinator, any number of workers.
+
+The coordinator (started by `main.py --farm HOST:PORT`) queues scene and
+shard render jobs and serves them over TCP. Workers, on this machine or on
+others with the same checkout, pull a job, render it with Manim, and upload
+the video with its SHA-256 checksum. The coordinator verifies the checksum
+and stores the artifact. A worker that stops sending heartbeats has its job
+re-queued for another worker.
+
+    python main.py --farm 0.0.0.0:8765 --shards 4          # coordinator
+    python render_farm.py worker --connect coordinator-host:8765
+
+Protocol: one JSON line per request, optionally followed by `size` bytes of
+payload, answered by one JSON line. Set FARM_TOKEN on every node to reject
+clients that don't share it.
+"""
+import argparse
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from render_profiles import DETAIL_ENV
+
+DEFAULT_PORT = 8765
+FARM_ROOT = Path("media/farm")
+WORKER_MEDIA_ROOT = Path("media/farm_workers")
+HEARTBEAT_INTERVAL = 5.0  # seconds between worker heartbeats
+HEARTBEAT_TIMEOUT = 30.0  # silence after which a job is re-queued
+MAX_ATTEMPTS = 3
+CHUNK_SIZE = 1024 * 1024
+TOKEN_ENV = "FARM_TOKEN"
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def parse_address(address, default_host="127.0.0.1"):
+    """("host", port) from "host:port", ":port" or "host"."""
+    host, _, port = address.rpartition(":") if ":" in address else (address, "", "")
+    return host or default_host, int(port or DEFAULT_PORT)
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class FarmJob:
+    job_id: int
+    index: int
+    scene_file: str
+    scene_class: str
+    flags: list
+    quality_dir: str
+    renderer: str
+    animation_range: list = None
+    shard: int = None
+    env: dict = field(default_factory=dict)  # extra environment for the Manim process
+    status: str = QUEUED
+    worker: str = None
+    heartbeat: float = 0.0
+    attempts: int = 0
+    artifact: str = None
+    errors: list = field(default_factory=list)
+
+    @property
+    def label(self):
+        return self.scene_class if self.shard is None else f"{self.scene_class} shard {self.shard}"
+
+    def spec(self):
+        """What a worker needs to render the job."""
+        keys = ("job_id", "scene_file", "scene_class", "flags", "quality_dir", "renderer", "animation_range", "env")
+        return {key: value for key, value in asdict(self).items() if key in keys}
+
+
+class Coordinator:
+    """Job queue served over TCP, with heartbeat-based re-queueing."""
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, artifact_dir=FARM_ROOT,
+                 heartbeat_timeout=HEARTBEAT_TIMEOUT, max_attempts=MAX_ATTEMPTS):
+        self.artifact_dir = Path(artifact_dir)
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_attempts = max_attempts
+        self.token = os.environ.get(TOKEN_ENV)
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.server = _FarmServer((host, port), _FarmHandler, self)
+        self.thread = None
+
+    @property
+    def address(self):
+        return self.server.server_address
+
+    def add_job(self, **spec):
+        with self.lock:
+            job = FarmJob(job_id=len(self.jobs) + 1, **spec)
+            self.jobs[job.job_id] = job
+            return job
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        host, port = self.address
+        print(f"🛰️  Farm coordinator listening on {host}:{port} ({len(self.jobs)} jobs)")
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def drained(self):
+        return all(job.status in (DONE, FAILED) for job in self.jobs.values())
+
+    def _owned(self, worker, job_id):
+        """The job if worker is currently running it, else None. Call with the lock held."""
+        job = self.jobs.get(job_id)
+        if job is None or job.status != RUNNING or job.worker != worker:
+            return None
+        return job
+
+    # Request handlers; each runs on a server thread
+
+    def claim(self, worker):
+        with self.lock:
+            for job in self.jobs.values():
+                if job.status == QUEUED:
+                    job.status = RUNNING
+                    job.worker = worker
+                    job.heartbeat = time.monotonic()
+                    job.attempts += 1
+                    print(f"📤 {job.label} -> {worker} (attempt {job.attempts})")
+                    return {"job": job.spec()}
+            return {"job": None, "drained": self.drained()}
+
+    def heartbeat(self, worker, job_id):
+        with self.lock:
+            job = self._owned(worker, job_id)
+            if job is None:
+                # Tell the worker its job was re-queued and handed to someone else
+                return {"ok": False}
+            job.heartbeat = time.monotonic()
+            return {"ok": True}
+
+    def complete(self, worker, job_id, sha256, size, stream):
+        with self.lock:
+            job = self._owned(worker, job_id)
+            if job is not None:
+                # Uploading counts as a sign of life
+                job.heartbeat = time.monotonic()
+        if job is None:
+            # Re-queued, failed or finished by someone else: read past the
+            # payload so the worker still gets the reply
+            remaining = size
+            while remaining:
+                chunk = stream.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+            return {"ok": False, "error": "job is not assigned to this worker"}
+
+        path = self.artifact_dir / f"{job.scene_class}_{job_id}_{uuid.uuid4().hex[:8]}.mp4"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        remaining = size
+        with open(path, "wb") as f:
+            while remaining:
+                chunk = stream.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                digest.update(chunk)
+                f.write(chunk)
+                remaining -= len(chunk)
+        if remaining or digest.hexdigest() != sha256:
+            path.unlink(missing_ok=True)
+            self.fail(worker, job_id, "artifact checksum mismatch")
+            return {"ok": False, "error": "checksum mismatch"}
+
+        with self.lock:
+            if self._owned(worker, job_id) is None:
+                # Re-queued while the upload was in flight
+                path.unlink(missing_ok=True)
+                return {"ok": False, "error": "job is not assigned to this worker"}
+            job.status = DONE
+            job.artifact = str(path)
+        print(f"📥 {job.label} from {worker} ({size / (1024 * 1024):.1f} MB, sha256 {sha256[:12]})")
+        return {"ok": True}
+
+    def fail(self, worker, job_id, error):
+        with self.lock:
+            job = self._owned(worker, job_id)
+            if job is None:
+                # Done already, or re-queued and now another worker's job
+                return {"ok": True}
+            job.errors.append(f"{worker}: {error}"[-2000:])
+            self._retry_or_fail(job)
+        return {"ok": True}
+
+    def _retry_or_fail(self, job):
+        job.worker = None
+        if job.attempts >= self.max_attempts:
+            job.status = FAILED
+            print(f"❌ {job.label} failed after {job.attempts} attempt(s)")
+        else:
+            job.status = QUEUED
+            print(f"🔁 Re-queued {job.label}")
+
+    def requeue_stale(self):
+        """Re-queue running jobs whose worker stopped sending heartbeats."""
+        now = time.monotonic()
+        with self.lock:
+            for job in self.jobs.values():
+                if job.status == RUNNING and now - job.heartbeat > self.heartbeat_timeout:
+                    job.errors.append(f"{job.worker}: heartbeat timeout")
+                    print(f"💀 {job.worker} went silent on {job.label}")
+                    self._retry_or_fail(job)
+
+    def wait(self, on_finished=None, poll=1.0):
+        """Block until every job is done or failed.
+
+        on_finished(job) is called once per job as it reaches either state.
+        """
+        reported = set()
+        while True:
+            self.requeue_stale()
+            with self.lock:
+                finished = [job for job in self.jobs.values()
+                            if job.status in (DONE, FAILED) and job.job_id not in reported]
+            for job in finished:
+                reported.add(job.job_id)
+                if on_finished:
+                    on_finished(job)
+            if len(reported) == len(self.jobs):
+                return
+            time.sleep(poll)
+
+
+class _FarmServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address, handler, coordinator):
+        self.coordinator = coordinator
+        super().__init__(address, handler)
+
+
+class _FarmHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            message = json.loads(self.rfile.readline())
+        except ValueError:
+            message = None
+        if isinstance(message, dict):
+            try:
+                reply = self.dispatch(message)
+            except (KeyError, TypeError) as e:
+                reply = {"ok": False, "error": f"malformed {message.get('op')!r} request: {e!r}"}
+        else:
+            reply = {"ok": False, "error": "malformed request"}
+        self.wfile.write((json.dumps(reply) + "\n").encode())
+
+    def dispatch(self, message):
+        coordinator = self.server.coordinator
+        if coordinator.token and message.get("token") != coordinator.token:
+            return {"ok": False, "error": "bad token"}
+        if message.get("op") == "claim":
+            return coordinator.claim(message["worker"])
+        if message.get("op") == "heartbeat":
+            return coordinator.heartbeat(message["worker"], message["job_id"])
+        if message.get("op") == "complete":
+            return coordinator.complete(
+                message["worker"], message["job_id"], message["sha256"], int(message["size"]), self.rfile
+            )
+        if message.get("op") == "fail":
+            return coordinator.fail(message["worker"], message["job_id"], message.get("error", ""))
+        return {"ok": False, "error": f"unknown op {message.get('op')!r}"}
+
+
+def send(address, message, payload_path=None, timeout=60.0):
+    """Send one request (and optional file payload) to the coordinator; return its reply.
+
+    Raises OSError if the connection fails and ValueError if the reply is
+    empty or not JSON.
+    """
+    message = {**message, "token": os.environ.get(TOKEN_ENV)}
+    with socket.create_connection(address, timeout=timeout) as sock:
+        stream = sock.makefile("rwb")
+        stream.write((json.dumps(message) + "\n").encode())
+        if payload_path is not None:
+            with open(payload_path, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    stream.write(chunk)
+        stream.flush()
+        return json.loads(stream.readline())
+
+
+def _heartbeat_loop(address, worker, job_id, stop, interval):
+    while not stop.wait(interval):
+        try:
+            send(address, {"op": "heartbeat", "worker": worker, "job_id": job_id})
+        except (OSError, ValueError):
+            pass  # Coordinator busy or restarting; it re-queues only after a long silence
+
+
+def _report_failure(address, worker, job_id, error):
+    try:
+        send(address, {"op": "fail", "worker": worker, "job_id": job_id, "error": error})
+    except (OSError, ValueError):
+        pass  # The coordinator re-queues the job once its heartbeats stop
+
+
+def job_env(job, renderer_env, allowed):
+    """Environment for one job's Manim process.
+
+    Starts from a copy of renderer_env (the worker's own environment) and
+    takes only the allowed keys from the job, so coordinator settings never
+    outlive the job and can't inject anything else. Allowed keys the job
+    doesn't set are cleared: the coordinator left them off.
+    """
+    env = dict(renderer_env)
+    sent = job.get("env") or {}
+    for key in allowed:
+        env.pop(key, None)
+        if key in sent:
+            env[key] = str(sent[key])
+    return env
+
+
+def run_worker(address, worker=None, exit_when_drained=False, poll=1.0, heartbeat_interval=HEARTBEAT_INTERVAL):
+    """Pull and render jobs from the coordinator at address until stopped."""
+    # Imported here: main.py imports this module for the coordinator side
+    from dirty_tiles import DIRTY_TILES_ENV
+    from main import render_scene_worker
+    from renderers import renderer_env
+
+    worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+    print(f"🔧 Worker {worker} -> {address[0]}:{address[1]}")
+    while True:
+        try:
+            reply = send(address, {"op": "claim", "worker": worker})
+        except (OSError, ValueError):
+            if exit_when_drained:
+                return
+            time.sleep(poll)
+            continue
+        job = reply.get("job")
+        if job is None:
+            if reply.get("drained") and exit_when_drained:
+                return
+            time.sleep(poll)
+            continue
+
+        stop = threading.Event()
+        beat = threading.Thread(
+            target=_heartbeat_loop, args=(address, worker, job["job_id"], stop, heartbeat_interval), daemon=True
+        )
+        beat.start()
+        media_dir = WORKER_MEDIA_ROOT / worker / f"job{job['job_id']}"
+        env = job_env(job, renderer_env(job["renderer"]), (DETAIL_ENV, DIRTY_TILES_ENV))
+        try:
+            video_path, elapsed, error, _ = render_scene_worker(
+                job["scene_file"], job["scene_class"], media_dir, job["flags"], job["quality_dir"],
+                job["animation_range"], job["renderer"], env=env,
+            )
+        finally:
+            stop.set()
+            beat.join()
+        if error:
+            print(f"❌ Job {job['job_id']} ({job['scene_class']}) failed after {elapsed:.1f}s")
+            _report_failure(address, worker, job["job_id"], error)
+            continue
+        message = {
+            "op": "complete", "worker": worker, "job_id": job["job_id"],
+            "sha256": sha256_file(video_path), "size": Path(video_path).stat().st_size,
+        }
+        try:
+            reply = send(address, message, payload_path=video_path)
+        except (OSError, ValueError) as e:
+            print(f"❌ Job {job['job_id']} ({job['scene_class']}) upload failed: {e}")
+            _report_failure(address, worker, job["job_id"], f"upload failed: {e}")
+            continue
+        status = "uploaded" if reply.get("ok") else f"rejected ({reply.get('error')})"
+        print(f"✅ Job {job['job_id']} ({job['scene_class']}) rendered in {elapsed:.1f}s, {status}")
+
+
+def start_local_workers(address, count):
+    """Start count worker processes on this machine; returns the Popen handles."""
+    host, port = address
+    host = "127.0.0.1" if host in ("0.0.0.0", "") else host
+    cmd = [sys.executable, str(Path(__file__).resolve()), "worker",
+           "--connect", f"{host}:{port}", "--exit-when-drained"]
+    return [
+        subprocess.Popen([*cmd, "--name", f"{socket.gethostname()}-local{i}"])
+        for i in range(count)
+    ]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render farm worker.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    worker = sub.add_parser("worker", help="Pull render jobs from a coordinator.")
+    worker.add_argument("--connect", default=f"127.0.0.1:{DEFAULT_PORT}",
+                        help=f"Coordinator HOST:PORT (default: 127.0.0.1:{DEFAULT_PORT}).")
+    worker.add_argument("--name", default=None, help="Worker name (default: hostname-pid).")
+    worker.add_argument("--exit-when-drained", action="store_true",
+                        help="Exit once the coordinator has no more jobs (or is gone).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "worker":
+        try:
+            run_worker(parse_address(args.connect), args.name, args.exit_when_drained)
+        except KeyboardInterrupt:
+            print("\n👋 Worker stopped")
+
+
+if __name__ == "__main__":
+    main()
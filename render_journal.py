@@ -0,0 +1,114 @@
+"""
+Resumable journal of the film build.
+
+Every pipeline step (scene render, validation, compile) is recorded with its
+inputs, outputs and status in media/journal/<profile>.json, which is saved
+atomically after each step. A rerun skips steps that are done with the same
+inputs and whose outputs still validate, and resumes from the first
+incomplete one. A preempted build keeps every scene that finished.
+"""
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+
+from film_assembly import ffprobe_exe, probe_video
+
+JOURNAL_DIR = Path("media/journal")
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+def video_stats(video_path):
+    """(duration seconds, frame count, fps) of video_path's first video stream."""
+    info = probe_video(video_path)
+    num, den = (int(x) for x in info["r_frame_rate"].split("/"))
+    fps = num / den
+    duration = float(info["duration"]) if info.get("duration", "N/A") != "N/A" else None
+    frames = int(info["nb_frames"]) if info.get("nb_frames", "N/A") != "N/A" else None
+    if duration is None and frames is None:
+        raise ValueError(f"{video_path} reports neither duration nor frame count")
+    if duration is None:
+        duration = frames / fps
+    if frames is None:
+        frames = round(duration * fps)
+    return duration, frames, fps
+
+
+def validate_video(video_path, expected_duration=None, tolerance=0.1):
+    """Check video_path is complete; returns (ok, details).
+
+    The file must probe cleanly, have a positive duration, a frame count that
+    agrees with duration x fps (to one frame), and, when expected_duration is
+    given, a duration within tolerance seconds of it.
+    """
+    path = Path(video_path)
+    if not path.exists():
+        return False, {"error": f"missing: {path}"}
+    if ffprobe_exe() is None:
+        # Can't look inside; a non-empty file is the best we can check
+        ok = path.stat().st_size > 0
+        return ok, {"size": path.stat().st_size} if ok else {"error": "empty file"}
+    try:
+        duration, frames, fps = video_stats(path)
+    except (subprocess.CalledProcessError, ValueError, KeyError) as e:
+        return False, {"error": f"unreadable: {e}"}
+    details = {"duration": round(duration, 3), "frames": frames}
+    if duration <= 0 or frames <= 0:
+        return False, {**details, "error": "empty video"}
+    if abs(frames - duration * fps) > 1.5:
+        return False, {**details, "error": f"{frames} frames don't fill {duration:.3f}s at {fps:g} fps"}
+    if expected_duration is not None and abs(duration - expected_duration) > tolerance:
+        return False, {**details, "error": f"expected {expected_duration:.3f}s"}
+    return True, details
+
+
+class RenderJournal:
+    """Step log of one profile's film build."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.steps = {}
+        if self.path.exists():
+            try:
+                self.steps = json.loads(self.path.read_text()).get("steps", {})
+            except (OSError, ValueError):
+                print(f"⚠️  Ignoring unreadable render journal: {self.path}")
+
+    @classmethod
+    def for_profile(cls, profile, journal_dir=JOURNAL_DIR):
+        return cls(Path(journal_dir) / f"{profile.name}.json")
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"steps": self.steps}, indent=2))
+        os.replace(tmp, self.path)
+
+    def reset(self):
+        self.steps = {}
+        self._save()
+
+    def completed(self, name, inputs):
+        """Outputs of step name if it finished with the same inputs, else None."""
+        step = self.steps.get(name)
+        if step and step["status"] == DONE and step["inputs"] == inputs:
+            return step["outputs"]
+        return None
+
+    def start(self, name, inputs):
+        self.steps[name] = {"status": PENDING, "inputs": inputs, "outputs": {}, "started": time.time()}
+        self._save()
+
+    def finish(self, name, **outputs):
+        step = self.steps[name]
+        step.update(status=DONE, outputs=outputs, finished=time.time())
+        self._save()
+
+    def fail(self, name, error):
+        step = self.steps[name]
+        step.update(status=FAILED, error=str(error)[-2000:], finished=time.time())
+        self._save()
@@ -0,0 +1,63 @@
+"""
+Named render profiles for the film pipeline.
+
+A profile fixes resolution, frame rate, scene detail (star and particle
+counts) and the film bitrate. Output paths are derived from it, so a draft
+and a final render never overwrite each other.
+"""
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+# Environment variable the pipeline uses to pass scene detail to Manim
+DETAIL_ENV = "FILM_DETAIL"
+
+
+@dataclass(frozen=True)
+class RenderProfile:
+    name: str
+    width: int
+    height: int
+    fps: int
+    detail: float  # Multiplier for star and particle counts
+    bitrate: str
+
+    @property
+    def quality_dir(self):
+        """Directory name Manim uses for this resolution/frame rate, e.g. "1080p60"."""
+        return f"{self.height}p{self.fps}"
+
+    @property
+    def manim_flags(self):
+        return ["-r", f"{self.width},{self.height}", "--fps", str(self.fps)]
+
+    @property
+    def cache_flags(self):
+        """Everything in the profile that changes rendered pixels."""
+        return [*self.manim_flags, f"detail={self.detail}"]
+
+    def film_path(self, compiled_root=Path("media/videos/Compiled")):
+        return Path(compiled_root) / self.quality_dir / "Complete_Film.mp4"
+
+
+PROFILES = {
+    # Editorial timing review: a fraction of the final render cost
+    "draft": RenderProfile("draft", 640, 360, 15, detail=0.25, bitrate="1000k"),
+    "review": RenderProfile("review", 1280, 720, 30, detail=0.6, bitrate="4000k"),
+    "final": RenderProfile("final", 1920, 1080, 60, detail=1.0, bitrate="8000k"),
+    "final-4k": RenderProfile("final-4k", 3840, 2160, 60, detail=1.0, bitrate="35000k"),
+}
+DEFAULT_PROFILE = "final"
+
+
+def scene_detail():
+    """Detail multiplier for the current render (1.0 outside the pipeline)."""
+    try:
+        return float(os.environ.get(DETAIL_ENV, "1.0"))
+    except ValueError:
+        return 1.0
+
+
+def scaled_count(count):
+    """count scaled by the active profile's detail, never below 1."""
+    return max(1, round(count * scene_detail()))
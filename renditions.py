@@ -0,0 +1,126 @@
+"""
+Delivery renditions from a single master render.
+
+The film is rendered once, at the render profile that covers the largest
+requested rendition. The master is then decoded once by a single FFmpeg
+process: its frames are split, each branch is scaled to a delivery
+resolution, and every rendition is encoded in the same pass at its own rung
+of the bitrate ladder (target bitrate plus VBV max rate and buffer). Manim's
+vector rasterization runs only once, however many resolutions are delivered.
+"""
+import subprocess
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from chunked_encode import ENCODE_PRESET
+from film_assembly import ffmpeg_exe, probe_video
+
+DELIVERY_ROOT = Path("media/videos/Delivery")
+
+
+@dataclass(frozen=True)
+class Rendition:
+    name: str
+    width: int
+    height: int
+    bitrate: str  # target, e.g. "8000k"
+    maxrate: str
+    bufsize: str
+
+    def path(self, delivery_root=DELIVERY_ROOT):
+        return Path(delivery_root) / f"Complete_Film_{self.name}.mp4"
+
+
+# Bitrate ladder, one rung per delivery resolution
+LADDER = {
+    "2160p": Rendition("2160p", 3840, 2160, bitrate="35000k", maxrate="45000k", bufsize="70000k"),
+    "1080p": Rendition("1080p", 1920, 1080, bitrate="8000k", maxrate="10000k", bufsize="16000k"),
+    "720p": Rendition("720p", 1280, 720, bitrate="4000k", maxrate="5000k", bufsize="8000k"),
+}
+ALIASES = {"4k": "2160p", "uhd": "2160p", "fhd": "1080p", "hd": "720p"}
+
+
+def parse_renditions(spec):
+    """Renditions from e.g. "4k,1080p,720p:3000k", largest first.
+
+    NAME:BITRATE overrides a rung's target bitrate; its max rate and buffer
+    scale with it. Raises ValueError for unknown names.
+    """
+    renditions = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, bitrate = item.partition(":")
+        name = ALIASES.get(name.lower(), name.lower())
+        if name not in LADDER:
+            raise ValueError(f"Unknown rendition {item!r}; choose from {', '.join([*LADDER, *ALIASES])}")
+        rendition = LADDER[name]
+        if bitrate:
+            rate = int(bitrate.rstrip("kK"))
+            scale = rate / int(rendition.bitrate.rstrip("kK"))
+            rendition = replace(
+                rendition,
+                bitrate=f"{rate}k",
+                maxrate=f"{round(int(rendition.maxrate.rstrip('kK')) * scale)}k",
+                bufsize=f"{round(int(rendition.bufsize.rstrip('kK')) * scale)}k",
+            )
+        renditions[name] = rendition
+    if not renditions:
+        raise ValueError("No renditions requested")
+    return sorted(renditions.values(), key=lambda r: r.width * r.height, reverse=True)
+
+
+def master_profile(renditions, profiles):
+    """Render profile for the master: full detail and frame rate, covering the largest rendition."""
+    largest = renditions[0]
+    candidates = [
+        profile for profile in profiles.values()
+        if profile.width >= largest.width and profile.height >= largest.height
+    ]
+    if not candidates:
+        raise ValueError(f"No render profile covers {largest.width}x{largest.height}")
+    return min(candidates, key=lambda p: (-p.detail, -p.fps, p.width * p.height))
+
+
+def encode_renditions(master_path, renditions, delivery_root=DELIVERY_ROOT):
+    """Decode master_path once and encode every rendition from it.
+
+    Returns ({name: path}, wall seconds). Outputs are written under temporary
+    names and only moved into place when the whole pass succeeds.
+    """
+    info = probe_video(master_path)
+    num, den = (int(x) for x in info["r_frame_rate"].split("/"))
+    gop = round(2 * num / den)
+
+    splits = "".join(f"[s{i}]" for i in range(len(renditions)))
+    scales = ";".join(
+        f"[s{i}]scale={r.width}:{r.height}:flags=lanczos[v{i}]" for i, r in enumerate(renditions)
+    )
+    cmd = [
+        ffmpeg_exe(), "-y", "-v", "error",
+        "-i", str(master_path),
+        "-filter_complex", f"[0:v]split={len(renditions)}{splits};{scales}",
+    ]
+    outputs = {}
+    for i, rendition in enumerate(renditions):
+        path = rendition.path(delivery_root)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        outputs[rendition.name] = (path, path.with_name(path.stem + ".partial.mp4"))
+        cmd += [
+            "-map", f"[v{i}]", "-map", "0:a?", "-c:a", "copy",
+            "-c:v", "libx264", "-preset", ENCODE_PRESET,
+            "-b:v", rendition.bitrate, "-maxrate", rendition.maxrate, "-bufsize", rendition.bufsize,
+            # Constant frame rate out, even from a streamed master with variable-rate holds
+            "-r", info["r_frame_rate"], "-g", str(gop), "-pix_fmt", "yuv420p", "-movflags", "+faststart",
+            str(outputs[rendition.name][1]),
+        ]
+
+    began = time.perf_counter()
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError:
+        for _, tmp in outputs.values():
+            tmp.unlink(missing_ok=True)
+        raise
+    for path, tmp in outputs.values():
+        tmp.replace(path)
+    return {name: path for name, (path, _) in outputs.items()}, time.perf_counter() - began
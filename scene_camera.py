@@ -0,0 +1,22 @@
+from manim import *
+
+
+def camera_frame(scene: Scene) -> Mobject:
+    """The mobject that frames the shot, under either renderer.
+
+    Cairo's MovingCameraScene exposes camera.frame; the OpenGL camera is
+    itself a mobject and plays that role directly.
+    """
+    camera = scene.camera
+    return getattr(camera, "frame", camera)
+
+
+def set_scene_background(scene: Scene, color) -> None:
+    """Set the background colour under either renderer."""
+    renderer = scene.renderer
+    if hasattr(renderer, "camera") and hasattr(renderer.camera, "set_background"):
+        # Cairo: the camera paints the background into each frame
+        renderer.camera.background_color = color
+    else:
+        # OpenGL: the renderer clears the frame buffer with an RGBA tuple
+        renderer.background_color = tuple(color_to_rgba(color))
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Opt-in per-animation profiler for the film's scenes.
+Renders one scene with timing hooks around every self.play()/self.wait() and,
+inside each, around updater execution, mobject interpolation, rasterization
+and frame writes. Writes a Chrome-trace/Perfetto JSON timeline and prints the
+most expensive animations.
+
+    python scene_profiler.py starship_mars_landing.py StarshipMarsLanding -q h
+    # then open media/profiles/StarshipMarsLanding.trace.json in ui.perfetto.dev
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from sharding import load_scene_class
+
+PROFILE_DIR = Path("media/profiles")
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "k": "fourk_quality",
+}
+
+PHASES = ("updaters", "interpolate", "rasterize", "write_frame")
+
+
+class SceneProfiler:
+    """Collects trace events for one scene render.
+
+    install() wraps methods on the scene and renderer instances only, so
+    nothing changes for scenes that aren't being profiled.
+    """
+
+    def __init__(self, scene_name):
+        self.scene_name = scene_name
+        self.events = []
+        self.plays = []
+        self._current = None
+        self._origin = time.perf_counter()
+
+    def _us(self, t):
+        return (t - self._origin) * 1e6
+
+    def _event(self, name, category, start, end, args=None):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self._us(start),
+            "dur": (end - start) * 1e6,
+            "pid": 1,
+            "tid": 1,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def _timed(self, func, phase, name=None):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                self._event(name or phase, phase, start, end)
+                if self._current is not None:
+                    self._current["phases"][phase] += end - start
+        return wrapper
+
+    def install(self, scene):
+        renderer = scene.renderer
+        renderer_play = renderer.play
+        begin_animations = scene.begin_animations
+
+        def play(scene_, *args, **kwargs):
+            self._current = {
+                "index": len(self.plays),
+                "name": "play",
+                "phases": dict.fromkeys(PHASES, 0.0),
+            }
+            start = time.perf_counter()
+            try:
+                return renderer_play(scene_, *args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                play_info = self._current
+                play_info["total"] = end - start
+                play_info["run_time"] = getattr(scene_, "duration", 0.0)
+                self.plays.append(play_info)
+                self._event(
+                    f"#{play_info['index']} {play_info['name']}", "animation", start, end,
+                    {
+                        "run_time": play_info["run_time"],
+                        **{phase: round(t * 1000, 3) for phase, t in play_info["phases"].items()},
+                    },
+                )
+                self._current = None
+
+        def instrumented_begin_animations():
+            if self._current is not None:
+                self._current["name"] = describe_animations(scene.animations)
+            for animation in scene.animations:
+                label = type(animation).__name__
+                animation.interpolate = self._timed(animation.interpolate, "interpolate", f"interpolate {label}")
+                animation.update_mobjects = self._timed(animation.update_mobjects, "updaters", f"updaters {label}")
+            return begin_animations()
+
+        renderer.play = play
+        scene.begin_animations = instrumented_begin_animations
+        scene.update_mobjects = self._timed(scene.update_mobjects, "updaters", "scene updaters")
+        renderer.update_frame = self._timed(renderer.update_frame, "rasterize")
+        renderer.add_frame = self._timed(renderer.add_frame, "write_frame")
+
+    def write_trace(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": self.scene_name}},
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": "render"}},
+        ]
+        path.write_text(json.dumps({"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}))
+        return path
+
+    def print_summary(self, top=10):
+        total = sum(play["total"] for play in self.plays)
+        print(f"\n📊 {self.scene_name}: {len(self.plays)} animations, {total:.2f}s total")
+        header = "".join(f"{phase:>13}" for phase in PHASES)
+        print(f"{'#':>4}  {'Animation':<40}{'Total (s)':>10}{header}")
+        for play in sorted(self.plays, key=lambda p: p["total"], reverse=True)[:top]:
+            phases = "".join(f"{play['phases'][phase]:>13.3f}" for phase in PHASES)
+            print(f"{play['index']:>4}  {play['name'][:39]:<40}{play['total']:>10.3f}{phases}")
+
+
+def describe_animations(animations):
+    """Short label for a play() call, e.g. "AnimationGroup(MoveAlongPath, ...)"."""
+    def describe(animation):
+        name = type(animation).__name__
+        children = getattr(animation, "animations", None)
+        if children:
+            inner = ", ".join(type(child).__name__ for child in children[:3])
+            more = ", ..." if len(children) > 3 else ""
+            return f"{name}({inner}{more})"
+        return name
+    return " + ".join(describe(animation) for animation in animations)
+
+
+def profile_scene(scene_file, scene_class, quality="l", top=10, output=None):
+    """Render scene_class with profiling hooks; returns the trace path."""
+    from manim import tempconfig
+
+    profiler = SceneProfiler(scene_class)
+    # Manim's partial-movie cache would skip animations and hide their cost
+    with tempconfig({"quality": QUALITIES[quality], "disable_caching": True}):
+        scene = load_scene_class(scene_file, scene_class)()
+        profiler.install(scene)
+        scene.render()
+
+    trace_path = profiler.write_trace(output or PROFILE_DIR / f"{scene_class}.trace.json")
+    profiler.print_summary(top)
+    print(f"\n🧭 Trace written: {trace_path}")
+    return trace_path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Profile one scene's animations.")
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_class")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l",
+                        help="Render quality tier (default: l).")
+    parser.add_argument("--top", type=int, default=10,
+                        help="Number of most expensive animations to list (default: 10).")
+    parser.add_argument("-o", "--output", default=None,
+                        help="Trace file path (default: media/profiles/<SceneClass>.trace.json).")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    profile_scene(args.scene_file, args.scene_class, args.quality, args.top, args.output)
@@ -0,0 +1,22 @@
+import random
+import zlib
+
+import numpy as np
+
+# Bump to reshuffle every scene's random layout at once
+BASE_SEED = 42
+
+
+def seed_scene(scene) -> np.random.Generator:
+    """Seed `random` and `np.random` for scene and return a matching Generator.
+
+    Call first thing in construct(). The seed is derived from the scene class
+    name, so it is stable across processes and runs: every render (and every
+    shard) builds identical mobjects, and Manim's per-animation hashes only
+    change when the scene code does, letting its partial-movie cache re-render
+    just the edited animations.
+    """
+    seed = (BASE_SEED + zlib.crc32(type(scene).__name__.encode())) % 2 ** 32
+    random.seed(seed)
+    np.random.seed(seed)
+    return np.random.default_rng(seed)
@@ -0,0 +1,105 @@
+"""
+Split one long scene into animation-index shards and stitch them back.
+
+Each shard is an ordinary Manim render with ``-n start,end``: Manim runs the
+whole ``construct`` but skips rasterizing every ``self.play()``/``self.wait()``
+outside the range, so scene state at the start of a shard is rebuilt from the
+same code path as a single-process render. Scenes must therefore be
+deterministic (seeded randomness, updaters driven by animation alpha rather
+than accumulated frame time).
+
+Run directly to print the run time of every animation in a scene:
+
+    python sharding.py starship_mars_landing.py StarshipMarsLanding
+"""
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from film_assembly import concat_copy
+
+
+def animation_durations(scene_file, scene_class):
+    """Run time of every play()/wait() in scene_class, via a dry run."""
+    cmd = [sys.executable, str(Path(__file__).resolve()), scene_file, scene_class]
+    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def split_ranges(durations, shards):
+    """Split animations into contiguous (start, end) ranges of similar run time.
+
+    end is inclusive, and None for the last range (render to the end).
+    """
+    shards = max(1, min(shards, len(durations)))
+    target = sum(durations) / shards
+    ranges = []
+    start = 0
+    elapsed = 0.0
+    for index, duration in enumerate(durations):
+        elapsed += duration
+        remaining_shards = shards - len(ranges) - 1
+        remaining_animations = len(durations) - index - 1
+        if remaining_shards == 0 or remaining_animations < remaining_shards:
+            continue
+        if elapsed >= target * (len(ranges) + 1) or remaining_animations == remaining_shards:
+            ranges.append((start, index))
+            start = index + 1
+    ranges.append((start, None))
+
+    # Manim treats an upper bound of 0 as "no bound", so the first shard
+    # must cover at least animations 0 and 1.
+    if len(ranges) > 1 and ranges[0][1] == 0:
+        second_end = ranges[1][1]
+        ranges = [(0, second_end)] + ranges[2:]
+    return ranges
+
+
+def plan_shards(scene_file, scene_class, shards):
+    """Animation ranges for rendering scene_class as up to `shards` pieces."""
+    return split_ranges(animation_durations(scene_file, scene_class), shards)
+
+
+def animation_range_flags(animation_range):
+    """Manim CLI flags selecting an animation range."""
+    start, end = animation_range
+    return ["-n", f"{start}" if end is None else f"{start},{end}"]
+
+
+def stitch_shards(shard_videos, output_path):
+    """Join shard videos (in order) into one scene video without re-encoding."""
+    return concat_copy(shard_videos, output_path)
+
+
+def load_scene_class(scene_file, scene_class):
+    """Import scene_file as a module and return the named Scene subclass."""
+    spec = importlib.util.spec_from_file_location(Path(scene_file).stem, scene_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, scene_class)
+
+
+def _dry_run_durations(scene_file, scene_class):
+    from manim import tempconfig
+
+    durations = []
+    with tempconfig({"dry_run": True, "disable_caching": True, "verbosity": "ERROR"}):
+        scene = load_scene_class(scene_file, scene_class)()
+        renderer_play = scene.renderer.play
+
+        def recording_play(scene, *args, **kwargs):
+            renderer_play(scene, *args, **kwargs)
+            durations.append(scene.duration)
+
+        scene.renderer.play = recording_play
+        scene.render()
+    return durations
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python sharding.py <scene_file> <SceneClass>")
+        sys.exit(1)
+    print(json.dumps(_dry_run_durations(sys.argv[1], sys.argv[2])))
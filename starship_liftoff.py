@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from scene_seed import seed_scene
+from static_plate import StaticPlate
+
 # Theme
 COLOR_BG = "#000000"
 COLOR_METAL_DARK = "#1a1a1a"
@@ -14,6 +17,8 @@ COLOR_GROUND = "#0b0b0b"
 
 class StarshipLiftoff(Scene):
     def construct(self):
+        seed_scene(self)
+
         # Background
         bg = Rectangle(width=16, height=9).set_fill(COLOR_BG, opacity=1).set_stroke(width=0)
         self.add(bg)
@@ -22,6 +27,8 @@ class StarshipLiftoff(Scene):
         ground = Rectangle(width=16, height=1.2).set_fill(COLOR_GROUND, 1).set_stroke(width=0)
         ground.to_edge(DOWN)
         self.add(ground)
+        # Background and pad never change: rasterize them once for the whole scene
+        StaticPlate(self, bg, ground).bake()
 
         # Rocket proportions
         body_height = 5.0
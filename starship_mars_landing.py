@@ -1,6 +1,15 @@
 from manim import *
 import numpy as np
 
+from dirty_tiles import use_dirty_tiles
+from hud_readout import NumericReadout
+from particles import ParticleEmitter
+from render_profiles import scaled_count
+from scene_camera import set_scene_background
+from scene_seed import seed_scene
+from static_plate import StaticPlate
+from trajectory import powered_descent_table
+
 # Mars Landing Scene Colors
 COLOR_MARS_SURFACE = "#CD5C5C"      # Mars red surface
 COLOR_MARS_SKY = "#2F1B14"          # Dark red Martian sky
@@ -12,8 +21,13 @@ COLOR_BG = "#000000"                # Space black
 
 class StarshipMarsLanding(MovingCameraScene):
     def construct(self):
+        # Same terrain and dust on every render, shard and cache check
+        seed_scene(self)
+        # Opt-in (--dirty-tiles): redraw only the tiles the HUD, rocket and trace touch
+        use_dirty_tiles(self)
+
         # Set background to space
-        self.camera.background_color = COLOR_BG
+        set_scene_background(self, COLOR_BG)
         
         # Create Mars surface
         mars_surface = Rectangle(
@@ -54,24 +68,20 @@ class StarshipMarsLanding(MovingCameraScene):
             stroke_width=0
         ).move_to(UP * 2)
         
-        # Add dust particles in atmosphere
+        # Add dust particles in atmosphere: a steady, slowly drifting field
         def create_dust_particles():
-            dust = VGroup()
-            for _ in range(50):
-                particle = Dot(
-                    radius=np.random.uniform(0.01, 0.03),
-                    color=COLOR_MARS_DUST
-                )
-                particle.set_opacity(np.random.uniform(0.2, 0.6))
-                particle.move_to(
-                    np.array([
-                        np.random.uniform(-8, 8),
-                        np.random.uniform(-2, 4),
-                        0
-                    ])
-                )
-                dust.add(particle)
-            return dust
+            return ParticleEmitter(
+                count=scaled_count(1500),
+                loop=True,
+                lifetime=(4.0, 8.0),
+                spawn_box=((-8, 8), (-2, 4)),
+                velocity=((-0.15, 0.05), (-0.05, 0.05)),
+                radius_range=(0.006, 0.02),
+                opacity_range=(0.2, 0.6),
+                fade_in=0.2,
+                fade_out=0.2,
+                color=COLOR_MARS_DUST,
+            )
         
         dust_particles = create_dust_particles()
         
@@ -164,10 +174,16 @@ class StarshipMarsLanding(MovingCameraScene):
             fuel_label = Text("FUEL", font_size=24, color=COLOR_HUD).next_to(vel_label, DOWN, buff=0.2)
             status_label = Text("STATUS", font_size=24, color=COLOR_HUD).next_to(fuel_label, DOWN, buff=0.2)
             
-            # Values
-            alt_value = Text("1200 m", font_size=20, color=WHITE).next_to(alt_label, RIGHT, buff=0.5)
-            vel_value = Text("45 m/s", font_size=20, color=WHITE).next_to(vel_label, RIGHT, buff=0.5)
-            fuel_value = Text("23%", font_size=20, color=YELLOW).next_to(fuel_label, RIGHT, buff=0.5)
+            # Values (glyph-cached, left-aligned next to their labels)
+            alt_value = NumericReadout(
+                1200, formatter=lambda v: f"{int(v)} m", font_size=20, color=WHITE, align_edge=LEFT
+            ).next_to(alt_label, RIGHT, buff=0.5)
+            vel_value = NumericReadout(
+                45, formatter=lambda v: f"{v:.1f} m/s", font_size=20, color=WHITE, align_edge=LEFT
+            ).next_to(vel_label, RIGHT, buff=0.5)
+            fuel_value = NumericReadout(
+                23, formatter=lambda v: f"{v:.0f}%", font_size=20, color=YELLOW, align_edge=LEFT
+            ).next_to(fuel_label, RIGHT, buff=0.5)
             status_value = Text("DESCENT", font_size=20, color=COLOR_HUD).next_to(status_label, RIGHT, buff=0.5)
             
             hud = VGroup(
@@ -191,6 +207,10 @@ class StarshipMarsLanding(MovingCameraScene):
             )
         )
         
+        # Surface, rocks and sky stay still until the final fade: bake them
+        # into one raster plate instead of redrawing them every frame
+        environment_plate = StaticPlate(self, mars_surface, terrain, mars_sky).bake()
+
         # 2. Starship appears from space
         self.play(
             FadeIn(starship, shift=DOWN),
@@ -203,26 +223,33 @@ class StarshipMarsLanding(MovingCameraScene):
             run_time=0.8
         )
         
-        # 4. Landing sequence with HUD updates
-        def update_landing_hud(alpha):
-            # Altitude decreases from 1200m to 0m
-            altitude = 1200 - alpha * 1200
-            # Velocity decreases from 45 m/s to 0 m/s
-            velocity = 45 - alpha * 45
-            # Fuel decreases from 23% to 5%
-            fuel = 23 - alpha * 18
-            # Status changes
-            if alpha < 0.7:
-                status = "DESCENT"
-            elif alpha < 0.9:
+        # 4. Powered descent profile: one table row per output frame drives
+        # the ship's position, the HUD and the retro-rockets together
+        descent = powered_descent_table(
+            starship.get_center(),
+            mars_surface.get_top() + UP * 0.5,
+            run_time=6.0,
+            fps=config.frame_rate,
+        )
+        current_status = ["DESCENT"]
+
+        def update_landing_hud(i):
+            fuel = descent.fuel_pct[i]
+            # Coast, then the landing burn, then touchdown on the last row
+            if i == len(descent) - 1:
+                status = "LANDED"
+            elif descent.thrust[i]:
                 status = "LANDING"
             else:
-                status = "LANDED"
-            
-            alt_val.set_text(f"{int(altitude)} m")
-            vel_val.set_text(f"{velocity:.1f} m/s")
-            fuel_val.set_text(f"{fuel:.0f}%")
-            status_val.set_text(status)
+                status = "DESCENT"
+
+            alt_val.set_value(descent.altitude_m[i])
+            vel_val.set_value(descent.velocity_ms[i])
+            fuel_val.set_value(fuel)
+            # Status only changes twice; skip re-layout on every other frame
+            if status != current_status[0]:
+                status_val.set_text(status)
+                current_status[0] = status
             
             # Change fuel color based on level
             if fuel < 10:
@@ -232,45 +259,43 @@ class StarshipMarsLanding(MovingCameraScene):
             else:
                 fuel_val.set_color(WHITE)
         
-        # 5. Descent with retro-rockets
-        def activate_retro_rockets(mobj, alpha):
-            if alpha > 0.3:  # Activate retro-rockets at 30% of descent
-                retro_flames.set_opacity(0.8)
-            else:
-                retro_flames.set_opacity(0)
+        # 5. Descent with retro-rockets firing during the landing burn.
+        # Dust is kicked up by moving the emitter's anchor here: a Transform
+        # on the emitter would suspend its updater and freeze the field.
+        dust_start = dust_particles.anchor.get_center()
+        def follow_descent(mobj, alpha):
+            i = descent.index(alpha)
+            starship.move_to(descent.positions[i])
+            update_landing_hud(i)
+            retro_flames.set_opacity(0.8 if descent.thrust[i] else 0)
+            dust_particles.anchor.move_to(dust_start + 0.5 * UP * rate_functions.ease_in_sine(alpha))
         
         # 6. Landing animation
         self.play(
             AnimationGroup(
-                starship.animate.move_to(mars_surface.get_top() + UP * 0.5),
-                UpdateFromAlphaFunc(starship, lambda m, a: update_landing_hud(a)),
-                UpdateFromAlphaFunc(starship, activate_retro_rockets),
-                dust_particles.animate.shift(0.5 * UP),  # Dust kicked up
+                # Linear: the profile already holds the physical timing
+                UpdateFromAlphaFunc(starship, follow_descent, rate_func=linear),
                 run_time=6.0,
-                rate_func=rate_functions.ease_in_sine
             )
         )
         
         # 7. Landing impact effects
-        impact_dust = VGroup()
-        for _ in range(20):
-            particle = Dot(
-                radius=np.random.uniform(0.02, 0.05),
-                color=COLOR_MARS_DUST
-            )
-            particle.set_opacity(np.random.uniform(0.4, 0.8))
-            particle.move_to(starship.get_bottom() + DOWN * 0.2)
-            impact_dust.add(particle)
-        
-        self.play(
-            AnimationGroup(
-                *[particle.animate.shift(
-                    np.random.uniform(-1, 1) * RIGHT + 
-                    np.random.uniform(0.5, 1.5) * UP
-                ).set_opacity(0) for particle in impact_dust],
-                run_time=1.5
-            )
+        # One burst emitter instead of a Dot and an animation per particle
+        impact_dust = ParticleEmitter(
+            origin=starship.get_bottom() + DOWN * 0.2,
+            count=scaled_count(120),
+            lifetime=(1.2, 1.5),
+            velocity=((-1.2, 1.2), (0.6, 1.8)),
+            gravity=0.6 * DOWN,
+            drag=1.0,
+            radius_range=(0.02, 0.05),
+            opacity_range=(0.4, 0.8),
+            color=COLOR_MARS_DUST,
         )
+        self.add(impact_dust)
+        self.wait(1.5)
+        # Every burst particle has died by now; stop updating the emitter
+        self.remove(impact_dust)
         
         # 8. Final status update
         status_val.set_text("LANDED")
@@ -282,11 +307,11 @@ class StarshipMarsLanding(MovingCameraScene):
         
         # 9. Hold and fade
         self.wait(2.0)
+        environment_plate.release()
         self.play(
             LaggedStart(
                 FadeOut(starship),
                 FadeOut(hud),
-                FadeOut(impact_dust),
                 FadeOut(dust_particles),
                 FadeOut(terrain),
                 FadeOut(mars_surface),
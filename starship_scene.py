@@ -2,6 +2,16 @@ from manim import *
 from pathlib import Path
 import numpy as np
 
+from dirty_tiles import use_dirty_tiles
+from dot_cloud import DotCloud
+from flight_trace import FlightTrace
+from hud_readout import NumericReadout
+from render_profiles import scaled_count
+from scene_camera import camera_frame
+from scene_seed import seed_scene
+from static_plate import StaticPlate
+from trajectory import kepler_orbit_table
+
 # Assets
 
 # Theme
@@ -23,27 +33,27 @@ COLOR_EARTH_OUTLINE = "#1e90ff"
 
 class StarshipBuild(MovingCameraScene):
     def construct(self):
+        seed_scene(self)
+        # Opt-in (--dirty-tiles): redraw only the tiles the HUD, rocket and trace touch
+        use_dirty_tiles(self)
+
         # Background
         bg = Rectangle(width=16, height=9).set_fill(COLOR_BG, opacity=1).set_stroke(width=0)
         self.add(bg)
         # Slight zoom-out to avoid a too-tight framing
-        self.camera.frame.scale(1.15)
+        camera_frame(self).scale(1.15)
+        # The camera frame stays put from here on, so the background is baked once
+        StaticPlate(self, bg).bake()
 
         # Parallax star layers
-        def make_star_layer(count: int, color: str, radius_range=(0.01, 0.03), seed: int = 0) -> VGroup:
+        def make_star_layer(count: int, color: str, radius_range=(0.01, 0.03), seed: int = 0) -> DotCloud:
             rng = np.random.default_rng(seed)
-            stars = VGroup()
-            for _ in range(count):
-                x = rng.uniform(-7.8, 7.8)
-                y = rng.uniform(-4.4, 4.4)
-                r = rng.uniform(radius_range[0], radius_range[1])
-                star = Dot(point=np.array([x, y, 0.0]), radius=r, color=color)
-                stars.add(star)
-            return stars
-
-        stars_far = make_star_layer(120, COLOR_STAR_FAR, (0.006, 0.014), seed=1)
-        stars_mid = make_star_layer(90, COLOR_STAR_MID, (0.008, 0.018), seed=2)
-        stars_near = make_star_layer(70, COLOR_STAR_NEAR, (0.010, 0.024), seed=3)
+            return DotCloud.random(count, color, radius_range=radius_range, rng=rng)
+
+        # Counts scale with the render profile's detail (fewer stars in drafts)
+        stars_far = make_star_layer(scaled_count(120), COLOR_STAR_FAR, (0.006, 0.014), seed=1)
+        stars_mid = make_star_layer(scaled_count(90), COLOR_STAR_MID, (0.008, 0.018), seed=2)
+        stars_near = make_star_layer(scaled_count(70), COLOR_STAR_NEAR, (0.010, 0.024), seed=3)
         self.play(LaggedStart(FadeIn(stars_far, shift=0.1 * DOWN), FadeIn(stars_mid, shift=0.15 * DOWN), FadeIn(stars_near, shift=0.2 * DOWN), lag_ratio=0.2, run_time=0.8))
 
         # Earth (smaller for 1080p)
@@ -52,9 +62,19 @@ class StarshipBuild(MovingCameraScene):
         earth.move_to(DOWN * 1.8 + LEFT * 2.5)
         self.play(FadeIn(earth, shift=0.3 * DOWN), run_time=0.6)
 
-        # Define orbit geometry (start directly in orbit)
-        orbit_radius = earth_radius + 1.0
+        # Orbit legs (start directly in orbit, perigee at the start point).
+        # One table row per output frame drives the rocket, trace and HUD.
         start_angle = -PI / 2 + 0.2
+        first_leg = kepler_orbit_table(
+            earth.get_center(), earth_radius, start_angle,
+            nu_start=0.0, nu_end=PI * 1.3,
+            run_time=4.0, fps=config.frame_rate, mission_t0=480.0,
+        )
+        second_leg = kepler_orbit_table(
+            earth.get_center(), earth_radius, start_angle,
+            nu_start=PI * 1.3, nu_end=PI * 3.1,
+            run_time=5.5, fps=config.frame_rate, mission_t0=first_leg.mission_t[-1],
+        )
 
         # Rocket proportions (smaller for 1080p)
         body_height = 3.2
@@ -134,9 +154,7 @@ class StarshipBuild(MovingCameraScene):
         rocket = VGroup(body, nose, left_fin, right_fin, window1, window2, window3, bells)
 
         # Place rocket at the start of orbit and orient tangentially
-        orbit_center = earth.get_center()
-        start_point = orbit_center + orbit_radius * np.array([np.cos(start_angle), np.sin(start_angle), 0.0])
-        rocket.move_to(start_point)
+        rocket.move_to(first_leg.positions[0])
         tangent_angle = start_angle + PI / 2
         rocket.rotate(tangent_angle - PI / 2)
         self.add(rocket)
@@ -158,23 +176,24 @@ class StarshipBuild(MovingCameraScene):
         label_vel.next_to(label_alt, RIGHT, buff=0.8)
         label_tim.next_to(label_vel, RIGHT, buff=0.8)
 
-        alt_num = Text("0 km", font_size=28)
-        vel_num = Text("0.00 km/s", font_size=28)
-        tim_num = Text("0.0 s", font_size=28)
+        # Glyph-cached readouts: digits are laid out once, not every frame
+        alt_num = NumericReadout(0, formatter=lambda v: f"{int(v):,} km", font_size=28)
+        vel_num = NumericReadout(0, formatter=lambda v: f"{v:.2f} km/s", font_size=28)
+        tim_num = NumericReadout(0, formatter=lambda v: f"{v:.1f} s", font_size=28)
         alt_num.next_to(label_alt, DOWN, buff=0.12)
         vel_num.next_to(label_vel, DOWN, buff=0.12)
         tim_num.next_to(label_tim, DOWN, buff=0.12)
 
-        def update_alt(m: Text):
-            m.set_text(f"{int(altitude.get_value()):,} km")
+        def update_alt(m: NumericReadout):
+            m.set_value(altitude.get_value())
             m.next_to(label_alt, DOWN, buff=0.12)
 
-        def update_vel(m: Text):
-            m.set_text(f"{velocity.get_value():.2f} km/s")
+        def update_vel(m: NumericReadout):
+            m.set_value(velocity.get_value())
             m.next_to(label_vel, DOWN, buff=0.12)
 
-        def update_time(m: Text):
-            m.set_text(f"{mission_t.get_value():.1f} s")
+        def update_time(m: NumericReadout):
+            m.set_value(mission_t.get_value())
             m.next_to(label_tim, DOWN, buff=0.12)
 
         alt_num.add_updater(update_alt)
@@ -193,79 +212,62 @@ class StarshipBuild(MovingCameraScene):
         hud = VGroup(hud_bg, label_alt, label_vel, label_tim, alt_num, vel_num, tim_num, status_launch, status_orbit)
         self.play(FadeIn(hud, shift=0.2 * UP), run_time=0.4)
 
-        # Orbit-only traced path
-        trace = TracedPath(lambda: rocket.get_center(), stroke_color=COLOR_ACCENT, stroke_width=2)
+        # Orbit-only traced path in a fixed-size ring buffer. Fed every table
+        # row in order (not sampled per frame) so it looks the same when
+        # earlier animations are skipped, e.g. in a sharded render.
+        trace = FlightTrace(capacity=512, stroke_color=COLOR_ACCENT, stroke_width=2)
         self.add(trace)
 
         # Set initial values and trigger updaters
-        altitude.set_value(500.0)
-        velocity.set_value(7.3)
-        mission_t.set_value(480.0)
+        altitude.set_value(first_leg.altitude_km[0])
+        velocity.set_value(first_leg.velocity_kms[0])
+        mission_t.set_value(first_leg.mission_t[0])
         # Force initial update
         update_alt(alt_num)
         update_vel(vel_num)
         update_time(tim_num)
 
-        # Build orbit arc and draw it
-        orbit_arc = Arc(
-            radius=orbit_radius,
-            start_angle=start_angle,
-            angle=PI * 1.3,
-        ).move_arc_center_to(earth.get_center())
-        orbit_path_draw = orbit_arc.copy().set_stroke(COLOR_OUTLINE, 1, opacity=0.35)
+        # Draw the first orbit leg
+        orbit_path_draw = VMobject().set_points_as_corners(first_leg.positions)
+        orbit_path_draw.set_stroke(COLOR_OUTLINE, 1, opacity=0.35)
         self.play(FadeIn(orbit_path_draw), run_time=0.3)
 
-        # First orbit with gradual HUD updates
-        def update_hud_first(alpha):
-            alt_val = 500.0 + alpha * 40.0
-            vel_val = 7.3 + alpha * 0.3
-            time_val = 480.0 + alpha * 60.0
-            altitude.set_value(alt_val)
-            velocity.set_value(vel_val)
-            mission_t.set_value(time_val)
-            # Force text updates
-            alt_num.set_text(f"{int(alt_val):,} km")
-            vel_num.set_text(f"{vel_val:.2f} km/s")
-            tim_num.set_text(f"{time_val:.1f} s")
-        
+        def fly(leg):
+            traced = [0]  # Table rows already pushed to the trace
+
+            # Rocket, trace and HUD all read the same table row
+            def update(m, alpha):
+                i = leg.index(alpha)
+                rocket.move_to(leg.positions[i])
+                if i + 1 > traced[0]:
+                    trace.extend(leg.positions[traced[0] : i + 1])
+                    traced[0] = i + 1
+                altitude.set_value(leg.altitude_km[i])
+                velocity.set_value(leg.velocity_kms[i])
+                mission_t.set_value(leg.mission_t[i])
+                # Readout updaters pick up the new values on the same frame,
+                # so the text is laid out once per frame, not twice
+            # Linear: orbital time advances at a constant rate
+            return UpdateFromAlphaFunc(rocket, update, rate_func=linear)
+
+        # First orbit leg
         self.play(
             AnimationGroup(
-                MoveAlongPath(rocket, orbit_arc),
+                fly(first_leg),
                 stars_near.animate.shift(1.0 * LEFT),
                 stars_mid.animate.shift(0.6 * LEFT),
                 stars_far.animate.shift(0.3 * LEFT),
-                UpdateFromAlphaFunc(altitude, lambda m, a: update_hud_first(a)),
                 run_time=4.0,
             )
         )
 
         # Second orbit loop (longer, more parallax)
-        orbit_arc2 = Arc(
-            radius=orbit_radius,
-            start_angle=start_angle + PI * 1.3,
-            angle=PI * 1.8,
-        ).move_arc_center_to(earth.get_center())
-        
-        # Second orbit with gradual HUD updates
-        def update_hud_second(alpha):
-            alt_val = 540.0 + alpha * 40.0
-            vel_val = 7.6 + alpha * 0.2
-            time_val = 540.0 + alpha * 180.0
-            altitude.set_value(alt_val)
-            velocity.set_value(vel_val)
-            mission_t.set_value(time_val)
-            # Force text updates
-            alt_num.set_text(f"{int(alt_val):,} km")
-            vel_num.set_text(f"{vel_val:.2f} km/s")
-            tim_num.set_text(f"{time_val:.1f} s")
-        
         self.play(
             AnimationGroup(
-                MoveAlongPath(rocket, orbit_arc2),
+                fly(second_leg),
                 stars_near.animate.shift(2.2 * LEFT + 0.4 * DOWN),
                 stars_mid.animate.shift(1.4 * LEFT + 0.2 * DOWN),
                 stars_far.animate.shift(0.8 * LEFT + 0.1 * DOWN),
-                UpdateFromAlphaFunc(altitude, lambda m, a: update_hud_second(a)),
                 run_time=5.5,
             )
         )
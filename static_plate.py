@@ -0,0 +1,80 @@
+import hashlib
+from contextlib import contextmanager
+
+from manim import *
+
+
+class PlateDigest(VMobject):
+    """Invisible stand-in for baked mobjects in Manim's partial-movie hash.
+
+    Manim leaves camera.background out of the play-call hash, so once a
+    layer is baked its pixels would no longer affect which cached partial
+    movie files get reused. This point-less mobject stays in the scene and
+    carries a digest of the plate, so editing a baked layer re-renders.
+    """
+
+    def __init__(self, digest: str, **kwargs):
+        super().__init__(fill_opacity=0, stroke_width=0, **kwargs)
+        self.plate_digest = digest
+
+
+class StaticPlate:
+    """Bake static background mobjects into the camera's background raster.
+
+    While baked, the mobjects are rasterized once at output resolution into
+    the Cairo camera's background and removed from the scene, so every frame
+    starts from the plate and only the remaining mobjects are drawn. The
+    baked mobjects must be the bottom-most mobjects of the scene (and the
+    camera frame must not move) for the plate to match a vector render pixel
+    for pixel. release() puts the vector mobjects back, e.g. before they
+    fade out. While baked, a PlateDigest of the plate pixels sits in the
+    scene so Manim's render cache still sees changes to the baked layers.
+
+    Renderers without a raster background (OpenGL) leave the scene untouched.
+    """
+
+    def __init__(self, scene: Scene, *mobjects: Mobject):
+        self.scene = scene
+        self.mobjects = list(mobjects)
+        self.previous_background = None
+        self.digest = None
+        self.active = False
+
+    def bake(self) -> "StaticPlate":
+        camera = self.scene.renderer.camera
+        if not hasattr(camera, "set_background"):
+            return self
+
+        scene_mobjects = self.scene.mobjects
+        self.mobjects.sort(key=scene_mobjects.index)
+        if scene_mobjects[: len(self.mobjects)] != self.mobjects:
+            raise ValueError("Static plate mobjects must be at the bottom of the scene")
+
+        self.previous_background = camera.background
+        camera.reset()
+        camera.capture_mobjects(self.mobjects)
+        plate = camera.pixel_array.copy()
+        camera.set_background(plate)
+        self.scene.remove(*self.mobjects)
+        self.digest = PlateDigest(hashlib.sha256(plate.tobytes()).hexdigest())
+        self.scene.add(self.digest)
+        self.active = True
+        return self
+
+    def release(self) -> None:
+        if not self.active:
+            return
+        self.scene.renderer.camera.set_background(self.previous_background)
+        self.scene.remove(self.digest)
+        self.scene.add_to_back(*self.mobjects)
+        self.active = False
+
+
+@contextmanager
+def static_plate(scene: Scene, *mobjects: Mobject):
+    """Keep mobjects baked into the background for the animations in the block."""
+    plate = StaticPlate(scene, *mobjects).bake()
+    try:
+        yield plate
+    finally:
+        plate.release()
@@ -0,0 +1,63 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("manim")
+
+from dot_cloud import DotCloud, opacity_bins
+
+
+def drawn_opacities(cloud):
+    """Opacity each dot is actually drawn with."""
+    drawn = np.empty(len(cloud.opacities))
+    for layer, dots in zip(cloud.submobjects, cloud.layer_dots):
+        drawn[dots] = layer.get_fill_opacity()
+    return drawn
+
+
+@pytest.mark.parametrize("levels", [1, 3, 8])
+def test_opacity_bins_stay_within_half_a_bin(levels):
+    opacities = np.random.default_rng(0).uniform(0.2, 0.6, 500)
+    index, values = opacity_bins(opacities, levels)
+    assert len(values) <= levels
+    bound = (opacities.max() - opacities.min()) / (2 * levels)
+    assert np.abs(values[index] - opacities).max() <= bound + 1e-12
+
+
+def test_distinct_opacities_are_drawn_exactly():
+    index, values = opacity_bins([0.2, 0.2, 0.6], 8)
+    assert values[index].tolist() == [0.2, 0.2, 0.6]
+
+
+def test_rendered_opacities_stay_within_quantization_error():
+    rng = np.random.default_rng(1)
+    cloud = DotCloud.random(300, "#ffffff", opacity_range=(0.2, 0.6), rng=rng)
+    drawn = drawn_opacities(cloud)
+    assert np.abs(drawn - cloud.opacities).max() <= 0.4 / 16 + 1e-9
+    assert np.allclose(drawn_opacities(DotCloud(np.zeros((4, 3)), 0.01, opacities=0.2)), 0.2)
+
+
+def test_dots_are_grouped_by_color_and_opacity():
+    colors = ["#ff0000", "#ff0000", "#00ff00"]
+    cloud = DotCloud(np.zeros((3, 3)), 0.01, colors=colors, opacities=[1.0, 1.0, 0.5])
+    assert sorted(len(dots) for dots in cloud.layer_dots) == [1, 2]
+
+
+def test_setters_update_arrays_and_paths():
+    cloud = DotCloud(np.zeros((3, 3)), [0.01, 0.02, 0.03])
+    positions = np.array([[1.0, 0, 0], [2.0, 0, 0], [3.0, 1, 0]])
+    cloud.set_positions(positions)
+    assert np.allclose(cloud.positions, positions)
+    cloud.sync_from_paths()
+    assert np.allclose(cloud.positions, positions)
+    assert np.allclose(cloud.radii, [0.01, 0.02, 0.03])
+
+    cloud.set_opacities([0.1, 0.5, 0.9])
+    assert np.allclose(drawn_opacities(cloud), [0.1, 0.5, 0.9])
+
+
+def test_setters_keep_moves_made_on_the_paths():
+    cloud = DotCloud(np.zeros((2, 3)), 0.02)
+    cloud.shift(np.array([1.0, 2.0, 0.0]))
+    cloud.set_opacities([0.5, 1.0])
+    assert np.allclose(cloud.positions, [[1, 2, 0], [1, 2, 0]])
+    assert np.allclose(cloud.radii, 0.02)
@@ -0,0 +1,61 @@
+import subprocess
+
+import pytest
+
+from film_assembly import (
+    assemble_film, can_stream_copy, ffmpeg_exe, matching_encode_args, probe_video, stream_signature,
+)
+
+REFERENCE = {
+    "codec_name": "h264", "profile": "Constrained Baseline", "level": 31, "width": 320, "height": 240,
+    "pix_fmt": "yuv420p", "r_frame_rate": "30/1", "time_base": "1/15360",
+}
+
+
+def test_matching_encode_args_reproduce_profile_level_and_timebase():
+    args = matching_encode_args(REFERENCE)
+    assert args[:2] == ["-c:v", "libx264"]
+    for flag, value in [("-pix_fmt", "yuv420p"), ("-video_track_timescale", "15360"),
+                        ("-profile:v", "baseline"), ("-level:v", "3.1")]:
+        assert args[args.index(flag) + 1] == value
+
+
+def test_matching_encode_args_skip_unknown_profile_and_level():
+    args = matching_encode_args({**REFERENCE, "profile": "Extended", "level": -99})
+    assert "-profile:v" not in args and "-level:v" not in args
+
+
+needs_ffmpeg = pytest.mark.skipif(not can_stream_copy(), reason="needs ffmpeg and ffprobe")
+
+
+def encode(path, source, *args):
+    cmd = [ffmpeg_exe(), "-y", "-v", "error", "-f", "lavfi", "-i", source, "-t", "1",
+           "-c:v", "libx264", *args, str(path)]
+    subprocess.run(cmd, check=True)
+    return path
+
+
+def frame_hashes(path):
+    result = subprocess.run([ffmpeg_exe(), "-v", "error", "-i", str(path), "-f", "framemd5", "-"],
+                            check=True, capture_output=True, text=True)
+    return [line.rsplit(",", 1)[-1].strip() for line in result.stdout.splitlines() if not line.startswith("#")]
+
+
+@needs_ffmpeg
+def test_reencoded_scene_joins_a_reference_scene(tmp_path):
+    # Two scenes as Manim would write them, and one from a differently configured encoder
+    manim_like = ["-preset", "ultrafast", "-pix_fmt", "yuv420p", "-video_track_timescale", "15360"]
+    first = encode(tmp_path / "a.mp4", "testsrc2=size=320x240:rate=30", *manim_like)
+    odd = encode(tmp_path / "b.mp4", "testsrc=size=640x480:rate=24", "-preset", "slow", "-pix_fmt", "yuv444p")
+    last = encode(tmp_path / "c.mp4", "smptebars=size=320x240:rate=30", *manim_like)
+    film = tmp_path / "film.mp4"
+
+    reencoded = assemble_film([first, odd, last], film, work_dir=tmp_path / "work")
+
+    assert reencoded == [odd]
+    reference = probe_video(first)
+    assert stream_signature(probe_video(tmp_path / "work" / "b.mp4")) == stream_signature(reference)
+    assert stream_signature(probe_video(film)) == stream_signature(reference)
+    # Every frame decodes exactly as it does from its own part
+    parts = [first, tmp_path / "work" / "b.mp4", last]
+    assert frame_hashes(film) == sum((frame_hashes(part) for part in parts), [])
@@ -0,0 +1,63 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("manim")
+
+from flight_trace import FlightTrace
+
+
+def zigzag(count):
+    """Points that are never collinear, so every one is kept."""
+    return [(x, x % 2, 0) for x in range(count)]
+
+
+def kept(trace):
+    return trace.points_in_order()[:, :2].tolist()
+
+
+def test_collinear_points_replace_the_last_kept_point():
+    trace = FlightTrace().extend([(x, 0, 0) for x in range(10)])
+    assert kept(trace) == [[0, 0], [9, 0]]
+
+
+def test_points_within_tolerance_are_decimated():
+    trace = FlightTrace(tolerance=0.01).extend([(0, 0, 0), (1, 0.005, 0), (2, 0, 0)])
+    assert kept(trace) == [[0, 0], [2, 0]]
+    trace = FlightTrace(tolerance=0.001).extend([(0, 0, 0), (1, 0.005, 0), (2, 0, 0)])
+    assert len(kept(trace)) == 3
+
+
+def test_corners_are_kept():
+    trace = FlightTrace().extend([(0, 0, 0), (1, 0, 0), (2, 0, 0), (2, 1, 0)])
+    assert kept(trace) == [[0, 0], [2, 0], [2, 1]]
+
+
+def test_full_buffer_drops_the_oldest_points():
+    trace = FlightTrace(capacity=3)
+    for point in zigzag(7):
+        trace.push(point)
+    assert kept(trace) == [[4, 0], [5, 1], [6, 0]]
+    assert trace.size == 3
+
+
+def test_push_and_extend_give_the_same_path():
+    pushed = FlightTrace(capacity=5)
+    for point in zigzag(12):
+        pushed.push(point)
+    extended = FlightTrace(capacity=5).extend(zigzag(12))
+    assert kept(pushed) == kept(extended)
+
+
+def test_faded_pieces_stay_connected():
+    trace = FlightTrace(capacity=16, fade_tail=True, fade_segments=4).extend(zigzag(20))
+    pieces = [piece for piece in trace.pieces if len(piece.points)]
+    assert len(pieces) == 4
+    for earlier, later in zip(pieces, pieces[1:]):
+        assert np.allclose(earlier.points[-1], later.points[0])
+    assert np.allclose(pieces[0].points[0], trace.points_in_order()[0])
+    assert np.allclose(pieces[-1].points[-1], trace.points_in_order()[-1])
+
+
+def test_short_trace_leaves_extra_pieces_empty():
+    trace = FlightTrace(fade_tail=True, fade_segments=8).extend(zigzag(3))
+    assert sum(1 for piece in trace.pieces if len(piece.points)) == 2
@@ -0,0 +1,69 @@
+import itertools
+
+import pytest
+
+import render_cache
+from render_cache import RenderCache
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    """Strictly increasing time.time() so LRU order doesn't depend on timer resolution."""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(render_cache.time, "time", lambda: float(next(ticks)))
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"x" * 100)
+    return path
+
+
+def fill(cache_dir, video, keys):
+    """Store keys from an earlier run, so none of them are pinned."""
+    cache = RenderCache(cache_dir, max_bytes=10_000)
+    for key in keys:
+        cache.put(key, video)
+
+
+def test_evicts_least_recently_used_first(tmp_path, video):
+    cache_dir = tmp_path / "cache"
+    fill(cache_dir, video, ["a", "b", "c"])
+    cache = RenderCache(cache_dir, max_bytes=250)
+    assert cache.get("a") is not None  # "a" is now the most recently used
+
+    cache.evict()
+    assert sorted(cache._index) == ["a", "c"]
+    assert not (cache_dir / "b.mp4").exists()
+    assert (cache_dir / "a.mp4").exists()
+
+
+def test_entries_used_by_this_run_are_never_evicted(tmp_path, video):
+    cache_dir = tmp_path / "cache"
+    fill(cache_dir, video, ["old"])
+    cache = RenderCache(cache_dir, max_bytes=150)
+    cache.put("new1", video)
+    cache.put("new2", video)
+
+    # Over budget, but both new entries are pinned for this run
+    assert sorted(cache._index) == ["new1", "new2"]
+    assert RenderCache(cache_dir).get("new1") is not None
+
+
+def test_missing_file_is_a_miss(tmp_path, video):
+    cache_dir = tmp_path / "cache"
+    fill(cache_dir, video, ["a"])
+    (cache_dir / "a.mp4").unlink()
+    cache = RenderCache(cache_dir)
+
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert "a" not in cache._index
+
+
+def test_corrupt_index_starts_empty(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / render_cache.INDEX_FILE).write_text("{not json")
+    assert RenderCache(cache_dir)._index == {}
@@ -0,0 +1,134 @@
+import hashlib
+import socket
+import time
+
+import pytest
+
+from render_farm import DONE, FAILED, QUEUED, RUNNING, TOKEN_ENV, Coordinator, job_env, send
+
+
+@pytest.fixture
+def coordinator(tmp_path, monkeypatch):
+    monkeypatch.delenv(TOKEN_ENV, raising=False)
+    coordinator = Coordinator(port=0, artifact_dir=tmp_path / "farm", heartbeat_timeout=0.05, max_attempts=2)
+    coordinator.add_job(index=0, scene_file="intro.py", scene_class="LogoIntro", flags=[],
+                        quality_dir="1080p60", renderer="cairo")
+    coordinator.start()
+    yield coordinator
+    coordinator.stop()
+
+
+def claim(coordinator, worker):
+    return send(coordinator.address, {"op": "claim", "worker": worker})["job"]
+
+
+def upload(coordinator, worker, job_id, path, sha256=None):
+    data = path.read_bytes()
+    message = {
+        "op": "complete", "worker": worker, "job_id": job_id,
+        "sha256": sha256 or hashlib.sha256(data).hexdigest(), "size": len(data),
+    }
+    return send(coordinator.address, message, payload_path=path)
+
+
+def test_complete_stores_verified_artifact(coordinator, tmp_path):
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"frames" * 1000)
+    job = claim(coordinator, "w1")
+
+    assert upload(coordinator, "w1", job["job_id"], video) == {"ok": True}
+    stored = coordinator.jobs[job["job_id"]]
+    assert stored.status == DONE
+    assert open(stored.artifact, "rb").read() == video.read_bytes()
+    assert send(coordinator.address, {"op": "claim", "worker": "w2"}) == {"job": None, "drained": True}
+
+
+def test_checksum_mismatch_is_rejected_and_requeued(coordinator, tmp_path):
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"frames")
+    job = claim(coordinator, "w1")
+
+    reply = upload(coordinator, "w1", job["job_id"], video, sha256="0" * 64)
+    assert reply == {"ok": False, "error": "checksum mismatch"}
+    stored = coordinator.jobs[job["job_id"]]
+    assert stored.status == QUEUED
+    assert stored.artifact is None
+    assert not list((tmp_path / "farm").iterdir())
+
+
+def test_silent_worker_loses_its_job(coordinator):
+    job = claim(coordinator, "w1")
+    time.sleep(0.1)
+    coordinator.requeue_stale()
+    assert coordinator.jobs[job["job_id"]].status == QUEUED
+
+    assert claim(coordinator, "w2")["job_id"] == job["job_id"]
+    # The silent worker is told to stop, and its late failure report
+    # must not disturb the new owner
+    assert send(coordinator.address, {"op": "heartbeat", "worker": "w1", "job_id": job["job_id"]}) == {"ok": False}
+    send(coordinator.address, {"op": "fail", "worker": "w1", "job_id": job["job_id"], "error": "late"})
+    stored = coordinator.jobs[job["job_id"]]
+    assert (stored.status, stored.worker) == (RUNNING, "w2")
+
+
+def test_late_upload_from_silent_worker_is_discarded(coordinator, tmp_path):
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"frames")
+    job = claim(coordinator, "w1")
+    time.sleep(0.1)
+    coordinator.requeue_stale()
+    claim(coordinator, "w2")
+
+    reply = upload(coordinator, "w1", job["job_id"], video)
+    assert reply == {"ok": False, "error": "job is not assigned to this worker"}
+    stored = coordinator.jobs[job["job_id"]]
+    assert (stored.status, stored.worker, stored.artifact) == (RUNNING, "w2", None)
+    assert not list(tmp_path.glob("farm/*"))
+
+
+def test_upload_after_job_failed_keeps_it_failed(coordinator, tmp_path):
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"frames")
+    for worker in ("w1", "w2"):
+        job = claim(coordinator, worker)
+        time.sleep(0.1)
+        coordinator.requeue_stale()
+    assert coordinator.jobs[job["job_id"]].status == FAILED
+
+    assert upload(coordinator, "w2", job["job_id"], video)["ok"] is False
+    assert coordinator.jobs[job["job_id"]].status == FAILED
+    assert coordinator.jobs[job["job_id"]].artifact is None
+
+
+def test_job_fails_after_max_attempts(coordinator):
+    for worker in ("w1", "w2"):
+        job = claim(coordinator, worker)
+        send(coordinator.address, {"op": "fail", "worker": worker, "job_id": job["job_id"], "error": "boom"})
+
+    stored = coordinator.jobs[job["job_id"]]
+    assert stored.status == FAILED
+    assert stored.attempts == 2
+    assert [error.split(":")[0] for error in stored.errors] == ["w1", "w2"]
+    assert send(coordinator.address, {"op": "claim", "worker": "w3"}) == {"job": None, "drained": True}
+
+    finished = []
+    coordinator.wait(on_finished=finished.append, poll=0.01)
+    assert finished == [stored]
+
+
+@pytest.mark.parametrize("line", [b'{"op": "claim"}\n', b'{"op": "complete", "worker": "w1"}\n', b"[1]\n", b"garbage\n"])
+def test_malformed_request_gets_an_error_reply(coordinator, line):
+    with socket.create_connection(coordinator.address, timeout=5) as sock:
+        sock.sendall(line)
+        reply = sock.makefile("rb").readline()
+    assert b'"ok": false' in reply
+    assert coordinator.jobs[1].status == QUEUED
+
+
+def test_job_env_takes_only_allowed_keys():
+    worker_env = {"PATH": "/bin", "FILM_DIRTY_TILES": "1"}
+    job = {"env": {"FILM_DETAIL": 0.5, "LD_PRELOAD": "evil.so"}}
+
+    env = job_env(job, worker_env, ("FILM_DETAIL", "FILM_DIRTY_TILES"))
+    assert env == {"PATH": "/bin", "FILM_DETAIL": "0.5"}
+    assert worker_env == {"PATH": "/bin", "FILM_DIRTY_TILES": "1"}
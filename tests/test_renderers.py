@@ -0,0 +1,30 @@
+import pytest
+
+from renderers import VERIFIED_SCENES, parse_scene_renderers
+
+SCENES = ["LogoIntro", "StarshipBuild"]
+
+
+def test_default_renderer_for_every_scene():
+    assert parse_scene_renderers(SCENES, []) == {"LogoIntro": "cairo", "StarshipBuild": "cairo"}
+
+
+def test_override_one_scene():
+    renderers = parse_scene_renderers(SCENES, ["StarshipBuild=opengl"], allow_unverified=True)
+    assert renderers == {"LogoIntro": "cairo", "StarshipBuild": "opengl"}
+
+
+@pytest.mark.parametrize("override", ["StarshipBuild", "StarshipBuild=vulkan", "=opengl"])
+def test_malformed_overrides(override):
+    with pytest.raises(ValueError, match="Expected SceneClass="):
+        parse_scene_renderers(SCENES, [override], allow_unverified=True)
+
+
+def test_unverified_scenes_are_refused(monkeypatch):
+    monkeypatch.setitem(VERIFIED_SCENES, "opengl", frozenset({"LogoIntro"}))
+    with pytest.raises(ValueError, match="StarshipBuild=opengl") as error:
+        parse_scene_renderers(SCENES, [], default="opengl")
+    assert "LogoIntro" not in str(error.value)
+    assert parse_scene_renderers(SCENES, ["StarshipBuild=cairo"], default="opengl") == {
+        "LogoIntro": "opengl", "StarshipBuild": "cairo",
+    }
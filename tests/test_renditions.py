@@ -0,0 +1,46 @@
+import pytest
+
+from render_profiles import PROFILES, RenderProfile
+from renditions import LADDER, master_profile, parse_renditions
+
+
+def test_parse_renditions_sorts_largest_first_and_resolves_aliases():
+    renditions = parse_renditions("720p, 4K,fhd")
+    assert [r.name for r in renditions] == ["2160p", "1080p", "720p"]
+
+
+def test_duplicate_renditions_are_delivered_once():
+    assert [r.name for r in parse_renditions("hd,720p,")] == ["720p"]
+
+
+def test_bitrate_override_scales_the_ladder_rung():
+    (rendition,) = parse_renditions("720p:2000k")
+    assert (rendition.bitrate, rendition.maxrate, rendition.bufsize) == ("2000k", "2500k", "4000k")
+    assert LADDER["720p"].bitrate == "4000k"
+
+
+@pytest.mark.parametrize("spec", ["480p", "", " , "])
+def test_parse_renditions_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        parse_renditions(spec)
+
+
+def test_master_profile_covers_the_largest_rendition():
+    assert master_profile(parse_renditions("4k,1080p"), PROFILES).name == "final-4k"
+    # Smallest full-detail profile that covers 1080p, never the draft proxies
+    assert master_profile(parse_renditions("1080p,720p"), PROFILES).name == "final"
+    assert master_profile(parse_renditions("720p"), PROFILES).name == "final"
+
+
+def test_master_profile_prefers_detail_and_frame_rate_over_size():
+    profiles = {
+        "big-draft": RenderProfile("big-draft", 3840, 2160, 30, detail=0.5, bitrate="1k"),
+        "fast": RenderProfile("fast", 1920, 1080, 30, detail=1.0, bitrate="1k"),
+        "smooth": RenderProfile("smooth", 3840, 2160, 60, detail=1.0, bitrate="1k"),
+    }
+    assert master_profile(parse_renditions("720p"), profiles).name == "smooth"
+
+
+def test_master_profile_without_a_covering_profile():
+    with pytest.raises(ValueError, match="No render profile covers 3840x2160"):
+        master_profile(parse_renditions("4k"), {"final": PROFILES["final"]})
@@ -0,0 +1,68 @@
+import subprocess
+
+import pytest
+
+from sharding import animation_range_flags, split_ranges
+
+
+def covered(ranges, count):
+    """Animation indices each range renders, with None as "to the end"."""
+    return [list(range(start, count if end is None else end + 1)) for start, end in ranges]
+
+
+@pytest.mark.parametrize("durations, shards, expected", [
+    ([1, 1, 1, 1], 2, [(0, 1), (2, None)]),
+    ([1, 2, 3], 1, [(0, None)]),
+    # More shards than animations
+    ([1, 1, 1], 5, [(0, 1), (2, None)]),
+    ([1, 1, 1, 1, 1, 1], 3, [(0, 1), (2, 3), (4, None)]),
+])
+def test_split_ranges(durations, shards, expected):
+    assert split_ranges(durations, shards) == expected
+
+
+@pytest.mark.parametrize("durations, shards, expected", [
+    # A long first animation would make the first range (0, 0), which Manim
+    # reads as "-n 0": no upper bound. It is merged into the next range.
+    ([10, 1, 1], 3, [(0, 1), (2, None)]),
+    ([5, 1, 1, 1, 1, 1], 3, [(0, 2), (3, None)]),
+    ([10, 1], 2, [(0, None)]),
+])
+def test_first_range_never_ends_at_zero(durations, shards, expected):
+    assert split_ranges(durations, shards) == expected
+
+
+@pytest.mark.parametrize("shards", range(1, 8))
+def test_ranges_cover_every_animation_once(shards):
+    durations = [3.0, 0.5, 0.5, 8.0, 1.0, 1.0, 2.0]
+    ranges = split_ranges(durations, shards)
+    assert sum(covered(ranges, len(durations)), []) == list(range(len(durations)))
+    assert len(ranges) <= shards
+    assert ranges[0][1] != 0
+
+
+def test_animation_range_flags():
+    assert animation_range_flags((0, 3)) == ["-n", "0,3"]
+    assert animation_range_flags((4, None)) == ["-n", "4"]
+
+
+def test_failed_stitch_is_reported_as_a_scene_failure(monkeypatch, tmp_path):
+    pytest.importorskip("moviepy")
+    import main
+
+    def broken_stitch(videos, output_path):
+        raise subprocess.CalledProcessError(1, ["ffmpeg"], stderr="Invalid data found when processing input")
+
+    monkeypatch.setattr(main, "stitch_shards", broken_stitch)
+    reported, results = [], {}
+    profile = main.PROFILES[main.DEFAULT_PROFILE]
+    shard_videos = {0: [tmp_path / "0.mp4", tmp_path / "1.mp4"], 1: [tmp_path / "2.mp4"]}
+    failed = {1}
+
+    main.stitch_sharded_scenes(
+        shard_videos, failed, tmp_path, profile, results, lambda *result: reported.append(result)
+    )
+
+    assert results == {}
+    assert failed == {0, 1}
+    assert reported == [(0, None, "Invalid data found when processing input")]
@@ -0,0 +1,52 @@
+import pytest
+
+from transitions import Transition, parse_transition, plan_cuts
+
+KEYFRAMES_EVERY_SECOND = [0.0, 1.0, 2.0, 3.0]
+
+
+def test_parse_transition():
+    assert parse_transition("crossfade") == Transition("crossfade", 0.5)
+    assert parse_transition("fadeblack:1.25") == Transition("fadeblack", 1.25)
+    assert parse_transition("none") is None
+    assert parse_transition("cut") is None
+
+
+@pytest.mark.parametrize("spec", ["wipe", "crossfade:0", "crossfade:-1"])
+def test_parse_transition_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        parse_transition(spec)
+
+
+def test_hard_cuts_copy_everything():
+    cuts = plan_cuts([4.0, 4.0], [KEYFRAMES_EVERY_SECOND] * 2, [None])
+    assert cuts == [(0.0, 4.0), (0.0, 4.0)]
+
+
+def test_window_snaps_to_keyframes_around_the_cut():
+    # Tail starts at the last keyframe leaving room for the blend; head ends
+    # at the first keyframe after it
+    cuts = plan_cuts([4.0, 4.0], [KEYFRAMES_EVERY_SECOND] * 2, [Transition("crossfade", 0.5)])
+    assert cuts == [(0.0, 3.0), (1.0, 4.0)]
+
+
+def test_middle_scene_with_transitions_on_both_sides():
+    transitions = [Transition("crossfade", 0.5), Transition("fadeblack", 1.5)]
+    cuts = plan_cuts([4.0, 4.0, 4.0], [KEYFRAMES_EVERY_SECOND] * 3, transitions)
+    assert cuts == [(0.0, 3.0), (1.0, 2.0), (2.0, 4.0)]
+
+
+def test_sparse_keyframes_re_encode_the_whole_tail():
+    cuts = plan_cuts([4.0, 4.0], [[0.0], KEYFRAMES_EVERY_SECOND], [Transition("crossfade", 0.5)])
+    assert cuts[0] == (0.0, 0.0)
+
+
+def test_scene_shorter_than_incoming_transition():
+    with pytest.raises(ValueError, match="shorter than its incoming"):
+        plan_cuts([4.0, 0.3], [KEYFRAMES_EVERY_SECOND, [0.0]], [Transition("crossfade", 0.5)])
+
+
+def test_scene_too_short_for_both_transitions():
+    transitions = [Transition("crossfade", 1.0), Transition("crossfade", 1.5)]
+    with pytest.raises(ValueError, match="too short"):
+        plan_cuts([4.0, 2.0, 4.0], [KEYFRAMES_EVERY_SECOND, [0.0, 1.5], KEYFRAMES_EVERY_SECOND], transitions)
@@ -0,0 +1,172 @@
+"""
+Physically based trajectories sampled into per-frame lookup tables.
+
+Paths are computed once with vectorized NumPy and sampled at the output
+frame rate. Scenes drive both the rocket's position and its HUD readouts
+from the same table row, so the numbers always agree with the motion and
+each frame is an O(1) lookup.
+"""
+import numpy as np
+
+# Earth
+MU_EARTH = 398600.4418  # km^3/s^2
+R_EARTH = 6371.0  # km
+
+# Mars / Starship landing
+G_MARS = 3.721  # m/s^2
+G0 = 9.80665  # m/s^2, for specific impulse
+ISP_SEA_LEVEL = 350.0  # s
+DRY_MASS_T = 120.0
+HEADER_TANK_T = 40.0  # landing propellant capacity
+
+
+class TrajectoryTable:
+    """Samples of a trajectory at evenly spaced animation alphas.
+
+    positions is (n, 3) in scene units; every other keyword becomes a
+    per-sample channel array (e.g. table.altitude_km).
+    """
+
+    def __init__(self, t, positions, **channels):
+        self.t = np.asarray(t, dtype=float)
+        self.positions = np.asarray(positions, dtype=float)
+        self.channels = list(channels)
+        for name, values in channels.items():
+            setattr(self, name, np.asarray(values))
+
+    def __len__(self):
+        return len(self.t)
+
+    def index(self, alpha: float) -> int:
+        """Row for animation alpha in [0, 1]; exact for frame-aligned alphas."""
+        return int(np.clip(round(alpha * (len(self.t) - 1)), 0, len(self.t) - 1))
+
+    def position(self, alpha: float) -> np.ndarray:
+        return self.positions[self.index(alpha)]
+
+
+def sample_count(run_time: float, fps: float) -> int:
+    """One sample per output frame, plus the end point."""
+    return max(2, int(round(run_time * fps)) + 1)
+
+
+def _solve_kepler(mean_anomaly, e, iterations=8):
+    """Eccentric anomaly for an array of (unwrapped) mean anomalies."""
+    E = mean_anomaly + e * np.sin(mean_anomaly)
+    for _ in range(iterations):
+        E = E - (E - e * np.sin(E) - mean_anomaly) / (1 - e * np.cos(E))
+    return E
+
+
+def _true_to_eccentric(nu, e):
+    beta = e / (1 + np.sqrt(1 - e ** 2))
+    return nu - 2 * np.arctan2(beta * np.sin(nu), 1 + beta * np.cos(nu))
+
+
+def _eccentric_to_true(E, e):
+    beta = e / (1 + np.sqrt(1 - e ** 2))
+    return E + 2 * np.arctan2(beta * np.sin(E), 1 - beta * np.cos(E))
+
+
+def kepler_orbit_table(
+    center,
+    earth_radius_units: float,
+    start_angle: float,
+    nu_start: float,
+    nu_end: float,
+    run_time: float,
+    fps: float,
+    perigee_km: float = 500.0,
+    apogee_km: float = 580.0,
+    units_per_km: float = 1.0 / 500.0,
+    mission_t0: float = 0.0,
+):
+    """Keplerian orbit leg from true anomaly nu_start to nu_end (radians).
+
+    The perigee sits at start_angle on screen. Altitude is drawn with an
+    exaggerated scale (units_per_km) so the orbit clears Earth visibly; the
+    timing, altitude and speed channels are the real orbital values.
+    Channels: altitude_km, velocity_kms, mission_t (seconds).
+    """
+    r_p = R_EARTH + perigee_km
+    r_a = R_EARTH + apogee_km
+    a = (r_p + r_a) / 2
+    e = (r_a - r_p) / (r_a + r_p)
+    mean_motion = np.sqrt(MU_EARTH / a ** 3)
+
+    E0, E1 = _true_to_eccentric(np.array([nu_start, nu_end]), e)
+    M0, M1 = E0 - e * np.sin(E0), E1 - e * np.sin(E1)
+    t = np.linspace(0.0, (M1 - M0) / mean_motion, sample_count(run_time, fps))
+
+    E = _solve_kepler(M0 + mean_motion * t, e)
+    nu = _eccentric_to_true(E, e)
+    r = a * (1 - e * np.cos(E))
+    altitude = r - R_EARTH
+    speed = np.sqrt(MU_EARTH * (2 / r - 1 / a))
+
+    theta = start_angle + nu
+    r_scene = earth_radius_units + altitude * units_per_km
+    positions = np.asarray(center, dtype=float) + np.column_stack(
+        [r_scene * np.cos(theta), r_scene * np.sin(theta), np.zeros_like(theta)]
+    )
+    return TrajectoryTable(
+        t, positions,
+        altitude_km=altitude,
+        velocity_kms=speed,
+        mission_t=mission_t0 + t,
+    )
+
+
+def powered_descent_table(
+    start,
+    end,
+    run_time: float,
+    fps: float,
+    altitude_m: float = 1200.0,
+    descent_rate: float = 45.0,
+    coast_s: float = 8.0,
+    fuel_fraction: float = 0.23,
+):
+    """Coast then constant-deceleration landing burn on Mars.
+
+    The ship falls under Mars gravity for coast_s seconds, then burns at the
+    constant deceleration that brings it to rest exactly at the surface.
+    Propellant use follows the rocket equation. Screen position moves from
+    start to end in proportion to altitude.
+    Channels: altitude_m, velocity_ms, fuel_pct, thrust (bool).
+    """
+    # Coast phase end state
+    v_ignition = descent_rate + G_MARS * coast_s
+    h_ignition = altitude_m - descent_rate * coast_s - 0.5 * G_MARS * coast_s ** 2
+    decel = v_ignition ** 2 / (2 * h_ignition)
+    burn_s = v_ignition / decel
+
+    t = np.linspace(0.0, coast_s + burn_s, sample_count(run_time, fps))
+    burning = t > coast_s
+    tc = np.clip(t, None, coast_s)
+    tb = np.clip(t - coast_s, 0, None)
+
+    altitude = np.where(
+        burning,
+        h_ignition - v_ignition * tb + 0.5 * decel * tb ** 2,
+        altitude_m - descent_rate * tc - 0.5 * G_MARS * tc ** 2,
+    )
+    velocity = np.where(burning, v_ignition - decel * tb, descent_rate + G_MARS * tc)
+    altitude = np.clip(altitude, 0, None)
+    velocity = np.clip(velocity, 0, None)
+
+    # Rocket equation: thrust acceleration is gravity plus the braking decel
+    initial_mass = DRY_MASS_T + fuel_fraction * HEADER_TANK_T
+    mass = initial_mass * np.exp(-(G_MARS + decel) * tb / (ISP_SEA_LEVEL * G0))
+    fuel_pct = 100.0 * (mass - DRY_MASS_T) / HEADER_TANK_T
+
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    positions = end + (altitude / altitude_m)[:, None] * (start - end)
+    return TrajectoryTable(
+        t, positions,
+        altitude_m=altitude,
+        velocity_ms=velocity,
+        fuel_pct=fuel_pct,
+        thrust=burning,
+    )
@@ -0,0 +1,143 @@
+"""
+Scene transitions that only re-encode the overlap around each cut.
+
+For a transition of d seconds between scenes A and B, the window that gets
+decoded runs from the last keyframe of A at least d before its end to the
+first keyframe of B at least d after its start. That window is blended with
+FFmpeg's xfade filter and encoded with A/B's stream parameters. Everything
+between windows is copied at the bitstream level, and the pieces are joined
+with the concat demuxer.
+"""
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+from chunked_encode import keyframe_times, video_duration
+from film_assembly import concat_copy, ffmpeg_exe, match_streams, matching_encode_args, probe_video
+
+# Transition name -> FFmpeg xfade transition
+TRANSITION_KINDS = {
+    "crossfade": "fade",
+    "fadeblack": "fadeblack",
+}
+
+
+@dataclass(frozen=True)
+class Transition:
+    kind: str
+    duration: float
+
+    def __post_init__(self):
+        if self.kind not in TRANSITION_KINDS:
+            raise ValueError(f"Unknown transition {self.kind!r}; choose from {', '.join(TRANSITION_KINDS)}")
+        if self.duration <= 0:
+            raise ValueError("Transition duration must be positive")
+
+
+def parse_transition(spec):
+    """Transition from "kind[:seconds]" (default 0.5s); None for "none"/"cut"."""
+    kind, _, seconds = spec.partition(":")
+    if kind in ("none", "cut"):
+        return None
+    return Transition(kind, float(seconds) if seconds else 0.5)
+
+
+def copy_segment(video_path, start, frames, fps, output_path):
+    """Copy `frames` frames of video_path starting at keyframe `start`, without decoding."""
+    cmd = [
+        ffmpeg_exe(), "-y", "-v", "error",
+        # Stream-copy seeking snaps back to the keyframe at or before the seek point
+        "-ss", f"{start + 0.5 / fps:.6f}", "-i", str(video_path),
+        "-map", "0:v:0", "-c", "copy",
+        "-frames:v", str(frames),
+        "-avoid_negative_ts", "make_zero",
+        str(output_path),
+    ]
+    subprocess.run(cmd, check=True, capture_output=True, text=True)
+    return Path(output_path)
+
+
+def encode_window(video_a, tail_start, tail_len, video_b, head_len, transition, fps, reference, output_path):
+    """Decode A's tail and B's head, blend them and encode to match reference."""
+    offset = tail_len - transition.duration
+    prep = f"fps={reference['r_frame_rate']},settb=AVTB,format={reference['pix_fmt']}"
+    graph = (
+        f"[0:v]{prep}[a];[1:v]{prep}[b];"
+        f"[a][b]xfade=transition={TRANSITION_KINDS[transition.kind]}"
+        f":duration={transition.duration:.6f}:offset={offset:.6f}[v]"
+    )
+    cmd = [
+        ffmpeg_exe(), "-y", "-v", "error",
+        "-ss", f"{max(tail_start - 0.5 / fps, 0.0):.6f}", "-i", str(video_a),
+        "-t", f"{head_len - 0.5 / fps:.6f}", "-i", str(video_b),
+        "-filter_complex", graph, "-map", "[v]",
+        "-frames:v", str(round((tail_len + head_len - transition.duration) * fps)),
+        *matching_encode_args(reference),
+        str(output_path),
+    ]
+    subprocess.run(cmd, check=True, capture_output=True, text=True)
+    return Path(output_path)
+
+
+def plan_cuts(durations, keyframes, transitions):
+    """(head_end, tail_start) per scene: the copyable body is [head_end, tail_start).
+
+    transitions[i] is the transition between scene i and i + 1 (None for a
+    hard cut). Raises ValueError if a scene is too short for its transitions.
+    """
+    cuts = []
+    for i, (duration, frames) in enumerate(zip(durations, keyframes)):
+        incoming = transitions[i - 1] if i > 0 else None
+        outgoing = transitions[i] if i < len(transitions) else None
+        head_end = 0.0
+        if incoming:
+            head_end = min((k for k in frames if k >= incoming.duration), default=duration)
+            if head_end < incoming.duration:
+                raise ValueError(f"Scene {i} is shorter than its incoming transition")
+        tail_start = duration
+        if outgoing:
+            latest = duration - outgoing.duration
+            if latest < head_end:
+                raise ValueError(f"Scene {i} is too short for its transitions")
+            tail_start = max((k for k in frames if head_end <= k <= latest), default=head_end)
+        cuts.append((head_end, tail_start))
+    return cuts
+
+
+def assemble_with_transitions(video_paths, transitions, output_path, work_dir=None):
+    """Join scene videos with transitions, re-encoding only the overlap windows.
+
+    Returns (windows encoded, seconds of video encoded).
+    """
+    work_dir = Path(work_dir or Path(output_path).parent / "transitions")
+    parts, _, reference = match_streams(video_paths, work_dir)
+    num, den = (int(x) for x in reference["r_frame_rate"].split("/"))
+    fps = num / den
+
+    durations = [video_duration(probe_video(path)) for path in parts]
+    keyframes = [keyframe_times(path) for path in parts]
+    cuts = plan_cuts(durations, keyframes, transitions)
+
+    segments = []
+    encoded_seconds = 0.0
+    windows = 0
+    for i, (path, duration, (head_end, tail_start)) in enumerate(zip(parts, durations, cuts)):
+        if head_end == 0 and tail_start == duration:
+            segments.append(path)
+        elif tail_start > head_end:
+            body = work_dir / f"body_{i:02d}.mp4"
+            segments.append(copy_segment(path, head_end, round((tail_start - head_end) * fps), fps, body))
+
+        transition = transitions[i] if i < len(transitions) else None
+        if transition:
+            tail_len = duration - tail_start
+            head_len = cuts[i + 1][0]
+            window = work_dir / f"window_{i:02d}.mp4"
+            segments.append(encode_window(
+                path, tail_start, tail_len, parts[i + 1], head_len, transition, fps, reference, window
+            ))
+            encoded_seconds += tail_len + head_len - transition.duration
+            windows += 1
+
+    concat_copy(segments, output_path)
+    return windows, encoded_seconds
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Watch mode: rebuild the film whenever a scene or one of its inputs changes.
+
+Polls every scene module in SCENES, the local modules they import and
+everything under assets/. After an edit it reruns the pipeline. The render
+cache serves every untouched scene, so only the scenes that depend on the
+changed file are re-rendered, and Manim's partial-movie cache narrows that
+to the edited animations. The film is then re-spliced with a stream copy.
+
+    python watch.py --profile draft            # any main.py options work
+    python watch.py --interval 1.0 -j 4
+"""
+import argparse
+import time
+from pathlib import Path
+
+import main as pipeline
+from render_cache import scene_dependencies
+
+ASSETS_DIR = Path("assets")
+
+
+def scene_inputs(scenes):
+    """{scene_class: set of files whose change affects that scene}."""
+    return {
+        scene_class: set(scene_dependencies(scene_file))
+        for scene_file, scene_class in scenes
+        if Path(scene_file).exists()
+    }
+
+
+def snapshot(paths):
+    """{path: modification time} for the paths that exist."""
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            pass
+    return mtimes
+
+
+def watched_files(scenes):
+    files = set().union(*scene_inputs(scenes).values()) if scenes else set()
+    if ASSETS_DIR.is_dir():
+        # New assets count too, before any scene references them
+        files |= {path.resolve() for path in ASSETS_DIR.rglob("*") if path.is_file()}
+    files |= {Path(scene_file).resolve() for scene_file, _ in scenes}
+    return files
+
+
+def changed_files(before, after):
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def build(pipeline_args):
+    """Run the pipeline once; returns True if it produced the film."""
+    try:
+        pipeline.main(pipeline_args)
+    except SystemExit as e:
+        return not e.code
+    return True
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Re-render edited scenes and re-splice the film on every change. "
+                    "Other options are passed to main.py.",
+    )
+    parser.add_argument("--interval", type=float, default=0.5,
+                        help="Seconds between checks for changes (default: 0.5).")
+    return parser.parse_known_args(argv)
+
+
+def main(argv=None):
+    args, pipeline_args = parse_args(argv)
+    # The watcher shows the film, not a player per scene
+    pipeline_args = ["--no-preview", *pipeline_args]
+
+    print("👀 Initial build")
+    build(pipeline_args)
+    mtimes = snapshot(watched_files(pipeline.SCENES))
+    print(f"\n👀 Watching {len(mtimes)} files (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(args.interval)
+            current = snapshot(watched_files(pipeline.SCENES))
+            changed = changed_files(mtimes, current)
+            if not changed:
+                continue
+            # Let editors finish writing (save-as-rename, formatters) before building
+            time.sleep(args.interval)
+            current = snapshot(watched_files(pipeline.SCENES))
+            changed |= changed_files(mtimes, current)
+            mtimes = current
+
+            inputs = scene_inputs(pipeline.SCENES)
+            affected = [scene_class for scene_class, files in inputs.items() if files & changed]
+            names = ", ".join(sorted(path.name for path in changed))
+            print(f"\n✏️  Changed: {names}")
+            print(f"🎯 Affected scenes: {', '.join(affected) or 'none'}")
+            if not affected:
+                continue
+            start = time.perf_counter()
+            ok = build(pipeline_args)
+            status = "✅ Film updated" if ok else "❌ Build failed; fix the scene and save again"
+            print(f"{status} in {time.perf_counter() - start:.1f}s")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+
+if __name__ == "__main__":
+    main()